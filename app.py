@@ -1,69 +1,538 @@
-from flask import Flask, render_template, request, jsonify
-from tripple_b_gt import Player, ExtensiveForm, StrategicForm
-import sympy
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from flask import Flask, Response, g, render_template, request, jsonify
+from batch_solver import (parse_game_spec, game_spec_key, solve_game_spec, solve_batch, sweep_game_spec, build_game,
+                          solve_extensive_form, robustness_game_spec, equilibrium_map_game_spec, columnar_response,
+                          strategic_form_cells, METHODS)
+from game_session import GameSession
+from game_store import GameStore
+from http_cache import result_etag, etag_matches, choose_encoding, compress
+from instrumentation import SolverMetrics, collect_timings, count, stage
+from job_queue import JobQueue, QueueFull
+from result_cache import ResultCache
+from tripple_b_gt import LinearIntervalSolver
 
 app = Flask(__name__)
 
+# Solved results keyed by the canonical game hash
+# RESULT_CACHE_SIZE: max entries in memory, RESULT_CACHE_TTL: seconds (unset = no expiry),
+# RESULT_CACHE_DIR: optional directory for the on-disk tier
+result_cache = ResultCache(
+    max_size=int(os.environ.get('RESULT_CACHE_SIZE', 256)),
+    ttl=float(os.environ['RESULT_CACHE_TTL']) if os.environ.get('RESULT_CACHE_TTL') else None,
+    directory=os.environ.get('RESULT_CACHE_DIR') or None
+)
+
+# Prometheus metrics served at /metrics; METRICS=0 turns off collection
+# (/calculate still reports timings when a request asks for them)
+METRICS_ENABLED = os.environ.get('METRICS', '1') != '0'
+metrics = SolverMetrics()
+
+# Live game sessions for incremental edits, evicted LRU / after SESSION_TTL seconds idle
+sessions = ResultCache(
+    max_size=int(os.environ.get('SESSION_LIMIT', 64)),
+    ttl=float(os.environ.get('SESSION_TTL', 3600))
+)
+
+# Worker processes for /calculate/batch
+# BATCH_WORKERS: process count (default: all cores, 1 = solve serially in the request thread),
+# BATCH_CHUNKSIZE: specs handed to a worker at a time
+BATCH_WORKERS = int(os.environ['BATCH_WORKERS']) if os.environ.get('BATCH_WORKERS') else None
+BATCH_CHUNKSIZE = int(os.environ.get('BATCH_CHUNKSIZE', 1))
+_batch_executor = None
+_batch_executor_lock = threading.Lock()
+
+# Worker processes for the Nash cell search of large /calculate and /games
+# solves (default 1 = serial; 0 = all cores). Games under
+# tripple_b_gt.PARALLEL_MIN_CELLS cells are always solved serially.
+NASH_WORKERS = int(os.environ.get('NASH_WORKERS', 1)) or None
+
+def cache_job_result(job):
+    # Only solves are cached; a robustness job's result is not a /calculate response
+    if job.robustness is None:
+        result_cache.put(game_spec_key(job.game), job.result)
+
+# Background solves for /jobs and large /robustness runs
+# JOB_WORKERS: jobs running at once, JOB_TIME_LIMIT: seconds per job (unset = none),
+# JOB_MEMORY_LIMIT: megabytes of address space per job (unset = none),
+# JOB_QUEUE_LIMIT: max jobs waiting to start. Job processes are started from
+# a fork server (spawned where there is none), never forked directly from this
+# multi-threaded server, where a lock held by another thread would deadlock them
+JOB_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+job_queue = JobQueue(
+    max_workers=int(os.environ.get('JOB_WORKERS', 2)),
+    time_limit=float(os.environ['JOB_TIME_LIMIT']) if os.environ.get('JOB_TIME_LIMIT') else None,
+    memory_limit=int(float(os.environ['JOB_MEMORY_LIMIT']) * 2**20) if os.environ.get('JOB_MEMORY_LIMIT') else None,
+    max_pending=int(os.environ.get('JOB_QUEUE_LIMIT', 100)),
+    on_done=cache_job_result,
+    start_method=JOB_START_METHOD
+)
+
+# Responses (JSON and text) of at least COMPRESS_MIN_SIZE bytes are gzip- or,
+# with the brotli package installed, brotli-compressed for clients accepting
+# it; COMPRESSION=0 turns this off
+COMPRESSION_ENABLED = os.environ.get('COMPRESSION', '1') != '0'
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+COMPRESS_MIMETYPES = ('application/json', 'text/plain')
+
+# Saved games for /games, in GAME_STORE_DIR (created on first use)
+GAME_STORE_DIR = os.environ.get('GAME_STORE_DIR') or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saved_games')
+_game_store = None
+
+
+def game_store():
+    global _game_store
+    if _game_store is None:
+        _game_store = GameStore(GAME_STORE_DIR)
+    return _game_store
+
+
+def batch_executor():
+    # Process pool shared by all batch requests, created on first use
+    global _batch_executor
+    if BATCH_WORKERS == 1:
+        return None
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            _batch_executor = ProcessPoolExecutor(max_workers=BATCH_WORKERS)
+        return _batch_executor
+
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
+@app.before_request
+def start_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_time(response):
+    if METRICS_ENABLED and request.endpoint not in (None, 'metrics_endpoint', 'static'):
+        metrics.observe_request(request.endpoint, time.perf_counter() - g.request_started)
+    return response
+
+@app.after_request
+def compress_response(response):
+    if (not COMPRESSION_ENABLED or response.direct_passthrough or response.is_streamed
+            or response.status_code != 200 or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None or len(body) < COMPRESS_MIN_SIZE:
+        return response
+    response.set_data(compress(body, encoding))
+    response.headers['Content-Encoding'] = encoding
+    # The compressed bytes are a different representation with their own tag
+    etag, weak = response.get_etag()
+    if etag is not None:
+        response.set_etag(f"{etag}-{encoding}", weak)
+    return response
+
+def not_modified(etag):
+    # 304 for a client whose If-None-Match already names this result, else None.
+    # Result routes answer this before solving, also for POST: the body is
+    # the query, so a matching tag means the client holds the same answer.
+    if not etag_matches(request.if_none_match, etag):
+        return None
+    count('not_modified')
+    return not_modified_response(etag)
+
+def not_modified_response(etag):
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+def tagged(response, etag, status=200):
+    # JSON response carrying etag (error responses stay untagged)
+    response = jsonify(response)
+    response.status_code = status
+    if status == 200 and etag is not None:
+        response.set_etag(etag)
+    return response
+
+def calculate_response(data, conditional=False):
+    # (response dict, HTTP status, ETag) of a /calculate request. With
+    # conditional=True a result the client already has (If-None-Match) is
+    # answered as (None, 304, ETag) before any cache lookup or solve.
+    try:
+        with stage('parse'):
+            game = parse_game_spec(data)
+    except ValueError as e:
+        return {'status': 'error', 'message': str(e)}, 400, None
+
+    try:
+        key = game_spec_key(game)
+        etag = result_etag(key, 'calculate', data.get('response_format'))
+        if conditional and etag_matches(request.if_none_match, etag):
+            count('not_modified')
+            return None, 304, etag
+        with stage('cache_lookup'):
+            response = result_cache.get(key)
+        if response is None:
+            count('cache_misses')
+            with stage('solve'):
+                response = solve_game_spec(game, workers=NASH_WORKERS)
+            result_cache.put(key, response)
+        else:
+            count('cache_hits')
+        if data.get('response_format') == 'columnar':
+            response = columnar_response(game, response)
+        return response, 200, etag
+
+    except ValueError as e:
+        # e.g. a game too large for backward induction
+        return {'status': 'error', 'message': str(e)}, 400, None
+    except Exception as e:
+        return {'status': 'error', 'message': str(e)}, 500, None
+
 @app.route('/calculate', methods=['POST'])
 def calculate():
+    # Add "timings": true to the body to get per-stage times and counters
+    # back under a 'timings' key, and "response_format": "columnar" for the
+    # equilibria as columns (see batch_solver.columnar_response).
+    # The payoffs may come as payoff_columns instead of payoff_data.
+    # Results carry an ETag of the normalized game; sending it back in
+    # If-None-Match gets a 304 without solving (not with timings, which
+    # differ on every request).
     data = request.json
-    
-    # Extract data from JSON
-    p1_name = data.get('p1_name', 'Player 1')
-    p2_name = data.get('p2_name', 'Player 2')
-    
-    nature_strategies = data.get('nature_strategies', ['stable', 'unstable'])
-    p1_strategies = data.get('p1_strategies', ['intervene', 'not intervene'])
-    p2_strategies = data.get('p2_strategies', ['relocate', 'not relocate'])
-    
-    # Payoff data structure from frontend:
-    # {
-    #   'p1': {'var_name': {'case1': val, ...}, ...},
-    #   'p2': {'var_name': {'case1': val, ...}, ...}
-    # }
-    payoff_data = data.get('payoff_data', {})
-    
-    # Payoff Functions
-    p1_payoff_function = data.get('p1_payoff_function', '')
-    p2_payoff_function = data.get('p2_payoff_function', '')
-    
-    # Nature states
-    nature = Player('nature', tuple(nature_strategies))
-    
-    # Players
-    player1 = Player(p1_name, tuple(p1_strategies))
-    player2 = Player(p2_name, tuple(p2_strategies))
-    
-    # Create Game
-    try:
-        extensive_form = ExtensiveForm(nature, player1, player2, payoff_data, p1_payoff_function, p2_payoff_function)
-        strategic_game = StrategicForm(extensive_form)
-        equilibria = strategic_game.find_nash_equilibria()
-        
-        # Format results for frontend
-        results = []
-        for eq in equilibria:
-            # Convert sympy object to string for JSON serialization
-            ro_range_str = str(eq['ro_range'])
-            
-            results.append({
-                'p1_strategy': eq[p1_name],
-                'p2_strategy': eq[p2_name],
-                'ro_range': ro_range_str
-            })
-            
-        # Also get the payoff matrix to display?
-        # matrix = strategic_game.strategic_form_payoff_function()
-        # We might want to display it, but let's start with equilibria.
-        
-        return jsonify({'status': 'success', 'equilibria': results})
-        
+    want_timings = isinstance(data, dict) and bool(data.get('timings'))
+    if not (want_timings or METRICS_ENABLED):
+        response, status, etag = calculate_response(data, conditional=True)
+    else:
+        with collect_timings() as timings:
+            response, status, etag = calculate_response(data, conditional=not want_timings)
+        if METRICS_ENABLED:
+            metrics.observe_timings(timings)
+        if want_timings and status == 200:
+            response = dict(response, timings=timings.as_dict())
+            etag = None
+
+    if status == 304:
+        return not_modified_response(etag)
+    return tagged(response, etag, status)
+
+@app.route('/calculate/batch', methods=['POST'])
+def calculate_batch():
+    # Body: {'games': [game spec, ...], 'chunksize': optional int}
+    # Results come back in input order; a bad spec only fails its own item
+    data = request.json
+    specs = data.get('games') if isinstance(data, dict) else None
+    if not isinstance(specs, list):
+        return jsonify({'status': 'error', 'message': "Expected a 'games' list"}), 400
+    chunksize = data.get('chunksize', BATCH_CHUNKSIZE)
+    if not isinstance(chunksize, int) or chunksize < 1:
+        return jsonify({'status': 'error', 'message': "chunksize must be a positive integer"}), 400
+
+    results = [None] * len(specs)
+    misses = []
+    for index, spec in enumerate(specs):
+        try:
+            game = parse_game_spec(spec)
+        except ValueError as e:
+            results[index] = {'status': 'error', 'message': str(e)}
+            continue
+        key = game_spec_key(game)
+        cached = result_cache.get(key)
+        if cached is not None:
+            results[index] = cached
+        else:
+            misses.append((index, spec, key))
+
+    executor = batch_executor() if len(misses) > 1 else None
+    solved = solve_batch([spec for _, spec, _ in misses], max_workers=1 if executor is None else None,
+                         chunksize=chunksize, executor=executor)
+    for (index, _, key), result in zip(misses, solved):
+        if result['status'] == 'success':
+            result_cache.put(key, result)
+        results[index] = result
+
+    return jsonify({'status': 'success', 'results': results})
+
+@app.route('/sweep', methods=['POST'])
+def sweep():
+    # Body: a /calculate game spec plus
+    # 'sweeps': [{'player': 'p1', 'variable': name, 'values': [...], 'cases': [...]}, ...]
+    data = request.json
+    try:
+        game = parse_game_spec(data)
+        sweeps = data.get('sweeps')
+        if not isinstance(sweeps, list) or not all(isinstance(s, dict) for s in sweeps):
+            raise ValueError("Expected a 'sweeps' list")
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    etag = result_etag(game_spec_key(game), 'sweep', sweeps)
+    try:
+        return not_modified(etag) or tagged(sweep_game_spec(game, sweeps), etag)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+@app.route('/equilibrium_map', methods=['POST'])
+def equilibrium_map():
+    # Body: a /calculate game spec. Returns the regions of ro in [0, 1] in
+    # order, each with its set of pure equilibria
+    data = request.json
+    try:
+        game = parse_game_spec(data)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    etag = result_etag(game_spec_key(game), 'equilibrium_map')
+    try:
+        return not_modified(etag) or tagged(equilibrium_map_game_spec(game), etag)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+# Largest Monte Carlo sample count accepted by /robustness
+ROBUSTNESS_MAX_SAMPLES = int(os.environ.get('ROBUSTNESS_MAX_SAMPLES', 100000))
+# Largest samples x strategic form cells /robustness runs inside the request;
+# bigger runs are queued as a background job (see /jobs)
+ROBUSTNESS_SYNC_WORK = int(os.environ.get('ROBUSTNESS_SYNC_WORK', 4000000))
+
+@app.route('/robustness', methods=['POST'])
+def robustness():
+    # Body: a /calculate game spec plus
+    # 'uncertain': [{'player': 'p2', 'variable': name, 'distribution': 'normal', 'mean': ..., 'std': ...}, ...],
+    # 'samples' (default 10000) and 'seed' (default 0). Runs of more than
+    # ROBUSTNESS_SYNC_WORK samples x cells answer 202 with a job_id instead;
+    # the job's 'done' event carries the usual response.
+    data = request.json
+    try:
+        game = parse_game_spec(data)
+        uncertain = data.get('uncertain')
+        if not isinstance(uncertain, list) or not uncertain or not all(isinstance(u, dict) for u in uncertain):
+            raise ValueError("Expected a non-empty 'uncertain' list")
+        samples = data.get('samples', 10000)
+        seed = data.get('seed', 0)
+        if not isinstance(samples, int) or not 1 <= samples <= ROBUSTNESS_MAX_SAMPLES:
+            raise ValueError(f"samples must be an integer between 1 and {ROBUSTNESS_MAX_SAMPLES}")
+        if not isinstance(seed, int):
+            raise ValueError("seed must be an integer")
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    if samples * strategic_form_cells(game) > ROBUSTNESS_SYNC_WORK:
+        try:
+            job = job_queue.submit(game, robustness={'uncertain': uncertain, 'samples': samples, 'seed': seed})
+        except QueueFull as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 503
+        return jsonify({'status': 'success', 'job_id': job.id, 'job_status': job.status}), 202
+
+    etag = result_etag(game_spec_key(game), 'robustness', uncertain, samples, seed)
+    try:
+        return not_modified(etag) or tagged(robustness_game_spec(game, uncertain, samples=samples, seed=seed), etag)
+    except (ValueError, KeyError) as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+def session_response(session_id, session, changed=None):
+    import sympy
+
+    ro = sympy.symbols('ro')
+    solver = LinearIntervalSolver()
+    p1_name = session.extensive_form.player1.name
+    p2_name = session.extensive_form.player2.name
+    results = [{
+        'p1_strategy': eq[p1_name],
+        'p2_strategy': eq[p2_name],
+        'ro_range': str(solver.to_relational(solver.exact_interval(eq['ro_range']), ro))
+    } for eq in session.equilibria()]
+    response = {'status': 'success', 'session_id': session_id, 'method': 'nash', 'equilibria': results}
+    if changed is not None:
+        response['changed'] = changed
+    return jsonify(response)
+
+@app.route('/session', methods=['POST'])
+def create_session():
+    # Body: a /calculate game spec; later edits go to /session/<id>/update
+    data = request.json
+    try:
+        game = parse_game_spec(data)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    try:
+        session = GameSession(build_game(game))
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+    session_id = uuid.uuid4().hex
+    sessions.put(session_id, session)
+    return session_response(session_id, session)
+
+@app.route('/session/<session_id>/update', methods=['POST'])
+def update_session(session_id):
+    # Body: {'payoff_data': {'p1': {'var_name': {'case1': val}}, ...}} with only the edited values
+    session = sessions.get(session_id)
+    if session is None:
+        return jsonify({'status': 'error', 'message': 'Unknown or expired session'}), 404
+
+    data = request.json
+    changes = data.get('payoff_data') if isinstance(data, dict) else None
+    try:
+        parse_game_spec({'payoff_data': changes})
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    try:
+        changed = session.update(changes)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+    # Refresh the session's position and expiry
+    sessions.put(session_id, session)
+    return session_response(session_id, session, changed)
+
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    # Body: a /calculate game spec. Returns a job id right away; follow the job
+    # with GET /jobs/<id> or the event stream at GET /jobs/<id>/events
+    data = request.json
+    try:
+        game = parse_game_spec(data)
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    cached = result_cache.get(game_spec_key(game))
+    try:
+        if cached is not None:
+            job = job_queue.complete(game, cached)
+        else:
+            job = job_queue.submit(game)
+    except QueueFull as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 503
+    return jsonify({'status': 'success', 'job_id': job.id, 'job_status': job.status}), 202
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': 'Unknown job'}), 404
+    return jsonify({'status': 'success', **job.snapshot()})
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': 'Unknown job'}), 404
+    job_queue.cancel(job_id)
+    return jsonify({'status': 'success', 'job_id': job_id, 'job_status': job.status})
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    # Server-Sent Events: 'stage' and 'equilibrium' events while the job runs,
+    # then one of 'done' (data: the /calculate response), 'failed' or 'cancelled'.
+    # Reconnecting clients resume after their Last-Event-ID.
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'status': 'error', 'message': 'Unknown job'}), 404
+    try:
+        after = int(request.headers.get('Last-Event-ID', -1)) + 1
+    except ValueError:
+        # Not one of our event ids: replay from the start
+        after = 0
+
+    def stream():
+        position = after
+        while True:
+            events = job.wait_events(position, timeout=15)
+            if not events and job.status not in ('done', 'failed', 'cancelled'):
+                # Keep-alive comment for proxies
+                yield ': keep-alive\n\n'
+                continue
+            for event in events:
+                yield f"id: {event['id']}\nevent: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+            position += len(events)
+            if job.status in ('done', 'failed', 'cancelled') and position >= len(job.events):
+                return
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    return jsonify(result_cache.stats())
+
+@app.route('/games', methods=['GET'])
+def list_games():
+    return jsonify({'status': 'success', 'games': game_store().list()})
+
+@app.route('/games', methods=['POST'])
+def save_game():
+    # Body: a /calculate game spec plus 'name' (letters, digits, '-' and '_')
+    data = request.json
+    try:
+        game = parse_game_spec(data)
+        name = data.get('name')
+        header = game_store().save(name, build_game(game))
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+    header.pop('payoff_data')
+    return jsonify({'status': 'success', 'game': header})
+
+@app.route('/games/<name>', methods=['GET'])
+def load_game(name):
+    # The saved game as a /calculate spec plus its equilibria, solved from the
+    # stored arrays (?method=nash|subgame_perfect)
+    method = request.args.get('method', 'subgame_perfect')
+    if method not in METHODS:
+        return jsonify({'status': 'error', 'message': f"Unknown method: {method}"}), 400
+    try:
+        header = game_store().header(name)
+    except KeyError:
+        return jsonify({'status': 'error', 'message': 'Unknown game'}), 404
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+
+    spec = {key: header[key] for key in ('p1_name', 'p2_name', 'nature_strategies', 'p1_strategies',
+                                         'p2_strategies', 'payoff_data', 'p1_payoff_function',
+                                         'p2_payoff_function')}
+    try:
+        key = game_spec_key(dict(spec, method=method))
+        etag = result_etag(key, 'game', name)
+        cached = not_modified(etag)
+        if cached is not None:
+            return cached
+        response = result_cache.get(key)
+        if response is None:
+            extensive_form, strategic_game = game_store().load(name)
+            response = solve_extensive_form(extensive_form, method, strategic_game=strategic_game,
+                                            workers=NASH_WORKERS)
+            result_cache.put(key, response)
+    except Exception as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+    return tagged(dict(response, name=name, game=spec), etag)
+
+@app.route('/games/<name>', methods=['DELETE'])
+def delete_game(name):
+    try:
+        game_store().delete(name)
+    except KeyError:
+        return jsonify({'status': 'error', 'message': 'Unknown game'}), 404
+    except ValueError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), 400
+    return jsonify({'status': 'success', 'name': name})
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
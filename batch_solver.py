@@ -0,0 +1,344 @@
+import base64
+import binascii
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm, LinearIntervalSolver, PayoffColumns
+from result_cache import game_hash
+from http_cache import RESULT_FORMAT
+
+METHODS = ('subgame_perfect', 'nash')
+
+
+def parse_game_spec(data):
+    # Extract a game from a /calculate style JSON object, applying the defaults.
+    # Raises ValueError for specs that cannot be solved.
+    if not isinstance(data, dict):
+        raise ValueError("Game spec must be a JSON object")
+    game = {
+        'p1_name': data.get('p1_name', 'Player 1'),
+        'p2_name': data.get('p2_name', 'Player 2'),
+        'nature_strategies': data.get('nature_strategies', ['stable', 'unstable']),
+        'p1_strategies': data.get('p1_strategies', ['intervene', 'not intervene']),
+        'p2_strategies': data.get('p2_strategies', ['relocate', 'not relocate']),
+        # Payoff data structure from frontend:
+        # {
+        #   'p1': {'var_name': {'case1': val, ...}, ...},
+        #   'p2': {'var_name': {'case1': val, ...}, ...}
+        # }
+        'payoff_data': data.get('payoff_data', {}),
+        # Payoff Functions
+        'p1_payoff_function': data.get('p1_payoff_function', ''),
+        'p2_payoff_function': data.get('p2_payoff_function', ''),
+        # Solution method: backward induction (fast default) or full Nash enumeration
+        'method': data.get('method', 'subgame_perfect')
+    }
+    if game['method'] not in METHODS:
+        raise ValueError(f"Unknown method: {game['method']}")
+    for key in ('nature_strategies', 'p1_strategies', 'p2_strategies'):
+        strategies = game[key]
+        if not isinstance(strategies, list) or not all(isinstance(s, str) and s for s in strategies):
+            raise ValueError(f"{key} must be a list of non-empty strings")
+        if len(set(strategies)) != len(strategies):
+            raise ValueError(f"{key} must not repeat a strategy")
+    if len(game['nature_strategies']) < 2:
+        raise ValueError("Nature needs at least two states")
+    if not game['p1_strategies'] or not game['p2_strategies']:
+        raise ValueError("Each player needs at least one strategy")
+    if 'payoff_columns' in data:
+        # Columnar alternative to payoff_data, see decode_payoff_columns
+        if 'payoff_data' in data:
+            raise ValueError("Send either payoff_data or payoff_columns, not both")
+        num_cases = len(game['nature_strategies']) * len(game['p1_strategies']) * len(game['p2_strategies'])
+        game['payoff_data'] = decode_payoff_columns(data['payoff_columns'], num_cases)
+        return game
+    if not isinstance(game['payoff_data'], dict):
+        raise ValueError("payoff_data must be an object")
+    for player_key, player_data in game['payoff_data'].items():
+        if not isinstance(player_data, dict):
+            raise ValueError(f"payoff_data['{player_key}'] must be an object")
+        for var_name, var_data in player_data.items():
+            if not isinstance(var_data, dict):
+                raise ValueError(f"Values of payoff variable '{var_name}' must be an object")
+            for case, value in var_data.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"Payoff value for '{var_name}' in {case} must be a number")
+    return game
+
+
+def decode_payoff_columns(data, num_cases):
+    # {'p1': {'variables': [name, ...], 'values': ...}, 'p2': {...}} -> {'p1': PayoffColumns, ...}
+    # values: one list per variable with its value in case1, case2, ... (every
+    # case of the game), the same as one flat variable-major list, or with
+    # 'encoding': 'base64' that flat array as base64 little-endian float64
+    if not isinstance(data, dict):
+        raise ValueError("payoff_columns must be an object")
+    payoff_data = {}
+    for player_key, player_data in data.items():
+        if not isinstance(player_data, dict) or not isinstance(player_data.get('variables'), list):
+            raise ValueError(f"payoff_columns['{player_key}'] must have a 'variables' list")
+        names = player_data['variables']
+        if not all(isinstance(name, str) for name in names):
+            raise ValueError(f"Variable names of payoff_columns['{player_key}'] must be strings")
+        values = player_data.get('values', [])
+        encoding = player_data.get('encoding')
+        try:
+            if encoding == 'base64':
+                values = np.frombuffer(base64.b64decode(values, validate=True), dtype='<f8')
+            elif encoding is not None:
+                raise ValueError(f"Unknown encoding: {encoding}")
+            else:
+                values = np.array(values)
+                if values.size and values.dtype.kind not in 'iuf':
+                    raise TypeError
+        except (TypeError, binascii.Error):
+            raise ValueError(f"payoff_columns['{player_key}'] values must be numbers") from None
+        columns = PayoffColumns(names, values)
+        if names and columns.num_cases != num_cases:
+            raise ValueError(f"payoff_columns['{player_key}'] needs {num_cases} values per variable, "
+                             f"got {columns.num_cases}")
+        if not np.all(np.isfinite(columns.values)):
+            raise ValueError(f"payoff_columns['{player_key}'] values must be finite")
+        payoff_data[player_key] = columns
+    return payoff_data
+
+
+def strategic_form_cells(game):
+    # Number of cells in the strategic form of a parsed game, without
+    # building it: the regulator has one action per nature state, the firm
+    # one per regulator action
+    num_p1 = len(game['p1_strategies']) ** len(game['nature_strategies'])
+    num_p2 = len(game['p2_strategies']) ** len(game['p1_strategies'])
+    return num_p1 * num_p2
+
+
+def game_spec_key(game):
+    return game_hash(game['p1_name'], game['p2_name'], game['nature_strategies'],
+                     game['p1_strategies'], game['p2_strategies'], game['payoff_data'],
+                     game['p1_payoff_function'], game['p2_payoff_function'], game['method'],
+                     result_format=RESULT_FORMAT)
+
+
+def solve_game_spec(game, progress=None, workers=1):
+    # Solve a parsed game and format the equilibria for the frontend.
+    # progress, if given, is called as progress(event, data) with
+    # ('stage', name) when a stage starts and ('equilibrium', item) for each result.
+    # workers: processes for the 'nash' cell search (see iter_nash_equilibria)
+    if progress is not None:
+        progress('stage', 'build')
+    return solve_extensive_form(build_game(game), game['method'], progress, workers=workers)
+
+
+def solve_extensive_form(extensive_form, method, progress=None, strategic_game=None, workers=1):
+    # Solve an already built game, see solve_game_spec. strategic_game may
+    # carry a prebuilt strategic matrix for the 'nash' method.
+    def report(event, data):
+        if progress is not None:
+            progress(event, data)
+
+    p1_name = extensive_form.player1.name
+    p2_name = extensive_form.player2.name
+
+    results = []
+    if method == 'nash':
+        report('stage', 'strategic_form')
+        if strategic_game is None:
+            strategic_game = StrategicForm(extensive_form)
+        report('stage', 'equilibria')
+        # Iterated so progress sees each equilibrium as soon as it is found
+        for eq in strategic_game.iter_nash_equilibria(workers=workers):
+            # Convert sympy object to string for JSON serialization
+            ro_range_str = str(eq['ro_range'])
+
+            results.append({
+                'p1_strategy': eq[p1_name],
+                'p2_strategy': eq[p2_name],
+                'ro_range': ro_range_str
+            })
+            report('equilibrium', results[-1])
+    else:
+        import sympy
+
+        ro = sympy.symbols('ro')
+        solver = LinearIntervalSolver()
+        report('stage', 'equilibria')
+        for piece in extensive_form.solve_subgame_perfect():
+            # Pieces of [0, 1] without a pure equilibrium are skipped
+            if piece[p1_name] is None:
+                continue
+            results.append({
+                'p1_strategy': piece[p1_name],
+                'p2_strategy': piece[p2_name],
+                'ro_range': str(solver.to_relational(solver.exact_interval(piece['ro_range']), ro))
+            })
+            report('equilibrium', results[-1])
+
+    return {'status': 'success', 'method': method, 'equilibria': results}
+
+
+def columnar_response(game, response):
+    # A solve response with the equilibria as columns: each strategy is the
+    # list of action indices (into the player's strategies) for the labels the
+    # player observes, nature states for P1 and P1 actions for P2
+    observed = {'p1': list(dict.fromkeys(game['nature_strategies'])),
+                'p2': list(dict.fromkeys(game['p1_strategies']))}
+    actions = {key: {} for key in ('p1', 'p2')}
+    for key in ('p1', 'p2'):
+        for index, action in enumerate(game[key + '_strategies']):
+            actions[key].setdefault(action, index)
+    equilibria = response['equilibria']
+    columns = {'ro_range': [eq['ro_range'] for eq in equilibria]}
+    for key in ('p1', 'p2'):
+        columns[key + '_observed'] = observed[key]
+        columns[key + '_strategy'] = [[actions[key][eq[key + '_strategy'][label]] for label in observed[key]]
+                                      for eq in equilibria]
+    return dict(response, format='columnar', equilibria=columns)
+
+
+def build_game(game):
+    nature = Player('nature', tuple(game['nature_strategies']))
+    player1 = Player(game['p1_name'], tuple(game['p1_strategies']))
+    player2 = Player(game['p2_name'], tuple(game['p2_strategies']))
+    return ExtensiveForm(nature, player1, player2, game['payoff_data'],
+                         game['p1_payoff_function'], game['p2_payoff_function'])
+
+
+def sweep_game_spec(game, sweeps):
+    # Parameter sweep of a parsed game in a compact, JSON-ready table form:
+    # per-grid-point heatmaps plus one entry per profile that is an
+    # equilibrium somewhere on the grid (null where it is not)
+    strategic_game = StrategicForm(build_game(game))
+    sweep = strategic_game.parameter_sweep(sweeps)
+    
+    def with_nulls(values):
+        return np.where(np.isnan(values), None, values).tolist()
+    
+    p1_strats = strategic_game.pure_strategies[game['p1_name']]
+    p2_strats = strategic_game.pure_strategies[game['p2_name']]
+    grid_axes = tuple(range(len(sweep['grids'])))
+    profiles = []
+    for i, j in np.argwhere(sweep['is_equilibrium'].any(axis=grid_axes)):
+        profiles.append({
+            'p1_strategy': p1_strats[i],
+            'p2_strategy': p2_strats[j],
+            'lo': with_nulls(sweep['lo'][..., i, j]),
+            'hi': with_nulls(sweep['hi'][..., i, j])
+        })
+    
+    return {
+        'status': 'success',
+        'variables': [{'player': s['player'], 'variable': s['variable']} for s in sweeps],
+        'grids': [grid.tolist() for grid in sweep['grids']],
+        'count': sweep['count'].tolist(),
+        'coverage': sweep['coverage'].tolist(),
+        'profiles': profiles
+    }
+
+
+def interval_text(region):
+    # '0 <= ro < 0.452', 'ro = 1', ... for an equilibrium_map region
+    lo, hi = region['ro_range']
+    if lo == hi:
+        return f"ro = {lo:.6g}"
+    return "{:.6g} {} ro {} {:.6g}".format(lo, '<=' if region['lo_closed'] else '<',
+                                             '<=' if region['hi_closed'] else '<', hi)
+
+
+def equilibrium_map_game_spec(game):
+    # Phase diagram of a parsed game over ro in a JSON-ready form: the ordered
+    # regions of [0, 1] with the pure equilibria of each
+    strategic_game = StrategicForm(build_game(game))
+    p1_strats = strategic_game.pure_strategies[game['p1_name']]
+    p2_strats = strategic_game.pure_strategies[game['p2_name']]
+    regions = []
+    for region in strategic_game.equilibrium_map():
+        regions.append({
+            'ro_range': interval_text(region),
+            'lo': region['ro_range'][0],
+            'hi': region['ro_range'][1],
+            'lo_closed': region['lo_closed'],
+            'hi_closed': region['hi_closed'],
+            'equilibria': [{'p1_strategy': p1_strats[i], 'p2_strategy': p2_strats[j]} for i, j in region['cells']]
+        })
+    return {'status': 'success', 'regions': regions}
+
+
+def robustness_game_spec(game, uncertain, samples=10000, seed=0, progress=None):
+    # Monte Carlo robustness of a parsed game in a JSON-ready form: one entry
+    # per profile that is an equilibrium in some sample, most frequent first.
+    # progress is called like solve_game_spec's, with 'stage' events only.
+    if progress is not None:
+        progress('stage', 'build')
+    strategic_game = StrategicForm(build_game(game))
+    if progress is not None:
+        progress('stage', 'monte_carlo')
+    result = strategic_game.monte_carlo(uncertain, samples=samples, seed=seed)
+    quantile_names = ['%g' % (100 * q) for q in result['quantiles']]
+
+    def endpoint(name, i, j):
+        return {
+            'mean': float(result[name + '_mean'][i, j]),
+            'min': float(result[name + '_min'][i, j]),
+            'max': float(result[name + '_max'][i, j]),
+            'quantiles': dict(zip(quantile_names, result[name + '_quantiles'][:, i, j].tolist()))
+        }
+
+    p1_strats = strategic_game.pure_strategies[game['p1_name']]
+    p2_strats = strategic_game.pure_strategies[game['p2_name']]
+    frequency = result['frequency']
+    profiles = []
+    for i, j in sorted(np.argwhere(frequency > 0).tolist(), key=lambda cell: -frequency[cell[0], cell[1]]):
+        profiles.append({
+            'p1_strategy': p1_strats[i],
+            'p2_strategy': p2_strats[j],
+            'frequency': float(frequency[i, j]),
+            'lo': endpoint('lo', i, j),
+            'hi': endpoint('hi', i, j)
+        })
+
+    return {
+        'status': 'success',
+        'samples': samples,
+        'seed': seed,
+        'any_equilibrium': result['any_equilibrium'],
+        'profiles': profiles
+    }
+
+
+def solve_item(game):
+    # Worker entry point: errors are reported per item instead of raised
+    try:
+        return solve_game_spec(game)
+    except Exception as e:
+        return {'status': 'error', 'message': str(e)}
+
+
+def solve_batch(specs, max_workers=None, chunksize=1, executor=None):
+    # Solve a list of game specs in parallel and return the results in input order.
+    # Every spec is parsed up front; a spec that fails to parse or solve yields
+    # {'status': 'error', 'message': ...} at its position without failing the batch.
+    # max_workers=None uses every core, max_workers=1 solves serially in this
+    # process. An existing executor may be passed in to reuse its workers.
+    results = [None] * len(specs)
+    pending = []
+    for index, spec in enumerate(specs):
+        try:
+            pending.append((index, parse_game_spec(spec)))
+        except ValueError as e:
+            results[index] = {'status': 'error', 'message': str(e)}
+
+    games = [game for _, game in pending]
+    if executor is not None:
+        solved = executor.map(solve_item, games, chunksize=chunksize)
+    elif max_workers == 1 or len(games) <= 1:
+        solved = map(solve_item, games)
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(games))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            solved = list(pool.map(solve_item, games, chunksize=chunksize))
+
+    for (index, _), result in zip(pending, solved):
+        results[index] = result
+    return results
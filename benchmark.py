@@ -0,0 +1,188 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm
+
+# Game sizes timed by default: (nature states, P1 actions, P2 actions,
+# payoff variables per player, terms per payoff function)
+DEFAULT_CONFIGS = [
+    (2, 2, 2, 3, 1),
+    (2, 3, 2, 3, 3),
+    (2, 3, 3, 6, 3),
+    (3, 3, 3, 6, 6),
+    (2, 4, 3, 10, 10)
+]
+
+STAGES = ('build', 'payoff', 'strategies_space_function', 'strategic_form_payoff_function', 'find_nash_equilibria')
+
+
+def synthetic_function(rng, variables, terms):
+    # Random polynomial payoff function over variables with the given number
+    # of terms: scaled variables, products, squares and differences
+    parts = []
+    for _ in range(terms):
+        kind = rng.randrange(4)
+        a, b = rng.choice(variables), rng.choice(variables)
+        coefficient = rng.choice([0.5, 1, 1.5, 2, 3])
+        if kind == 0:
+            parts.append(f"{coefficient}*{a}")
+        elif kind == 1:
+            parts.append(f"{coefficient}*{a}*{b}/10")
+        elif kind == 2:
+            parts.append(f"{a}**2/20")
+        else:
+            parts.append(f"({a} - {b})/{coefficient}")
+    return ' + '.join(parts)
+
+
+def synthetic_game(seed, nature_states=2, p1_actions=2, p2_actions=2, variables=3, terms=1):
+    # Seeded random game of the given size. terms=0 uses the default payoff
+    # (sum of all variables); otherwise each player gets a random function.
+    rng = random.Random(seed)
+    nature = Player('nature', tuple(f"state{n}" for n in range(nature_states)))
+    player1 = Player('regulator', tuple(f"r{a}" for a in range(p1_actions)))
+    player2 = Player('firm', tuple(f"f{a}" for a in range(p2_actions)))
+    num_cases = nature_states * p1_actions * p2_actions
+    cases = ['case%d' % n for n in range(1, num_cases + 1)]
+
+    payoff_data = {}
+    functions = {}
+    for key in ('p1', 'p2'):
+        names = [f"{key}_v{k}" for k in range(variables)]
+        payoff_data[key] = {name: {case: round(rng.uniform(-50, 50), 2) for case in cases} for name in names}
+        functions[key] = synthetic_function(rng, names, terms) if terms else None
+    return ExtensiveForm(nature, player1, player2, payoff_data, functions['p1'], functions['p2'])
+
+
+def run_stages(config, seed):
+    # Run the pipeline once, returning {stage: seconds}
+    timings = {}
+    start = time.perf_counter()
+    extensive_form = synthetic_game(seed, *config)
+    timings['build'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for label in extensive_form.cases.labels:
+        extensive_form.payoff(label)
+    timings['payoff'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extensive_form.strategies_space_function()
+    timings['strategies_space_function'] = time.perf_counter() - start
+
+    strategic_form = StrategicForm(extensive_form)
+    start = time.perf_counter()
+    strategic_form.strategic_form_payoff_function()
+    timings['strategic_form_payoff_function'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    strategic_form.find_nash_equilibria()
+    timings['find_nash_equilibria'] = time.perf_counter() - start
+    return timings
+
+
+def peak_memory(config, seed):
+    # Peak traced allocation (bytes) of one pipeline run; separate from the
+    # timed runs because tracing slows Python down
+    tracemalloc.start()
+    try:
+        run_stages(config, seed)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(configs=DEFAULT_CONFIGS, repeat=3, seed=0):
+    # Best-of-repeat time per stage and the peak memory for every config
+    # Warm-up run so imports and first-call setup are not timed
+    run_stages(configs[0], seed)
+
+    results = []
+    for config in configs:
+        runs = [run_stages(config, seed) for _ in range(repeat)]
+        nature_states, p1_actions, p2_actions, variables, terms = config
+        results.append({
+            'name': 'n{}-a{}x{}-v{}-t{}'.format(*config),
+            'nature_states': nature_states,
+            'p1_actions': p1_actions,
+            'p2_actions': p2_actions,
+            'variables': variables,
+            'terms': terms,
+            'cells': (p1_actions ** nature_states) * (p2_actions ** p1_actions),
+            'seconds': {stage: min(run[stage] for run in runs) for stage in STAGES},
+            'peak_memory_bytes': peak_memory(config, seed)
+        })
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'seed': seed,
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold=1.5, min_seconds=0.005):
+    # Regressions of current against baseline: stages more than threshold times
+    # slower (ignoring stages under min_seconds in both) and peak memory more
+    # than threshold times higher. Configs missing from the baseline are skipped.
+    previous = {entry['name']: entry for entry in baseline['results']}
+    regressions = []
+    for entry in current['results']:
+        old = previous.get(entry['name'])
+        if old is None:
+            continue
+        for stage, seconds in entry['seconds'].items():
+            old_seconds = old['seconds'].get(stage)
+            if old_seconds is None or max(seconds, old_seconds) < min_seconds:
+                continue
+            if seconds > threshold * old_seconds:
+                regressions.append({'name': entry['name'], 'metric': stage,
+                                    'baseline': old_seconds, 'current': seconds})
+        if entry['peak_memory_bytes'] > threshold * old['peak_memory_bytes']:
+            regressions.append({'name': entry['name'], 'metric': 'peak_memory_bytes',
+                                'baseline': old['peak_memory_bytes'], 'current': entry['peak_memory_bytes']})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the solver pipeline on synthetic games.")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per config (best time is kept)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--config', action='append', default=None, metavar='N,A1,A2,V,T',
+                        help="game size: nature states, P1 actions, P2 actions, variables, terms (repeatable)")
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    parser.add_argument('--baseline', help="compare against a JSON file written by --output")
+    parser.add_argument('--threshold', type=float, default=1.5, help="slowdown factor reported as a regression")
+    args = parser.parse_args(argv)
+
+    configs = DEFAULT_CONFIGS
+    if args.config:
+        configs = [tuple(int(v) for v in config.split(',')) for config in args.config]
+
+    current = benchmark(configs, repeat=args.repeat, seed=args.seed)
+    for entry in current['results']:
+        stages = '  '.join(f"{stage}={seconds * 1000:.1f}ms" for stage, seconds in entry['seconds'].items())
+        print(f"{entry['name']:<18} cells={entry['cells']:<6} peak={entry['peak_memory_bytes'] / 2**20:.1f}MiB  {stages}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, threshold=args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['name']} {r['metric']}: {r['baseline']:.4g} -> {r['current']:.4g}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
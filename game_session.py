@@ -0,0 +1,181 @@
+import copy
+import threading
+
+import numpy as np
+
+from tripple_b_gt import (ExtensiveForm, StrategicForm, PayoffColumns, payoff_dicts, strategic_payoff_arrays,
+                          row_player_bounds, column_player_bounds, combine_bounds)
+
+
+class GameSession:
+    # A game kept in memory between edits. update() applies changed payoff
+    # values and recomputes only what depends on them:
+    #   - the compiled payoff functions for the changed cases,
+    #   - the strategic-form cells that reach those cases,
+    #   - the NE conditions comparing against those cells: the row player's
+    #     conditions in the touched columns, the column player's in the touched rows.
+    # Ro intervals are solved in floating point, like equilibrium_intervals().
+    # Edits are written into the extensive form's payoff_data in place.
+    # Cost of an edit: a changed case reaches every cell whose strategies pass
+    # through it, and the conditions of a touched column (row) are re-derived
+    # pairwise over all its rows (columns), so an edit costs
+    # O(dirty_cols * rows**2 + dirty_rows * cols**2) comparisons rather than
+    # the O(rows * cols * (rows + cols)) of a full solve; it still grows with
+    # the size of the game.
+    def __init__(self, extensive_form, tolerance=1e-9):
+        self.tolerance = tolerance
+        self._lock = threading.Lock()
+        self.rebuild(extensive_form)
+
+    def rebuild(self, extensive_form):
+        # Full computation, also used when the set of variables changes
+        self.extensive_form = extensive_form
+        self.strategic_form = StrategicForm(extensive_form)
+        if any(isinstance(player_data, PayoffColumns) for player_data in extensive_form.payoff_data.values()):
+            # Edits need the dict form
+            extensive_form.payoff_data = payoff_dicts(extensive_form.payoff_data)
+        self.payoff_data = extensive_form.payoff_data
+        cases = extensive_form.cases
+
+        self.columns = {key: extensive_form.case_payoff_columns(key) for key in ('p1', 'p2')}
+        compiled = extensive_form.compile_payoff_functions()
+        self.case_payoffs = {key: np.array(compiled[key].evaluate(self.columns[key], cases.num_cases))
+                             for key in ('p1', 'p2')}
+        # (nature_idx, p1_idx, p2_idx) of every case index
+        self.case_profiles = np.argwhere(np.ones(cases.shape, dtype=bool))[np.argsort(cases.index_table.ravel())]
+
+        self.payoff_tensor = np.array(extensive_form.payoff_tensor)
+        self.p1_indices = extensive_form.pure_strategy_indices[extensive_form.player1.name]
+        self.p2_indices = extensive_form.pure_strategy_indices[extensive_form.player2.name]
+        self.arrays = {key: np.array(value) for key, value in self.strategic_form.payoff_arrays().items()}
+
+        self.p1_bounds = [np.array(part) for part in row_player_bounds(self.arrays['p1_ro'], self.arrays['p1_const'], self.tolerance)]
+        self.p2_bounds = [np.array(part) for part in column_player_bounds(self.arrays['p2_ro'], self.arrays['p2_const'], self.tolerance)]
+        self.lo, self.hi, self.is_equilibrium = combine_bounds(self.p1_bounds, self.p2_bounds, self.tolerance)
+
+    def update(self, changes):
+        # changes: {'p1': {'var_name': {'case1': val, ...}}, 'p2': {...}}, the same
+        # shape as payoff_data but only with edited values. Players other than
+        # 'p1'/'p2' and case labels outside the game raise ValueError before
+        # anything is changed.
+        # Returns {'cases': changed case count, 'cells': recomputed cell count}
+        label_indices = self.extensive_form.cases.label_indices
+        for key, player_changes in changes.items():
+            if key not in ('p1', 'p2'):
+                raise ValueError(f"Unknown player key: {key}")
+            for var_name, var_data in player_changes.items():
+                unknown = [label for label in var_data if label not in label_indices]
+                if unknown:
+                    raise ValueError(f"Unknown cases for '{var_name}': {', '.join(unknown)}")
+
+        with self._lock:
+            new_variables = any(var_name not in self.payoff_data.get(key, {})
+                                for key, player_changes in changes.items() for var_name in player_changes)
+            if new_variables:
+                # The payoff functions have to be recompiled for the new variable set
+                payoff_data = copy.deepcopy(self.payoff_data)
+                for key, player_changes in changes.items():
+                    for var_name, var_data in player_changes.items():
+                        payoff_data.setdefault(key, {}).setdefault(var_name, {}).update(var_data)
+                form = self.extensive_form
+                self.rebuild(ExtensiveForm(form.nature, form.player1, form.player2, payoff_data,
+                                           form.p1_function, form.p2_function))
+                return {'cases': self.extensive_form.cases.num_cases, 'cells': self.lo.size}
+
+            cases = self.extensive_form.cases
+            compiled = self.extensive_form.compile_payoff_functions()
+            changed = {}
+            for key, player_changes in changes.items():
+                indices = set()
+                for var_name, var_data in player_changes.items():
+                    self.payoff_data[key][var_name].update(var_data)
+                    for label, value in var_data.items():
+                        index = cases.label_indices[label]
+                        self.columns[key][var_name][index] = value
+                        indices.add(index)
+                if not indices:
+                    continue
+                indices = np.array(sorted(indices))
+
+                # Re-evaluate the payoff function only for the edited cases
+                sub_columns = {var_name: column[indices] for var_name, column in self.columns[key].items()}
+                values = compiled[key].evaluate(sub_columns, len(indices))
+                moved = values != self.case_payoffs[key][indices]
+                if np.any(moved):
+                    self.case_payoffs[key][indices[moved]] = values[moved]
+                    changed[key] = indices[moved]
+
+            return self._propagate(changed)
+
+    def _propagate(self, changed):
+        # Push changed case payoffs through the tensor, the strategic cells
+        # and the NE conditions that depend on them
+        dirty_rows = np.zeros(self.lo.shape[0], dtype=bool)
+        dirty_cols = np.zeros(self.lo.shape[1], dtype=bool)
+        touched_cells = np.zeros(self.lo.shape, dtype=bool)
+        num_cases = 0
+
+        for key, indices in changed.items():
+            player = 0 if key == 'p1' else 1
+            for index in indices:
+                n_idx, p1_idx, p2_idx = self.case_profiles[index]
+                self.payoff_tensor[n_idx, p1_idx, p2_idx, player] = self.case_payoffs[key][index]
+                num_cases += 1
+                if n_idx > 1:
+                    # Only the first two nature states enter the strategic form
+                    continue
+                rows = self.p1_indices[:, n_idx] == p1_idx
+                cols = self.p2_indices[:, p1_idx] == p2_idx
+                touched_cells[np.ix_(rows, cols)] = True
+                # 'p1' data pays the column player (firm), 'p2' data the row player
+                if player == 0:
+                    dirty_rows |= rows
+                else:
+                    dirty_cols |= cols
+
+        rows = np.flatnonzero(touched_cells.any(axis=1))
+        cols = np.flatnonzero(touched_cells.any(axis=0))
+        if len(rows):
+            # Recompute the cells of the touched block
+            block = strategic_payoff_arrays(self.payoff_tensor, self.p1_indices[rows], self.p2_indices[cols])
+            for name, values in block.items():
+                self.arrays[name][np.ix_(rows, cols)] = np.where(touched_cells[np.ix_(rows, cols)], values,
+                                                                 self.arrays[name][np.ix_(rows, cols)])
+
+        # Re-check only the conditions involving touched cells
+        dirty_cols = np.flatnonzero(dirty_cols)
+        dirty_rows = np.flatnonzero(dirty_rows)
+        if len(dirty_cols):
+            bounds = row_player_bounds(self.arrays['p1_ro'][:, dirty_cols], self.arrays['p1_const'][:, dirty_cols], self.tolerance)
+            for part, values in zip(self.p1_bounds, bounds):
+                part[:, dirty_cols] = values
+        if len(dirty_rows):
+            bounds = column_player_bounds(self.arrays['p2_ro'][dirty_rows], self.arrays['p2_const'][dirty_rows], self.tolerance)
+            for part, values in zip(self.p2_bounds, bounds):
+                part[dirty_rows] = values
+
+        rechecked = np.zeros(self.lo.shape, dtype=bool)
+        rechecked[:, dirty_cols] = True
+        rechecked[dirty_rows] = True
+        if rechecked.any():
+            lo, hi, is_equilibrium = combine_bounds([part[rechecked] for part in self.p1_bounds],
+                                                    [part[rechecked] for part in self.p2_bounds],
+                                                    self.tolerance)
+            self.lo[rechecked] = lo
+            self.hi[rechecked] = hi
+            self.is_equilibrium[rechecked] = is_equilibrium
+
+        return {'cases': num_cases, 'cells': int(rechecked.sum())}
+
+    def equilibria(self):
+        # Current pure Nash equilibria with their (lo, hi) ro intervals
+        p1_name = self.extensive_form.player1.name
+        p2_name = self.extensive_form.player2.name
+        p1_strats = self.strategic_form.pure_strategies[p1_name]
+        p2_strats = self.strategic_form.pure_strategies[p2_name]
+        with self._lock:
+            return [{
+                p1_name: p1_strats[i],
+                p2_name: p2_strats[j],
+                'ro_range': (float(self.lo[i, j]), float(self.hi[i, j]))
+            } for i, j in np.argwhere(self.is_equilibrium)]
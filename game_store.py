@@ -0,0 +1,157 @@
+import json
+import os
+import re
+import shutil
+import time
+
+import numpy as np
+
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm, StrategicMatrix, payoff_dicts
+from result_cache import game_hash
+
+FORMAT_VERSION = 1
+
+NAME_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+
+class GameStore:
+    # Saved games, one directory each:
+    #   header.json  players, strategies, payoff data and functions, game hash,
+    #                array shapes and an index of stored results
+    #   game.npz     payoff tensor, strategy index tables and the float
+    #                strategic matrix (uncompressed)
+    #   results/     one .npy file per bulk result array, opened memory-mapped
+    # Loading a game rebuilds it from the arrays: payoff functions are not
+    # parsed and the strategic matrix is not recomputed.
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, name, *parts):
+        if not isinstance(name, str) or not NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid game name: {name!r}")
+        return os.path.join(self.directory, name, *parts)
+
+    def _write_header(self, name, header):
+        # Write then rename, so readers never see a partial header
+        path = self._path(name, 'header.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(header, f, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def save(self, name, extensive_form, strategic_game=None, metadata=None):
+        # Store a built game under name (letters, digits, '-' and '_'),
+        # replacing any game saved under the same name. Returns the header.
+        directory = self._path(name)
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.makedirs(os.path.join(directory, 'results'))
+
+        strategic_game = strategic_game or StrategicForm(extensive_form)
+        matrix = strategic_game.strategic_matrix()
+        p1, p2, nature = extensive_form.player1, extensive_form.player2, extensive_form.nature
+        arrays = {
+            'payoff_tensor': extensive_form.payoff_tensor,
+            'p1_indices': extensive_form.pure_strategy_indices[p1.name],
+            'p2_indices': extensive_form.pure_strategy_indices[p2.name],
+            **matrix.arrays()
+        }
+        np.savez(self._path(name, 'game.npz'), **arrays)
+
+        header = {
+            'format': FORMAT_VERSION,
+            'name': name,
+            'created': time.time(),
+            'game_hash': game_hash(p1.name, p2.name, nature.strategies, p1.strategies, p2.strategies,
+                                   extensive_form.payoff_data, extensive_form.p1_function,
+                                   extensive_form.p2_function),
+            'p1_name': p1.name,
+            'p2_name': p2.name,
+            'nature_strategies': list(nature.strategies),
+            'p1_strategies': list(p1.strategies),
+            'p2_strategies': list(p2.strategies),
+            'payoff_data': payoff_dicts(extensive_form.payoff_data),
+            'p1_payoff_function': extensive_form.p1_function or '',
+            'p2_payoff_function': extensive_form.p2_function or '',
+            'arrays': {key: {'shape': list(value.shape), 'dtype': str(value.dtype)} for key, value in arrays.items()},
+            'results': {},
+            'metadata': metadata or {}
+        }
+        self._write_header(name, header)
+        return header
+
+    def header(self, name):
+        try:
+            with open(self._path(name, 'header.json')) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise KeyError(name) from None
+
+    def list(self):
+        # Headers of every saved game without the bulky payoff data, newest first
+        games = []
+        for name in os.listdir(self.directory):
+            if not NAME_PATTERN.match(name):
+                continue
+            try:
+                header = self.header(name)
+            except (KeyError, ValueError):
+                continue
+            header.pop('payoff_data', None)
+            games.append(header)
+        return sorted(games, key=lambda header: header['created'], reverse=True)
+
+    def load(self, name):
+        # (ExtensiveForm, StrategicForm) of a saved game, rebuilt from its arrays
+        header = self.header(name)
+        if header.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported game format: {header.get('format')}")
+        with np.load(self._path(name, 'game.npz')) as data:
+            arrays = {key: data[key] for key in data.files}
+
+        nature = Player('nature', tuple(header['nature_strategies']))
+        player1 = Player(header['p1_name'], tuple(header['p1_strategies']))
+        player2 = Player(header['p2_name'], tuple(header['p2_strategies']))
+        extensive_form = ExtensiveForm.from_arrays(
+            nature, player1, player2, header['payoff_data'], arrays['payoff_tensor'],
+            header['p1_payoff_function'] or None, header['p2_payoff_function'] or None,
+            pure_strategy_indices={player1.name: arrays['p1_indices'], player2.name: arrays['p2_indices']}
+        )
+        matrix = StrategicMatrix(*(arrays[key] for key in StrategicMatrix.KEYS))
+        return extensive_form, StrategicForm(extensive_form, matrix=matrix)
+
+    def delete(self, name):
+        directory = self._path(name)
+        if not os.path.isdir(directory):
+            raise KeyError(name)
+        shutil.rmtree(directory)
+
+    def _result_path(self, name, key):
+        if not NAME_PATTERN.match(key):
+            raise ValueError(f"Invalid result name: {key!r}")
+        return self._path(name, 'results', key + '.npy')
+
+    def _index_result(self, name, key, array):
+        header = self.header(name)
+        header['results'][key] = {'shape': list(array.shape), 'dtype': str(array.dtype)}
+        self._write_header(name, header)
+
+    def save_result(self, name, key, array):
+        # Store a result array of a saved game (e.g. a sweep's lo / hi grids)
+        array = np.asarray(array)
+        np.save(self._result_path(name, key), array)
+        self._index_result(name, key, array)
+
+    def create_result(self, name, key, shape, dtype=float):
+        # Writable memory-mapped result array, for results too large to build
+        # in memory first; call flush() on it when done
+        self.header(name)
+        array = np.lib.format.open_memmap(self._result_path(name, key), mode='w+', dtype=dtype, shape=tuple(shape))
+        self._index_result(name, key, array)
+        return array
+
+    def load_result(self, name, key, mmap_mode='r'):
+        # Result array opened memory-mapped (mmap_mode=None reads it into memory)
+        if key not in self.header(name)['results']:
+            raise KeyError(key)
+        return np.load(self._result_path(name, key), mmap_mode=mmap_mode)
@@ -0,0 +1,53 @@
+import gzip
+import hashlib
+import json
+
+# brotli is optional; without it responses are only gzip-compressed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bump when the shape of solve responses changes, so clients holding an
+# old ETag do not get a 304 for a result that would now look different. It is
+# also part of batch_solver.game_spec_key, so the ResultCache (and its disk
+# tier) stops serving results stored in the old shape.
+RESULT_FORMAT = 2
+
+# Content codings in order of preference
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def result_etag(key, *variant):
+    # Strong ETag (unquoted) of a solve result: the game's normalized hash
+    # (batch_solver.game_spec_key) combined with everything else that shapes
+    # the response, e.g. the endpoint and its parameters
+    encoded = json.dumps([RESULT_FORMAT, key, variant], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def etag_matches(if_none_match, etag):
+    # If-None-Match (werkzeug ETags) against etag, with the weak comparison
+    # RFC 9110 prescribes; compressed responses carry etag-<coding>
+    if if_none_match is None:
+        return False
+    if if_none_match.star_tag:
+        return True
+    variants = {etag} | {f"{etag}-{encoding}" for encoding in ('br', 'gzip')}
+    return not variants.isdisjoint(if_none_match.as_set(include_weak=True))
+
+
+def choose_encoding(accept_encodings):
+    # Preferred coding the client accepts (werkzeug Accept of
+    # Accept-Encoding), or None
+    for encoding in ENCODINGS:
+        if accept_encodings[encoding] > 0:
+            return encoding
+    return None
+
+
+def compress(body, encoding):
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    # mtime=0 keeps the bytes (and so the strong ETag) reproducible
+    return gzip.compress(body, compresslevel=6, mtime=0)
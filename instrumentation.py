@@ -0,0 +1,163 @@
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Timings of the solve running in the current thread / context, or None when
+# instrumentation is off. Instrumented code only pays for one ContextVar.get()
+# per stage when it is off.
+_current = ContextVar('timings', default=None)
+
+
+class Timings:
+    # Wall time per stage (seconds, accumulated over repeated stages) and
+    # event counters for one instrumented solve
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+
+    def add_time(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_dict(self):
+        return {'stages': dict(self.stages), 'counters': dict(self.counters)}
+
+
+def current_timings():
+    return _current.get()
+
+
+@contextmanager
+def collect_timings(timings=None):
+    # Instrument everything run inside the block:
+    #     with collect_timings() as timings:
+    #         StrategicForm(game).find_nash_equilibria()
+    #     timings.as_dict()
+    timings = timings if timings is not None else Timings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def stage(name):
+    # Time the block as stage name when instrumentation is on
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_time(name, time.perf_counter() - start)
+
+
+def timed(name):
+    # Decorator form of stage()
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current.get() is None:
+                return func(*args, **kwargs)
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, amount=1):
+    timings = _current.get()
+    if timings is not None:
+        timings.count(name, amount)
+
+
+# Default histogram buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    # Cumulative Prometheus histogram with one series per label value
+    def __init__(self, name, documentation, label=None, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, label_value=None):
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = {'counts': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series['counts'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_value, series in sorted(self._series.items(), key=lambda item: str(item[0])):
+                labels = '' if self.label is None else f'{self.label}="{label_value}",'
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, series['counts']):
+                    cumulative += bucket_count
+                    lines.append(f'{self.name}_bucket{{{labels}le="{bound}"}} {cumulative}')
+                lines.append(f'{self.name}_bucket{{{labels}le="+Inf"}} {series["count"]}')
+                suffix = '' if self.label is None else f'{{{labels.rstrip(",")}}}'
+                lines.append(f"{self.name}_sum{suffix} {series['sum']}")
+                lines.append(f"{self.name}_count{suffix} {series['count']}")
+        return '\n'.join(lines)
+
+
+class Counter:
+    # Monotonic Prometheus counter with one series per label value
+    def __init__(self, name, documentation, label=None):
+        self.name = name
+        self.documentation = documentation
+        self.label = label
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, label_value=None):
+        with self._lock:
+            self._values[label_value] = self._values.get(label_value, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_value, value in sorted(self._values.items(), key=lambda item: str(item[0])):
+                labels = '' if self.label is None else f'{{{self.label}="{label_value}"}}'
+                lines.append(f"{self.name}{labels} {value}")
+        return '\n'.join(lines)
+
+
+class SolverMetrics:
+    # Aggregates per-request Timings into Prometheus metrics
+    def __init__(self, prefix='game_solver'):
+        self.request_seconds = Histogram(f'{prefix}_request_seconds', 'Wall time of solve requests.', label='endpoint')
+        self.stage_seconds = Histogram(f'{prefix}_stage_seconds', 'Wall time per solver stage.', label='stage')
+        self.events = Counter(f'{prefix}_events_total', 'Solver work counters (cells solved, expressions evaluated, ...).',
+                              label='counter')
+
+    def observe_request(self, endpoint, seconds):
+        self.request_seconds.observe(seconds, endpoint)
+
+    def observe_timings(self, timings):
+        for name, stage_seconds in timings.stages.items():
+            self.stage_seconds.observe(stage_seconds, name)
+        for name, amount in timings.counters.items():
+            self.events.inc(amount, name)
+
+    def render(self):
+        return '\n'.join(metric.render() for metric in (self.request_seconds, self.stage_seconds, self.events)) + '\n'
@@ -0,0 +1,235 @@
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from batch_solver import solve_game_spec, robustness_game_spec
+
+FINISHED = ('done', 'failed', 'cancelled')
+
+
+class QueueFull(Exception):
+    pass
+
+
+def run_job(conn, game, memory_limit, robustness=None):
+    # Child process entry point: solve the game (or, given robustness
+    # parameters, run its Monte Carlo analysis), sending every progress event
+    # and finally ('done', result) or ('error', message) through conn
+    if memory_limit:
+        try:
+            import resource
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        except (ImportError, ValueError, OSError):
+            # Not enforceable on this platform
+            pass
+    try:
+        progress = lambda event, data: conn.send((event, data))
+        if robustness is not None:
+            result = robustness_game_spec(game, progress=progress, **robustness)
+        else:
+            result = solve_game_spec(game, progress=progress)
+        conn.send(('done', result))
+    except MemoryError:
+        conn.send(('error', 'Memory limit exceeded'))
+    except Exception as e:
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+
+class Job:
+    # State of one submitted solve. events is the append-only list of
+    # {'id', 'event', 'data'} records streamed to clients; status moves
+    # queued -> running -> done / failed / cancelled. robustness holds the
+    # {'uncertain', 'samples', 'seed'} of a /robustness job, None for a solve.
+    def __init__(self, game, robustness=None):
+        self.id = uuid.uuid4().hex
+        self.game = game
+        self.robustness = robustness
+        self.status = 'queued'
+        self.stage = None
+        self.result = None
+        self.error = None
+        self.events = []
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.cancel_requested = False
+        self.process = None
+        self._changed = threading.Condition()
+
+    def add_event(self, event, data):
+        with self._changed:
+            self.events.append({'id': len(self.events), 'event': event, 'data': data})
+            self._changed.notify_all()
+
+    def finish(self, status, result=None, error=None):
+        with self._changed:
+            if self.status in FINISHED:
+                return False
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished = time.time()
+            self.events.append({'id': len(self.events), 'event': status,
+                                'data': result if status == 'done' else {'message': error}})
+            self._changed.notify_all()
+            return True
+
+    def wait_events(self, after, timeout=None):
+        # Events with id >= after, blocking up to timeout until there is one
+        # (or the job has finished)
+        with self._changed:
+            self._changed.wait_for(lambda: len(self.events) > after or self.status in FINISHED, timeout)
+            return self.events[after:]
+
+    def snapshot(self):
+        with self._changed:
+            response = {
+                'job_id': self.id,
+                'job_status': self.status,
+                'stage': self.stage,
+                'equilibria': [e['data'] for e in self.events if e['event'] == 'equilibrium'],
+                'created': self.created,
+                'started': self.started,
+                'finished': self.finished
+            }
+            if self.status == 'done':
+                response['result'] = self.result
+            elif self.status in ('failed', 'cancelled'):
+                response['message'] = self.error
+            return response
+
+
+class JobQueue:
+    # Bounded background solver. At most max_workers jobs run at once, each in
+    # its own child process so it can be cancelled and limited:
+    # time_limit (seconds of running time) and memory_limit (bytes of address
+    # space, Unix only). At most max_pending jobs wait in the queue; submit()
+    # raises QueueFull beyond that. The latest max_finished finished jobs are
+    # kept for polling. on_done(job), if given, is called with each job that
+    # finishes successfully.
+    def __init__(self, max_workers=2, time_limit=None, memory_limit=None, max_pending=100,
+                 max_finished=256, on_done=None, start_method=None):
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self.on_done = on_done
+        self._context = multiprocessing.get_context(start_method)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, game, robustness=None):
+        job = Job(game, robustness)
+        with self._lock:
+            pending = sum(1 for j in self._jobs.values() if j.status == 'queued')
+            if pending >= self.max_pending:
+                raise QueueFull("Too many queued jobs")
+            self._jobs[job.id] = job
+            self._trim()
+        self._executor.submit(self._run, job)
+        return job
+
+    def complete(self, game, result):
+        # Register an already-solved game (e.g. a cache hit) as a finished job
+        job = Job(game)
+        job.finish('done', result=result)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._trim()
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        # Returns False for unknown or already finished jobs
+        job = self.get(job_id)
+        if job is None:
+            return False
+        job.cancel_requested = True
+        if not job.finish('cancelled', error='Cancelled'):
+            return False
+        process = job.process
+        if process is not None and process.is_alive():
+            process.terminate()
+        return True
+
+    def shutdown(self):
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+        self._executor.shutdown(wait=True)
+
+    def _trim(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def _run(self, job):
+        # Runs on a pool thread: supervise one child process until it reports
+        # a result, dies, runs out of time or is cancelled
+        if job.cancel_requested:
+            return
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(target=run_job, args=(sender, job.game, self.memory_limit, job.robustness),
+                                        daemon=True)
+        with job._changed:
+            if job.status != 'queued':
+                receiver.close()
+                sender.close()
+                return
+            job.status = 'running'
+            job.started = time.time()
+            job.process = process
+        process.start()
+        sender.close()
+        if job.cancel_requested:
+            # Cancelled while the process was starting
+            process.terminate()
+        deadline = None if self.time_limit is None else job.started + self.time_limit
+
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    process.terminate()
+                    job.finish('failed', error='Time limit exceeded')
+                    break
+                try:
+                    ready = receiver.poll(remaining)
+                except (EOFError, OSError):
+                    ready = True
+                if not ready:
+                    continue
+                try:
+                    event, data = receiver.recv()
+                except (EOFError, OSError):
+                    # The child exited without reporting, e.g. killed or cancelled
+                    process.join()
+                    job.finish('failed', error=f'Worker exited with code {process.exitcode}')
+                    break
+                if event == 'stage':
+                    job.stage = data
+                    job.add_event(event, data)
+                elif event == 'equilibrium':
+                    job.add_event(event, data)
+                elif event == 'done':
+                    if job.finish('done', result=data) and self.on_done is not None:
+                        self.on_done(job)
+                    break
+                elif event == 'error':
+                    job.finish('failed', error=data)
+                    break
+        finally:
+            receiver.close()
+            process.join(timeout=1)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            job.process = None
@@ -0,0 +1,362 @@
+import argparse
+import copy
+import http.client
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+from benchmark import DEFAULT_CONFIGS, synthetic_game
+from tripple_b_gt import DEMO_PAYOFF_DATA
+
+# Server configurations compared by default in server mode: (worker
+# processes, threads per worker)
+DEFAULT_SERVERS = [(1, 1), (1, 4), (2, 4)]
+
+MIXES = ('demo', 'synthetic', 'mixed')
+
+
+def demo_spec(method):
+    return {
+        'p1_name': 'regulator',
+        'p2_name': 'trippleB',
+        'nature_strategies': ['stable', 'unstable'],
+        'p1_strategies': ['intervene', 'not intervene'],
+        'p2_strategies': ['relocate', 'not relocate'],
+        'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA),
+        'method': method
+    }
+
+
+def synthetic_spec(config, seed, method='nash'):
+    # /calculate body of benchmark.synthetic_game(seed, *config)
+    game = synthetic_game(seed, *config)
+    return {
+        'p1_name': game.player1.name,
+        'p2_name': game.player2.name,
+        'nature_strategies': list(game.nature.strategies),
+        'p1_strategies': list(game.player1.strategies),
+        'p2_strategies': list(game.player2.strategies),
+        'payoff_data': game.payoff_data,
+        'p1_payoff_function': game.p1_function or '',
+        'p2_payoff_function': game.p2_function or '',
+        'method': method
+    }
+
+
+def request_mix(name, seed=0):
+    # Weighted requests of a mix: [(label, method, path, body or None, weight)]
+    demo = [
+        ('calculate-demo-nash', 'POST', '/calculate', demo_spec('nash'), 3),
+        ('calculate-demo-spe', 'POST', '/calculate', demo_spec('subgame_perfect'), 1),
+        ('equilibrium-map-demo', 'POST', '/equilibrium_map', demo_spec('nash'), 1)
+    ]
+    # Growing game sizes, to see latency against size; the largest default
+    # benchmark size takes seconds per solve and is left out
+    synthetic = [('calculate-n{}-a{}x{}-v{}-t{}'.format(*config), 'POST', '/calculate',
+                  synthetic_spec(config, seed), 1) for config in DEFAULT_CONFIGS[:4]]
+    if name == 'demo':
+        return demo
+    if name == 'synthetic':
+        return synthetic
+    if name == 'mixed':
+        return demo + synthetic + [('cache-stats', 'GET', '/cache/stats', None, 1)]
+    raise ValueError(f"Unknown mix: {name}")
+
+
+def encode(body, nonce=None):
+    # JSON request body; a nonce adds an unused zero variable so the game
+    # misses the result cache
+    if body is None:
+        return None
+    if nonce is not None:
+        body = dict(body, payoff_data=dict(body['payoff_data']))
+        body['payoff_data']['p1'] = dict(body['payoff_data'].get('p1', {}), **{f'nonce_{nonce}': {'case1': 0}})
+    return json.dumps(body).encode('utf-8')
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    # One request per connection, without a log line per request
+    protocol_version = 'HTTP/1.0'
+
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    # werkzeug server handling connections on a fixed pool of threads, like
+    # one worker of a threaded production server
+    multithread = True
+
+    def __init__(self, host, port, app, threads=1, fd=None):
+        super().__init__(host, port, app, handler=QuietRequestHandler, fd=fd)
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='wsgi')
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def serve_worker(fd, threads):
+    # Worker process: serve the app on the shared listening socket
+    from app import app
+
+    signal.signal(signal.SIGTERM, lambda *args: os._exit(0))
+    PooledWSGIServer('127.0.0.1', 0, app, threads=threads, fd=fd).serve_forever()
+
+
+class LocalServer:
+    # Pre-forked local server: workers processes with threads threads each,
+    # all accepting on one listening socket on 127.0.0.1 (Linux / fork only)
+    def __init__(self, workers=1, threads=1):
+        self.workers = workers
+        self.threads = threads
+        self._socket = None
+        self._processes = []
+
+    def __enter__(self):
+        # Preload the app and sympy so no worker pays for the imports during a run
+        import sympy
+        import app
+
+        self._socket = socket.create_server(('127.0.0.1', 0), backlog=1024)
+        self.port = self._socket.getsockname()[1]
+        context = multiprocessing.get_context('fork')
+        for _ in range(self.workers):
+            process = context.Process(target=serve_worker, args=(self._socket.fileno(), self.threads), daemon=True)
+            process.start()
+            self._processes.append(process)
+        return self
+
+    def __exit__(self, *exc_info):
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.kill()
+        self._socket.close()
+
+    def send(self, method, path, body):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=120)
+        try:
+            connection.request(method, path, body=body, headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            response.read()
+            return response.status
+        finally:
+            connection.close()
+
+
+class InProcessClient:
+    # The app called in this process through Flask test clients (one per
+    # thread): the service path without sockets or HTTP parsing
+    def __init__(self):
+        from app import app
+
+        self.app = app
+        self._local = threading.local()
+
+    def send(self, method, path, body):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        return client.open(path, method=method, data=body, content_type='application/json').status_code
+
+
+def percentiles(latencies):
+    if not latencies:
+        return {'mean': None, 'p50': None, 'p95': None, 'p99': None, 'max': None}
+    values = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {'mean': float(values.mean()), 'p50': float(p50), 'p95': float(p95), 'p99': float(p99),
+            'max': float(values.max())}
+
+
+def run_load(send, mix, concurrency=4, requests=200, duration=None, seed=0, unique=False):
+    # Closed loop: concurrency clients each send the next request of a seeded
+    # weighted draw from mix as soon as their previous one returns, until
+    # requests have been sent (or duration seconds have passed).
+    # Every request of the mix is sent once first, untimed, as a warm-up.
+    # Statuses of 400 and above and failed connections count as errors.
+    # Nonces unique across runs, so no run hits results cached by an earlier one
+    run_id = uuid.uuid4().hex[:8]
+    nonces = (f"{run_id}_{n}" for n in itertools.count())
+    for label, method, path, body, _ in mix:
+        send(method, path, encode(body, next(nonces) if unique else None))
+
+    rng = random.Random(seed)
+    weights = [entry[4] for entry in mix]
+    lock = threading.Lock()
+    issued = [0]
+    records = []
+    deadline = None if duration is None else time.perf_counter() + duration
+
+    def next_request():
+        with lock:
+            if (duration is None and issued[0] >= requests) or (deadline is not None and time.perf_counter() >= deadline):
+                return None
+            issued[0] += 1
+            return rng.choices(mix, weights)[0], (next(nonces) if unique else None)
+
+    def client():
+        while True:
+            item = next_request()
+            if item is None:
+                return
+            (label, method, path, body, _), nonce = item
+            payload = encode(body, nonce)
+            start = time.perf_counter()
+            try:
+                ok = send(method, path, payload) < 400
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                records.append((label, elapsed, ok))
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    errors = sum(1 for _, _, ok in records if not ok)
+    endpoints = {}
+    for label in sorted({record[0] for record in records}):
+        latencies = [elapsed for name, elapsed, _ in records if name == label]
+        endpoints[label] = dict(percentiles(latencies), requests=len(latencies))
+    return {
+        'requests': len(records),
+        'errors': errors,
+        'error_rate': errors / len(records) if records else 0.0,
+        'seconds': seconds,
+        'throughput': len(records) / seconds if seconds > 0 else 0.0,
+        'latency_ms': percentiles([elapsed for _, elapsed, _ in records]),
+        'endpoints': endpoints
+    }
+
+
+def loadtest(mode='inprocess', mix='demo', concurrency=(1, 4), servers=DEFAULT_SERVERS, requests=200,
+             duration=None, seed=0, unique=False):
+    # One run per (server configuration, concurrency). In-process runs have
+    # no server configuration (workers and threads are reported as None).
+    entries = request_mix(mix, seed)
+    results = []
+
+    def record(workers, threads, level, summary):
+        name = f"{mode}-{mix}-c{level}" if workers is None else f"{mode}-{mix}-w{workers}-t{threads}-c{level}"
+        results.append(dict(summary, name=name, mode=mode, mix=mix, workers=workers, threads=threads,
+                            concurrency=level))
+
+    if mode == 'inprocess':
+        client = InProcessClient()
+        for level in concurrency:
+            record(None, None, level, run_load(client.send, entries, level, requests, duration, seed, unique))
+    elif mode == 'server':
+        for workers, threads in servers:
+            with LocalServer(workers, threads) as server:
+                for level in concurrency:
+                    record(workers, threads, level, run_load(server.send, entries, level, requests, duration, seed, unique))
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'seed': seed,
+        'unique': unique,
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold=1.5, min_ms=1.0, max_error_increase=0.01):
+    # Regressions of current against baseline: throughput more than threshold
+    # times lower, p95 latency more than threshold times higher (ignoring runs
+    # under min_ms in both) and error rates up by more than max_error_increase.
+    # Runs missing from the baseline are skipped.
+    previous = {entry['name']: entry for entry in baseline['results']}
+    regressions = []
+    for entry in current['results']:
+        old = previous.get(entry['name'])
+        if old is None:
+            continue
+        if entry['throughput'] * threshold < old['throughput']:
+            regressions.append({'name': entry['name'], 'metric': 'throughput',
+                                'baseline': old['throughput'], 'current': entry['throughput']})
+        p95, old_p95 = entry['latency_ms']['p95'], old['latency_ms']['p95']
+        if p95 is not None and old_p95 is not None and max(p95, old_p95) >= min_ms and p95 > threshold * old_p95:
+            regressions.append({'name': entry['name'], 'metric': 'p95_ms', 'baseline': old_p95, 'current': p95})
+        if entry['error_rate'] > old['error_rate'] + max_error_increase:
+            regressions.append({'name': entry['name'], 'metric': 'error_rate',
+                                'baseline': old['error_rate'], 'current': entry['error_rate']})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the solver service locally.")
+    parser.add_argument('--mode', choices=['inprocess', 'server'], default='inprocess',
+                        help="call the app in this process, or through pre-forked local HTTP servers")
+    parser.add_argument('--mix', choices=MIXES, default='demo', help="request mix")
+    parser.add_argument('--concurrency', default='1,4', help="comma-separated concurrent client counts")
+    parser.add_argument('--server', action='append', default=None, metavar='WORKERS,THREADS',
+                        help="server configuration for --mode server (repeatable)")
+    parser.add_argument('--requests', type=int, default=200, help="requests per run")
+    parser.add_argument('--duration', type=float, help="seconds per run instead of a request count")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--unique', action='store_true', help="make every request miss the result cache")
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    parser.add_argument('--baseline', help="compare against a JSON file written by --output")
+    parser.add_argument('--threshold', type=float, default=1.5, help="slowdown factor reported as a regression")
+    args = parser.parse_args(argv)
+
+    concurrency = [int(level) for level in args.concurrency.split(',')]
+    servers = DEFAULT_SERVERS
+    if args.server:
+        servers = [tuple(int(v) for v in server.split(',')) for server in args.server]
+
+    current = loadtest(args.mode, args.mix, concurrency, servers, args.requests, args.duration, args.seed, args.unique)
+    for entry in current['results']:
+        latency = entry['latency_ms']
+        print(f"{entry['name']:<32} {entry['throughput']:8.1f} req/s  p50={latency['p50']:.1f}ms  "
+              f"p95={latency['p95']:.1f}ms  p99={latency['p99']:.1f}ms  errors={entry['error_rate']:.1%}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, threshold=args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['name']} {r['metric']}: {r['baseline']:.4g} -> {r['current']:.4g}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,245 @@
+import itertools
+from math import comb
+
+import numpy as np
+
+# Games with more support pairs than this are solved with Lemke-Howson
+SUPPORT_ENUMERATION_LIMIT = 20000
+
+
+def support_pairs(num_rows, num_cols, size):
+    rows = np.array(list(itertools.combinations(range(num_rows), size)), dtype=np.intp)
+    cols = np.array(list(itertools.combinations(range(num_cols), size)), dtype=np.intp)
+    return rows, cols
+
+
+def count_support_pairs(num_rows, num_cols):
+    return sum(comb(num_rows, k) * comb(num_cols, k) for k in range(1, min(num_rows, num_cols) + 1))
+
+
+def indifferent_mixes(payoffs, supports_own, supports_other):
+    # For every pair of equal-size supports, the opponent mix over supports_other
+    # that makes the owner of payoffs indifferent across supports_own.
+    # payoffs: (..., own, other). Returns (mix over other, value, valid) with
+    # shapes (..., n_own, n_other, k), (..., n_own, n_other) and the same.
+    k = supports_own.shape[1]
+    sub = payoffs[..., supports_own[:, None, :, None], supports_other[None, :, None, :]]
+    # [[P_IJ, -1], [1, 0]] [mix, value] = [0, 1]
+    shape = sub.shape[:-2] + (k + 1, k + 1)
+    system = np.zeros(shape)
+    system[..., :k, :k] = sub
+    system[..., :k, k] = -1.0
+    system[..., k, :k] = 1.0
+    rhs = np.zeros(shape[:-1])
+    rhs[..., k] = 1.0
+
+    # Singular systems (degenerate supports) are replaced by the identity and dropped
+    det = np.linalg.det(system)
+    valid = np.abs(det) > 1e-12
+    system[~valid] = np.eye(k + 1)
+    solution = np.linalg.solve(system, rhs[..., None])[..., 0]
+    return solution[..., :k], solution[..., k], valid
+
+
+def support_enumeration(A, B, tolerance=1e-9):
+    # All equilibria with equal-size supports of the bimatrix game (A, B),
+    # vectorized over support pairs and over any leading dimensions of A and B
+    # (e.g. a grid of ro values). Degenerate games may have further equilibria
+    # with unequal supports; those found here are still exact equilibria.
+    # Returns a list of (p1_mix, p2_mix, p1_value, p2_value) tuples for 2-D
+    # input, otherwise one such list per (flattened) leading index.
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    batch_shape = A.shape[:-2]
+    num_rows, num_cols = A.shape[-2:]
+    A = A.reshape((-1, num_rows, num_cols))
+    B = B.reshape((-1, num_rows, num_cols))
+    found = [[] for _ in range(A.shape[0])]
+
+    for size in range(1, min(num_rows, num_cols) + 1):
+        rows, cols = support_pairs(num_rows, num_cols, size)
+        # Column mix q making P1 indifferent on rows, row mix p making P2 indifferent on cols
+        q, p1_value, q_valid = indifferent_mixes(A, rows, cols)
+        p, p2_value, p_valid = indifferent_mixes(np.swapaxes(B, -1, -2), cols, rows)
+        p = np.swapaxes(p, 1, 2)
+        p2_value = np.swapaxes(p2_value, 1, 2)
+        p_valid = np.swapaxes(p_valid, 1, 2)
+
+        valid = q_valid & p_valid & np.all(q >= -tolerance, axis=-1) & np.all(p >= -tolerance, axis=-1)
+
+        # Scatter the mixes to full length and check that nothing outside the
+        # supports does better
+        full_q = np.zeros(q.shape[:-1] + (num_cols,))
+        np.put_along_axis(full_q, np.broadcast_to(cols[None, None, :, :], q.shape), q, axis=-1)
+        full_p = np.zeros(p.shape[:-1] + (num_rows,))
+        np.put_along_axis(full_p, np.broadcast_to(rows[None, :, None, :], p.shape), p, axis=-1)
+
+        row_payoffs = np.einsum('grc,gijc->gijr', A, full_q)
+        col_payoffs = np.einsum('grc,gijr->gijc', B, full_p)
+        valid &= np.all(row_payoffs <= p1_value[..., None] + tolerance, axis=-1)
+        valid &= np.all(col_payoffs <= p2_value[..., None] + tolerance, axis=-1)
+
+        for g, i, j in np.argwhere(valid):
+            found[g].append((np.clip(full_p[g, i, j], 0, None), np.clip(full_q[g, i, j], 0, None),
+                             float(p1_value[g, i, j]), float(p2_value[g, i, j])))
+
+    found = [deduplicate(equilibria) for equilibria in found]
+    return found if batch_shape else found[0]
+
+
+def lemke_howson(A, B, initial_label=0, max_pivots=None, tolerance=1e-12):
+    # One equilibrium of (A, B) by complementary pivoting from the artificial
+    # equilibrium, dropping initial_label (0..m-1 for P1 strategies,
+    # m..m+n-1 for P2 strategies). Ties in the ratio test are broken
+    # lexicographically, so degenerate games cannot cycle.
+    # Returns (p1_mix, p2_mix, p1_value, p2_value), or None if max_pivots is hit.
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    num_rows, num_cols = A.shape
+    # Shift payoffs to be positive; equilibria do not change
+    A_pos = A - A.min() + 1.0
+    B_pos = B - B.min() + 1.0
+
+    # Polytope P: B^T x + s = 1 (variables x_i with label i, s_j with label m+j)
+    # Polytope Q: r + A y = 1 (variables r_i with label i, y_j with label m+j)
+    tableau_p = np.hstack([B_pos.T, np.eye(num_cols), np.ones((num_cols, 1))])
+    tableau_q = np.hstack([np.eye(num_rows), A_pos, np.ones((num_rows, 1))])
+    basis_p = list(range(num_rows, num_rows + num_cols))
+    basis_q = list(range(num_rows))
+    # Columns of the initial basis, used for the lexicographic ratio test
+    start_p = list(basis_p)
+    start_q = list(basis_q)
+
+    def pivot(tableau, basis, start, entering):
+        column = tableau[:, entering]
+        candidates = np.flatnonzero(column > tolerance)
+        # Lexicographic minimum of (rhs, initial basis columns) / pivot element
+        keys = tableau[candidates][:, [-1] + start] / column[candidates, None]
+        best = candidates[np.lexsort(keys.T[::-1])[0]]
+        tableau[best] /= tableau[best, entering]
+        for row in range(tableau.shape[0]):
+            if row != best:
+                tableau[row] -= tableau[row, entering] * tableau[best]
+        leaving = basis[best]
+        basis[best] = entering
+        return leaving
+
+    if max_pivots is None:
+        max_pivots = 50 * (num_rows + num_cols) ** 2
+    # P1 labels enter P, P2 labels enter Q first
+    in_p = initial_label < num_rows
+    entering = initial_label
+    for _ in range(max_pivots):
+        if in_p:
+            leaving = pivot(tableau_p, basis_p, start_p, entering)
+        else:
+            leaving = pivot(tableau_q, basis_q, start_q, entering)
+        if leaving == initial_label:
+            break
+        entering = leaving
+        in_p = not in_p
+    else:
+        return None
+
+    x = np.zeros(num_rows)
+    for row, variable in enumerate(basis_p):
+        if variable < num_rows:
+            x[variable] = tableau_p[row, -1]
+    y = np.zeros(num_cols)
+    for row, variable in enumerate(basis_q):
+        if variable >= num_rows:
+            y[variable - num_rows] = tableau_q[row, -1]
+    p1_mix = x / x.sum()
+    p2_mix = y / y.sum()
+    return p1_mix, p2_mix, float(p1_mix @ A @ p2_mix), float(p1_mix @ B @ p2_mix)
+
+
+def lemke_howson_all(A, B):
+    # Equilibria reached from every initial label, deduplicated
+    found = []
+    for label in range(sum(np.shape(A))):
+        equilibrium = lemke_howson(A, B, initial_label=label)
+        if equilibrium is not None:
+            found.append(equilibrium)
+    return deduplicate(found)
+
+
+def deduplicate(equilibria, decimals=8):
+    unique = {}
+    for equilibrium in equilibria:
+        key = (tuple(np.round(equilibrium[0], decimals)), tuple(np.round(equilibrium[1], decimals)))
+        unique.setdefault(key, equilibrium)
+    return list(unique.values())
+
+
+def is_degenerate(A, B, equilibria, tolerance=1e-9):
+    # A game is degenerate when some strategy has more pure best responses
+    # than its support size. Checked for every pure strategy and for each
+    # of the given equilibria; a True answer means support enumeration may
+    # have missed equilibria whose supports differ in size.
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    if (np.any(np.sum(A >= A.max(axis=0) - tolerance, axis=0) > 1)
+            or np.any(np.sum(B >= B.max(axis=1, keepdims=True) - tolerance, axis=1) > 1)):
+        return True
+    for p1_mix, p2_mix, p1_value, p2_value in equilibria:
+        row_best = np.sum(A @ p2_mix >= p1_value - tolerance)
+        col_best = np.sum(p1_mix @ B >= p2_value - tolerance)
+        if row_best > np.count_nonzero(p2_mix > tolerance) or col_best > np.count_nonzero(p1_mix > tolerance):
+            return True
+    return False
+
+
+def find_mixed_equilibria(strategic_form, ro=None, method='auto'):
+    # Mixed Nash equilibria of the numeric strategic form at one ro value, or
+    # at every value of an array of ro (one result per value).
+    # method: 'support' (all equal-support equilibria, vectorized over ro),
+    # 'lemke_howson' (one path per initial label), or 'auto', which uses
+    # support enumeration while the number of support pairs is small.
+    # Returns {'equilibria', 'degenerate', 'complete'}: 'complete' is True only
+    # when support enumeration ran on a nondegenerate game, so the list is
+    # every equilibrium; game trees give degenerate forms easily (a firm
+    # strategy ties with any other that differs only after unplayed actions).
+    # Each equilibrium: {'p1_mix', 'p2_mix', 'p1_payoff', 'p2_payoff', 'p1_support', 'p2_support'}
+    # with supports as (pure strategy, probability) pairs.
+    if ro is None:
+        raise ValueError("ro is required")
+    A, B = strategic_form.payoff_matrices(ro)
+    num_rows, num_cols = A.shape[-2:]
+    if method == 'auto':
+        method = 'support' if count_support_pairs(num_rows, num_cols) <= SUPPORT_ENUMERATION_LIMIT else 'lemke_howson'
+
+    A = A.reshape((-1, num_rows, num_cols))
+    B = B.reshape((-1, num_rows, num_cols))
+    if method == 'support':
+        raw = support_enumeration(A, B)
+    elif method == 'lemke_howson':
+        raw = [lemke_howson_all(a, b) for a, b in zip(A, B)]
+    else:
+        raise ValueError(f"Unknown method: {method}")
+
+    p1_strats = strategic_form.pure_strategies[strategic_form.extensive_form.player1.name]
+    p2_strats = strategic_form.pure_strategies[strategic_form.extensive_form.player2.name]
+
+    def describe(equilibrium):
+        p1_mix, p2_mix, p1_value, p2_value = equilibrium
+        return {
+            'p1_mix': p1_mix,
+            'p2_mix': p2_mix,
+            'p1_payoff': p1_value,
+            'p2_payoff': p2_value,
+            'p1_support': [(p1_strats[i], float(p1_mix[i])) for i in np.flatnonzero(p1_mix > 1e-9)],
+            'p2_support': [(p2_strats[j], float(p2_mix[j])) for j in np.flatnonzero(p2_mix > 1e-9)]
+        }
+
+    results = []
+    for a, b, equilibria in zip(A, B, raw):
+        degenerate = is_degenerate(a, b, equilibria)
+        results.append({
+            'equilibria': [describe(equilibrium) for equilibrium in equilibria],
+            'degenerate': degenerate,
+            'complete': method == 'support' and not degenerate
+        })
+    if np.ndim(ro) == 0:
+        return results[0]
+    return results
@@ -0,0 +1,165 @@
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+import tokenize
+from collections import OrderedDict
+
+from tripple_b_gt import sanitize_variable_name, sanitize_function_string
+
+
+def normalize_payoff_function(function_str):
+    # Same sanitization the engine applies, then the tokens the expression
+    # parser sees joined by single spaces: only whitespace between tokens is
+    # dropped, so e.g. the invalid "x* *2" does not share a key with "x**2"
+    if not function_str:
+        return ''
+    sanitized = sanitize_function_string(function_str)
+    try:
+        tokens = tokenize.generate_tokens(io.StringIO(sanitized).readline)
+        return ' '.join(token.string for token in tokens if token.string)
+    except (tokenize.TokenError, SyntaxError):
+        # Not even tokenizable: the engine rejects it, keep it verbatim
+        return sanitized
+
+
+def normalize_game(p1_name, p2_name, nature_strategies, p1_strategies, p2_strategies,
+                   payoff_data, p1_function=None, p2_function=None, method=None, result_format=None):
+    # Canonical, order-independent form of a game: variables are sanitized and
+    # sorted, case values sorted by label and converted to float. Strategy order
+    # is kept because it determines the case numbering. result_format
+    # (http_cache.RESULT_FORMAT) is set when the hash keys a solved result, so
+    # bumping it retires results cached, in memory or on disk, in the old shape.
+    def normalize_player_data(player_data):
+        variables = []
+        for var_name, var_data in player_data.items():
+            # + 0.0 folds -0.0 into 0.0
+            values = sorted((str(case), float(value) + 0.0) for case, value in var_data.items())
+            variables.append([sanitize_variable_name(var_name), values])
+        return sorted(variables)
+
+    return {
+        'players': [str(p1_name), str(p2_name)],
+        'strategies': [list(nature_strategies), list(p1_strategies), list(p2_strategies)],
+        'payoff_data': {key: normalize_player_data(payoff_data.get(key, {})) for key in ('p1', 'p2')},
+        'functions': [normalize_payoff_function(p1_function), normalize_payoff_function(p2_function)],
+        'method': method,
+        'format': result_format
+    }
+
+
+def game_hash(*args, **kwargs):
+    # SHA-256 of the canonical JSON encoding of normalize_game(...)
+    normalized = normalize_game(*args, **kwargs)
+    encoded = json.dumps(normalized, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    # Bounded in-process LRU cache of solved results keyed by game_hash(),
+    # with an optional time-to-live (seconds) and an optional on-disk tier
+    # (one JSON file per key) that survives restarts. Values must be JSON
+    # serializable when the disk tier is enabled. Thread safe.
+    def __init__(self, max_size=256, ttl=None, directory=None, clock=time.time):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.directory = directory
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _expired(self, created):
+        return self.ttl is not None and self.clock() - created > self.ttl
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created, value = entry
+                if not self._expired(created):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            
+            if self.directory:
+                entry = self._read_disk(key)
+                if entry is not None:
+                    created, value = entry
+                    self._store(key, created, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+            
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            created = self.clock()
+            self._store(key, created, value)
+            if self.directory:
+                self._write_disk(key, created, value)
+
+    def _store(self, key, created, value):
+        self._entries[key] = (created, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _read_disk(self, key):
+        try:
+            with open(self._path(key), encoding='utf-8') as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            return None
+        if self._expired(entry['created']):
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            return None
+        return entry['created'], entry['value']
+
+    def _write_disk(self, key, created, value):
+        # Write to a temporary file first so readers never see partial entries
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as handle:
+                json.dump({'created': created, 'value': value}, handle)
+            os.replace(temp_path, path)
+        except OSError:
+            # The disk tier is best effort; the memory tier still holds the value
+            pass
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'disk': bool(self.directory),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
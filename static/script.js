@@ -2,6 +2,14 @@ const cases = [
     'case1', 'case2', 'case3', 'case4', 'case5', 'case6', 'case7', 'case8'
 ];
 
+// Games with more payoff values than this are solved as background jobs
+const ASYNC_THRESHOLD = 200;
+
+// Latest results by request body with their ETags, revalidated on repeat
+// requests so an unchanged game answers 304 instead of being sent again
+const resultCache = new Map();
+const RESULT_CACHE_SIZE = 20;
+
 document.addEventListener('DOMContentLoaded', () => {
     initializeTable('p1');
     initializeTable('p2');
@@ -179,27 +187,144 @@ async function calculateEquilibrium() {
         'nature_strategies': natureStrategies,
         'p1_strategies': p1Strategies,
         'p2_strategies': p2Strategies,
-        'payoff_data': payoffData,
+        'payoff_columns': toPayoffColumns(payoffData,
+            natureStrategies.length * p1Strategies.length * p2Strategies.length),
         'p1_payoff_function': p1Function,
         'p2_payoff_function': p2Function
     };
 
+    if (countPayoffValues(payoffData) > ASYNC_THRESHOLD) {
+        submitJob(payload);
+        return;
+    }
+
     try {
-        const response = await fetch('/calculate', {
+        const result = await fetchResult('/calculate', payload);
+
+        if (result.status === 'success') {
+            displayResults(result.equilibria);
+            displayEquilibriumMap(payload);
+        } else {
+            alert('Error: ' + result.message);
+        }
+    } catch (error) {
+        console.error('Error:', error);
+        alert('An error occurred while calculating equilibrium.');
+    }
+}
+
+function toPayoffColumns(payoffData, numCases) {
+    // Columnar payoffs: per player the variable names and one flat
+    // variable-major array of values in case order, sent as base64
+    // little-endian float64
+    const columns = {};
+    Object.entries(payoffData).forEach(([player, playerData]) => {
+        const variables = Object.keys(playerData);
+        const view = new DataView(new ArrayBuffer(8 * variables.length * numCases));
+        variables.forEach((varName, k) => {
+            Object.entries(playerData[varName]).forEach(([caseName, value]) => {
+                const c = parseInt(caseName.replace('case', ''), 10) - 1;
+                if (c >= 0 && c < numCases) {
+                    view.setFloat64(8 * (k * numCases + c), value, true);
+                }
+            });
+        });
+        let binary = '';
+        new Uint8Array(view.buffer).forEach(b => {
+            binary += String.fromCharCode(b);
+        });
+        columns[player] = {'variables': variables, 'values': btoa(binary), 'encoding': 'base64'};
+    });
+    return columns;
+}
+
+async function fetchResult(url, payload) {
+    // POST payload and return the parsed result, reusing the cached copy
+    // when the server confirms it is unchanged (304)
+    const body = JSON.stringify(payload);
+    const key = url + ' ' + body;
+    const cached = resultCache.get(key);
+    const headers = {
+        'Content-Type': 'application/json'
+    };
+    if (cached) {
+        headers['If-None-Match'] = cached.etag;
+    }
+
+    const response = await fetch(url, {
+        method: 'POST',
+        headers: headers,
+        body: body
+    });
+    if (response.status === 304 && cached) {
+        return cached.result;
+    }
+
+    const result = await response.json();
+    const etag = response.headers.get('ETag');
+    resultCache.delete(key);
+    if (etag && result.status === 'success') {
+        resultCache.set(key, {etag: etag, result: result});
+        if (resultCache.size > RESULT_CACHE_SIZE) {
+            resultCache.delete(resultCache.keys().next().value);
+        }
+    }
+    return result;
+}
+
+function countPayoffValues(payoffData) {
+    let count = 0;
+    Object.values(payoffData).forEach(playerData => {
+        Object.values(playerData).forEach(varData => {
+            count += Object.keys(varData).length;
+        });
+    });
+    return count;
+}
+
+async function submitJob(payload) {
+    // Solve in the background and follow progress over Server-Sent Events
+    const resultsSection = document.getElementById('results-section');
+    const resultsContent = document.getElementById('results-content');
+
+    try {
+        const response = await fetch('/jobs', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             },
             body: JSON.stringify(payload)
         });
+        const job = await response.json();
+        if (job.status !== 'success') {
+            alert('Error: ' + job.message);
+            return;
+        }
 
-        const result = await response.json();
+        resultsSection.classList.remove('hidden');
+        resultsContent.innerHTML = '<p class="job-progress">Queued...</p>';
+        let found = 0;
 
-        if (result.status === 'success') {
-            displayResults(result.equilibria);
-        } else {
-            alert('Error: ' + result.message);
-        }
+        const events = new EventSource(`/jobs/${job.job_id}/events`);
+        events.addEventListener('stage', e => {
+            const stage = JSON.parse(e.data);
+            resultsContent.querySelector('.job-progress').textContent =
+                `Running: ${stage} (${found} equilibria found)`;
+        });
+        events.addEventListener('equilibrium', () => {
+            found += 1;
+        });
+        events.addEventListener('done', e => {
+            events.close();
+            displayResults(JSON.parse(e.data).equilibria);
+        });
+        ['failed', 'cancelled'].forEach(name => {
+            events.addEventListener(name, e => {
+                events.close();
+                resultsContent.innerHTML = '';
+                alert('Error: ' + JSON.parse(e.data).message);
+            });
+        });
     } catch (error) {
         console.error('Error:', error);
         alert('An error occurred while calculating equilibrium.');
@@ -263,6 +388,34 @@ function displayResults(equilibria) {
     });
 }
 
+async function displayEquilibriumMap(payload) {
+    // Phase diagram: the regions of ro in [0, 1] and the equilibria in each
+    try {
+        const result = await fetchResult('/equilibrium_map', payload);
+        if (result.status !== 'success') {
+            return;
+        }
+
+        const p1Name = document.getElementById('p1-name').value;
+        const p2Name = document.getElementById('p2-name').value;
+        const div = document.createElement('div');
+        div.className = 'result-item equilibrium-map';
+        const rows = result.regions.map(region => {
+            const profiles = region.equilibria.length === 0 ? '<em>none</em>' : region.equilibria.map(eq =>
+                `${p1Name}: <code>${JSON.stringify(eq.p1_strategy)}</code>, ${p2Name}: <code>${JSON.stringify(eq.p2_strategy)}</code>`
+            ).join('<br>');
+            return `<tr><td>${region.ro_range}</td><td>${profiles}</td></tr>`;
+        }).join('');
+        div.innerHTML = `
+            <h3>Equilibrium Map</h3>
+            <table><thead><tr><th>ro</th><th>Equilibria</th></tr></thead><tbody>${rows}</tbody></table>
+        `;
+        document.getElementById('results-content').appendChild(div);
+    } catch (error) {
+        console.error('Error:', error);
+    }
+}
+
 function toggleSidebar() {
     const sidebar = document.querySelector('.sidebar');
     const overlay = document.getElementById('sidebar-overlay');
@@ -0,0 +1,68 @@
+from batch_solver import solve_batch, solve_game_spec, parse_game_spec
+
+def scenario(carbon_tax, method='nash'):
+    return {
+        'p1_name': 'regulator',
+        'p2_name': 'firm',
+        'payoff_data': {
+            'p1': {'profit': {'case1': 10, 'case2': 8, 'case3': 6, 'case4': 4, 'case5': 9, 'case6': 7, 'case7': 5, 'case8': 3},
+                   'carbon_tax': {'case5': carbon_tax, 'case6': carbon_tax, 'case7': carbon_tax, 'case8': carbon_tax}},
+            'p2': {'welfare': {'case1': 1, 'case2': 2, 'case3': 3, 'case4': 4, 'case5': 5, 'case6': 6, 'case7': 7, 'case8': 8}}
+        },
+        'method': method
+    }
+
+def test_batch_in_order_with_errors():
+    specs = [
+        scenario(-1),
+        {'method': 'unknown'},                                  # fails to parse
+        scenario(-5, method='subgame_perfect'),
+        dict(scenario(0), p1_payoff_function='missing_var'),    # fails to solve
+        scenario(-9),
+    ]
+    results = solve_batch(specs, max_workers=2)
+    
+    assert len(results) == len(specs)
+    assert [r['status'] for r in results] == ['success', 'error', 'success', 'error', 'success']
+    assert 'Unknown method' in results[1]['message']
+    assert 'Undefined variables' in results[3]['message']
+    
+    # Parallel results are identical to solving one by one
+    for spec, result in zip(specs, results):
+        if result['status'] == 'success':
+            assert result == solve_game_spec(parse_game_spec(spec))
+    
+    assert solve_batch(specs, max_workers=1) == results
+    print("Test Passed!")
+
+def test_batch_endpoint():
+    from app import app
+    client = app.test_client()
+    response = client.post('/calculate/batch', json={'games': [scenario(-2), 'not a game', scenario(-3)]})
+    result = response.get_json()
+    assert result['status'] == 'success'
+    assert [r['status'] for r in result['results']] == ['success', 'error', 'success']
+    
+    response = client.post('/calculate/batch', json={'games': 'nope'})
+    assert response.status_code == 400
+    print("Test Passed!")
+
+def test_strategy_lists_are_validated():
+    for key in ('nature_strategies', 'p1_strategies', 'p2_strategies'):
+        for bad in ('ab', ['a', 1], ['a', ''], ['a', 'a'], None):
+            try:
+                parse_game_spec(dict(scenario(0), **{key: bad}))
+                assert False, f"{key}={bad!r} should have raised ValueError"
+            except ValueError as e:
+                assert key in str(e)
+    
+    from app import app
+    response = app.test_client().post('/calculate', json=dict(scenario(0), p1_strategies='ab'))
+    assert response.status_code == 400
+    assert response.get_json()['status'] == 'error'
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_batch_in_order_with_errors()
+    test_batch_endpoint()
+    test_strategy_lists_are_validated()
@@ -0,0 +1,32 @@
+from benchmark import synthetic_game, benchmark, compare, STAGES
+from tripple_b_gt import StrategicForm
+import copy
+
+def test_synthetic_game_is_seeded():
+    first = synthetic_game(7, 2, 3, 2, 4, 5)
+    second = synthetic_game(7, 2, 3, 2, 4, 5)
+    assert first.payoff_data == second.payoff_data
+    assert first.p1_function == second.p1_function and first.p2_function == second.p2_function
+    assert synthetic_game(8, 2, 3, 2, 4, 5).payoff_data != first.payoff_data
+    assert first.payoff_tensor.shape == (2, 3, 2, 2)
+    assert len(first.payoff_data['p1']) == 4
+    StrategicForm(first).find_nash_equilibria(exact=False)
+    print("Test Passed!")
+
+def test_benchmark_and_compare():
+    report = benchmark([(2, 2, 2, 2, 2)], repeat=1)
+    entry, = report['results']
+    assert set(entry['seconds']) == set(STAGES)
+    assert entry['cells'] == 16 and entry['peak_memory_bytes'] > 0
+    assert compare(report, report) == []
+
+    slower = copy.deepcopy(report)
+    slower['results'][0]['seconds']['find_nash_equilibria'] = 10.0
+    slower['results'][0]['peak_memory_bytes'] *= 3
+    metrics = {r['metric'] for r in compare(slower, report)}
+    assert metrics == {'find_nash_equilibria', 'peak_memory_bytes'}
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_synthetic_game_is_seeded()
+    test_benchmark_and_compare()
@@ -0,0 +1,52 @@
+from tripple_b_gt import Player, ExtensiveForm, CaseBuilder
+
+# The case labels of the original two-action game: (nature, p1, p2) indices
+LEGACY_CASES = {
+    'case1': (1, 0, 0),  # Unstable, Intervene, Relocate
+    'case2': (1, 1, 0),  # Unstable, Not Intervene, Relocate
+    'case3': (0, 0, 0),  # Stable, Intervene, Relocate
+    'case4': (0, 1, 0),  # Stable, Not Intervene, Relocate
+    'case5': (1, 0, 1),  # Unstable, Intervene, Not Relocate
+    'case6': (1, 1, 1),  # Unstable, Not Intervene, Not Relocate
+    'case7': (0, 0, 1),  # Stable, Intervene, Not Relocate
+    'case8': (0, 1, 1),  # Stable, Not Intervene, Not Relocate
+}
+
+def test_legacy_case_labels():
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('p1', ('Attack', 'Defend'))
+    p2 = Player('p2', ('Run', 'Hide'))
+    cases = CaseBuilder(nature, p1, p2)
+    
+    for label, (n_idx, p1_idx, p2_idx) in LEGACY_CASES.items():
+        cases.case_definition((nature.strategies[n_idx], p1.strategies[p1_idx], p2.strategies[p2_idx]))
+        assert cases.case == label
+        assert cases.labels[cases.index_table[n_idx, p1_idx, p2_idx]] == label
+    
+    cases.case_definition(('stable', 'Attack', 'Unknown'))
+    assert cases.case is None
+    print("Test Passed!")
+
+def test_many_actions():
+    nature = Player('nature', ('stable', 'unstable', 'crisis'))
+    p1 = Player('p1', ('a', 'b', 'c', 'd', 'e'))
+    p2 = Player('p2', ('x', 'y', 'z'))
+    cases = CaseBuilder(nature, p1, p2)
+    
+    # Every profile gets its own case
+    assert cases.num_cases == 45
+    assert sorted(cases.index_table.ravel().tolist()) == list(range(45))
+    
+    # Payoff data for a case beyond the legacy eight is picked up
+    payoff_data = {'p1': {'v': {'case45': 7}}, 'p2': {'v': {'case1': 3}}}
+    game = ExtensiveForm(nature, p1, p2, payoff_data)
+    cases.case_definition(('stable', 'e', 'z'))
+    assert cases.case == 'case45'
+    assert game.payoff('case45') == (7, 0)
+    assert game.payoff_tensor[0, 4, 2].tolist() == [7, 0]
+    assert game.payoff_tensor[2, 0, 0].tolist() == [0, 3]
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_legacy_case_labels()
+    test_many_actions()
@@ -0,0 +1,79 @@
+from tripple_b_gt import Player, ExtensiveForm
+
+def test_compiled_payoff():
+    # Setup
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('p1', ('A', 'B'))
+    p2 = Player('p2', ('X', 'Y'))
+    
+    payoff_data = {
+        'p1': {
+            'Revenue': {'case1': 100, 'case2': 90, 'case3': 80, 'case4': 70, 'case5': 60, 'case6': 50, 'case7': 40, 'case8': 30},
+            'Cost': {'case1': 20, 'case2': 20, 'case3': 20, 'case4': 20, 'case5': 10, 'case6': 10, 'case7': 10, 'case8': 10}
+        },
+        'p2': {
+            'Profit': {'case1': 10, 'case2': 10, 'case3': 10, 'case4': 10, 'case5': 5, 'case6': 5, 'case7': 5, 'case8': 5}
+        }
+    }
+    
+    # P2 uses a constant function, which must still broadcast over all cases
+    game = ExtensiveForm(nature, p1, p2, payoff_data, "Revenue - Cost", "3")
+    
+    # Vectorized table must agree with the per-case payoff()
+    cases = ['case1', 'case2', 'case3', 'case4', 'case5', 'case6', 'case7', 'case8']
+    p1_table, p2_table = game.payoff_table(cases)
+    for idx, case in enumerate(cases):
+        assert (p1_table[idx], p2_table[idx]) == game.payoff(case)
+    
+    assert list(p1_table) == [80, 70, 60, 50, 50, 40, 30, 20]
+    assert list(p2_table) == [3] * 8
+    
+    # Strategies space uses the same compiled functions
+    for s in game.strategies_space:
+        assert s['payoff'] == game.payoff(s['case'])
+    
+    # The function is parsed once per game
+    assert game.compile_payoff_functions() is game.compile_payoff_functions()
+    
+    print("Test Passed!")
+
+# Pure equilibria of the demo game: (regulator policy, firm responses, ro range).
+# The original sympy implementation gave the same list except that its 4-digit
+# Float coefficients put the first boundary at 0.451996527777778, printed
+# integral bounds from conditions as 1.0, and lost the second entry, an
+# equilibrium that holds only at the exact tie ro = 1.
+I, N = 'intervene', 'not intervene'
+R, NR = 'relocate', 'not relocate'
+DEMO_EQUILIBRIA = [
+    ((I, I), (R, NR), '(ro <= 0.452) & (0 <= ro)'),
+    ((I, N), (R, R), 'Eq(ro, 1)'),
+    ((I, N), (R, NR), 'Eq(ro, 0)'),
+    ((I, N), (NR, R), 'Eq(ro, 1)'),
+    ((N, I), (R, R), 'Eq(ro, 0)'),
+    ((N, I), (NR, R), 'Eq(ro, 0)'),
+    ((N, N), (R, R), '(0 <= ro) & (ro <= 1)'),
+    ((N, N), (NR, R), '(0 <= ro) & (ro <= 1)'),
+]
+
+def test_demo_game_output_is_pinned():
+    from tripple_b_gt import StrategicForm, DEMO_PAYOFF_DATA, demo_game
+    import copy
+    
+    def solve(game):
+        return [((eq['regulator']['stable'], eq['regulator']['unstable']),
+                 (eq['trippleB']['intervene'], eq['trippleB']['not intervene']),
+                 str(eq['ro_range'])) for eq in StrategicForm(game).find_nash_equilibria()]
+    
+    assert solve(demo_game()) == DEMO_EQUILIBRIA
+    
+    # The default payoff (sum of the variables) written out as functions,
+    # evaluated through the compiled float path, gives the same equilibria
+    game = demo_game()
+    explicit = ExtensiveForm(game.nature, game.player1, game.player2, copy.deepcopy(DEMO_PAYOFF_DATA),
+                             ' + '.join(DEMO_PAYOFF_DATA['p1']), ' + '.join(DEMO_PAYOFF_DATA['p2']))
+    assert solve(explicit) == DEMO_EQUILIBRIA
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_compiled_payoff()
+    test_demo_game_output_is_pinned()
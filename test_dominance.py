@@ -0,0 +1,84 @@
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm
+import random
+
+def random_game(seed, bias=0):
+    # bias is added to the regulator's payoff whenever it plays 'C'
+    # (case index % 3 == 2), which makes its other actions dominated
+    rng = random.Random(seed)
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('p1', ('A', 'B', 'C'))
+    p2 = Player('p2', ('X', 'Y'))
+    cases = ['case%d' % n for n in range(1, 13)]
+    payoff_data = {
+        'p1': {'v': {case: rng.randint(-20, 20) for case in cases}},
+        'p2': {'v': {case: rng.randint(-20, 20) + (bias if n % 3 == 2 else 0) for n, case in enumerate(cases)}}
+    }
+    return StrategicForm(ExtensiveForm(nature, p1, p2, payoff_data))
+
+def as_keys(equilibria):
+    return sorted((str(eq['p1']), str(eq['p2']), str(eq['ro_range'])) for eq in equilibria)
+
+def test_strict_elimination_keeps_equilibria():
+    total_eliminated = 0
+    for seed in range(6):
+        strategic_game = random_game(seed, bias=50 * (seed % 2))
+        full = strategic_game.find_nash_equilibria()
+        pruned = strategic_game.find_nash_equilibria(eliminate=True)
+        
+        assert as_keys(full) == as_keys(pruned), f"seed {seed}"
+        
+        report = strategic_game.elimination
+        total_eliminated += len(report['eliminated'])
+        for entry in report['eliminated']:
+            assert entry['round'] >= 1
+            assert entry['player'] in ('p1', 'p2')
+            removed = report['rows'] if entry['player'] == 'p1' else report['cols']
+            assert entry['index'] not in removed
+    
+    assert total_eliminated > 0
+    print("Test Passed!")
+
+def test_weak_elimination():
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('p1', ('A', 'B'))
+    p2 = Player('p2', ('X', 'Y'))
+    # P2 (the column player) is paid from the 'p1' data: action X is never
+    # better than Y and is strictly worse after A, so P2 strategies that
+    # play X after A are weakly dominated but not strictly dominated
+    payoff_data = {
+        'p1': {'v': {'case1': 1, 'case2': 2, 'case3': 1, 'case4': 2, 'case5': 3, 'case6': 2, 'case7': 3, 'case8': 2}},
+        'p2': {'v': {'case1': 1, 'case2': 1, 'case3': 1, 'case4': 1, 'case5': 1, 'case6': 1, 'case7': 1, 'case8': 1}}
+    }
+    strategic_game = StrategicForm(ExtensiveForm(nature, p1, p2, payoff_data))
+    
+    assert strategic_game.eliminate_dominated_strategies()['eliminated'] == []
+    report = strategic_game.eliminate_dominated_strategies(weak=True)
+    assert len(report['cols']) < 4
+    assert all(entry['strategy']['A'] == 'X' for entry in report['eliminated'] if entry['player'] == 'p2')
+    print("Test Passed!")
+
+def test_weak_elimination_needs_strict_gain_at_both_endpoints():
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('p1', ('A', 'B'))
+    p2 = Player('p2', ('X', 'Y'))
+    # After A, X ties with Y when stable and is worse when unstable; after B
+    # both actions pay the same. At ro = 0 every P2 strategy pays the same,
+    # so none is weakly dominated over the whole of [0, 1]
+    # (A, X) is case3 when stable and case1 when unstable, (A, Y) case7 / case5
+    tie_at_zero = {'case1': 1, 'case2': 1, 'case3': 1, 'case4': 1, 'case5': 2, 'case6': 1, 'case7': 1, 'case8': 1}
+    payoff_data = {'p1': {'v': tie_at_zero}, 'p2': {'v': {case: 1 for case in tie_at_zero}}}
+    strategic_game = StrategicForm(ExtensiveForm(nature, p1, p2, payoff_data))
+    assert strategic_game.eliminate_dominated_strategies(weak=True)['eliminated'] == []
+    
+    # X after A worse in both states: now dominated at every ro
+    payoff_data['p1']['v'] = dict(tie_at_zero, case7=2)
+    strategic_game = StrategicForm(ExtensiveForm(nature, p1, p2, payoff_data))
+    report = strategic_game.eliminate_dominated_strategies(weak=True)
+    assert report['eliminated']
+    assert all(entry['strategy']['A'] == 'X' for entry in report['eliminated'])
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_strict_elimination_keeps_equilibria()
+    test_weak_elimination()
+    test_weak_elimination_needs_strict_gain_at_both_endpoints()
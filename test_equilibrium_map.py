@@ -0,0 +1,68 @@
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm, DEMO_PAYOFF_DATA, demo_game, equilibrium_intervals
+import copy
+import random
+import numpy as np
+
+def random_game(rng):
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('regulator', tuple('ABC'))
+    p2 = Player('firm', tuple('XY'))
+    cases = ['case%d' % n for n in range(1, 13)]
+    payoff_data = {
+        'p1': {'a': {case: rng.randint(-4, 4) for case in cases}},
+        'p2': {'b': {case: rng.randint(-4, 4) for case in cases}}
+    }
+    return StrategicForm(ExtensiveForm(nature, p1, p2, payoff_data))
+
+def equilibria_at(lo, hi, is_equilibrium, ro):
+    return sorted((int(i), int(j)) for i, j in np.argwhere(is_equilibrium & (lo <= ro + 1e-9) & (hi >= ro - 1e-9)))
+
+def test_map_matches_pointwise_membership():
+    rng = random.Random(11)
+    for _ in range(50):
+        strategic_game = random_game(rng)
+        regions = strategic_game.equilibrium_map()
+        lo, hi, is_equilibrium = equilibrium_intervals(strategic_game.payoff_arrays())
+        
+        # Regions tile [0, 1] in order
+        assert regions[0]['ro_range'][0] == 0 and regions[0]['lo_closed']
+        assert regions[-1]['ro_range'][1] == 1 and regions[-1]['hi_closed']
+        for previous, region in zip(regions, regions[1:]):
+            assert previous['ro_range'][1] == region['ro_range'][0]
+            assert previous['hi_closed'] != region['lo_closed']
+            # Merged: neighbours always differ
+            assert previous['cells'] != region['cells']
+        
+        for region in regions:
+            a, b = region['ro_range']
+            if region['lo_closed']:
+                assert region['cells'] == equilibria_at(lo, hi, is_equilibrium, a)
+            if region['hi_closed']:
+                assert region['cells'] == equilibria_at(lo, hi, is_equilibrium, b)
+            if b > a:
+                assert region['cells'] == equilibria_at(lo, hi, is_equilibrium, (a + b) / 2)
+    print("Test Passed!")
+
+def test_demo_map():
+    regions = StrategicForm(demo_game()).equilibrium_map()
+    assert [(r['lo_closed'], r['hi_closed']) for r in regions] == [(True, True), (False, True), (False, False), (True, True)]
+    # Exact breakpoint, not the float 0.45200000000000007
+    assert regions[1]['ro_range'] == (0, 0.452)
+    assert regions[2]['cells'] == [(3, 0), (3, 2)]
+    print("Test Passed!")
+
+def test_equilibrium_map_endpoint():
+    from app import app
+    
+    response = app.test_client().post('/equilibrium_map', json={'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA)})
+    assert response.status_code == 200
+    regions = response.get_json()['regions']
+    assert [r['ro_range'] for r in regions] == ['ro = 0', '0 < ro <= 0.452', '0.452 < ro < 1', 'ro = 1']
+    assert [(r['lo'], r['hi']) for r in regions] == [(0, 0), (0, 0.452), (0.452, 1), (1, 1)]
+    assert len(regions[2]['equilibria']) == 2
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_map_matches_pointwise_membership()
+    test_demo_map()
+    test_equilibrium_map_endpoint()
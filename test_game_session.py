@@ -0,0 +1,81 @@
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm, equilibrium_intervals
+from game_session import GameSession
+import copy
+import random
+import numpy as np
+
+def random_payoff_data(rng, cases):
+    return {
+        'p1': {'a': {case: rng.randint(-10, 10) for case in cases}, 'b': {case: rng.randint(-10, 10) for case in cases}},
+        'p2': {'c': {case: rng.randint(-10, 10) for case in cases}}
+    }
+
+def test_incremental_updates_match_full_solve():
+    rng = random.Random(3)
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('regulator', ('A', 'B', 'C'))
+    p2 = Player('firm', ('X', 'Y'))
+    cases = ['case%d' % n for n in range(1, 13)]
+    payoff_data = random_payoff_data(rng, cases)
+    session = GameSession(ExtensiveForm(nature, p1, p2, copy.deepcopy(payoff_data), 'a - 2*b', 'c'))
+    total_cells = session.lo.size
+    
+    for step in range(20):
+        key = rng.choice(['p1', 'p2'])
+        var = rng.choice(list(payoff_data[key]))
+        case = rng.choice(cases)
+        value = rng.randint(-10, 10)
+        payoff_data[key][var][case] = value
+        report = session.update({key: {var: {case: value}}})
+        assert report['cells'] <= total_cells
+        
+        full = StrategicForm(ExtensiveForm(nature, p1, p2, copy.deepcopy(payoff_data), 'a - 2*b', 'c'))
+        lo, hi, is_equilibrium = equilibrium_intervals(full.payoff_arrays())
+        assert np.array_equal(session.is_equilibrium, is_equilibrium), f"step {step}"
+        assert np.allclose(session.lo[is_equilibrium], lo[is_equilibrium])
+        assert np.allclose(session.hi[is_equilibrium], hi[is_equilibrium])
+    
+    # Unchanged values recompute nothing
+    assert session.update({key: {var: {case: value}}}) == {'cases': 0, 'cells': 0}
+    
+    # A new variable falls back to a full rebuild
+    session.update({'p2': {'d': {'case1': 1}}})
+    assert 'd' in session.payoff_data['p2']
+    print("Test Passed!")
+
+def test_session_endpoints():
+    import app as app_module
+    from app import app
+    from tripple_b_gt import DEMO_PAYOFF_DATA
+    client = app.test_client()
+    created = client.post('/session', json={'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA)}).get_json()
+    assert created['status'] == 'success'
+    assert len(created['equilibria']) > 0
+    # Ranges read the same as on the nash route
+    nash = client.post('/calculate', json={'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA), 'method': 'nash'}).get_json()
+    assert ({eq['ro_range'] for eq in created['equilibria']}
+            <= {eq['ro_range'] for eq in nash['equilibria']} | {'(0 <= ro) & (ro <= 1)', 'Eq(ro, 1)'})
+    assert '(ro <= 0.452) & (0 <= ro)' in [eq['ro_range'] for eq in created['equilibria']]
+    
+    session_id = created['session_id']
+    updated = client.post(f'/session/{session_id}/update',
+                          json={'payoff_data': {'p2': {'reputation': {'case4': -30}}}}).get_json()
+    assert updated['status'] == 'success'
+    assert updated['changed']['cases'] == 1
+    
+    for junk in ({'p3': {'reputation': {'case4': 1}}}, {'p2': {'reputation': {'case99': 1}}},
+                 {'p2': {'new_variable': {'no such case': 1}}}):
+        rejected = client.post(f'/session/{session_id}/update', json={'payoff_data': junk})
+        assert rejected.status_code == 400
+    session = app_module.sessions.get(session_id)
+    assert set(session.payoff_data) == {'p1', 'p2'}
+    assert 'new_variable' not in session.payoff_data['p2']
+    assert 'case99' not in session.payoff_data['p2']['reputation']
+    
+    missing = client.post('/session/unknown/update', json={'payoff_data': {}})
+    assert missing.status_code == 404
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_incremental_updates_match_full_solve()
+    test_session_endpoints()
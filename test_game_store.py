@@ -0,0 +1,100 @@
+from tripple_b_gt import StrategicForm, DEMO_PAYOFF_DATA, demo_game
+from batch_solver import solve_extensive_form
+from game_store import GameStore
+from instrumentation import collect_timings
+import copy
+import numpy as np
+import tempfile
+
+def test_save_and_load_round_trip():
+    with tempfile.TemporaryDirectory() as directory:
+        store = GameStore(directory)
+        game = demo_game()
+        store.save('demo', game, metadata={'note': 'baseline'})
+        assert [header['name'] for header in store.list()] == ['demo']
+        assert 'payoff_data' not in store.list()[0]
+        
+        with collect_timings() as timings:
+            loaded, strategic_game = store.load('demo')
+            nash = solve_extensive_form(loaded, 'nash', strategic_game=strategic_game)
+            subgame_perfect = solve_extensive_form(loaded, 'subgame_perfect')
+        # Nothing was parsed, evaluated or rebuilt
+        assert not {'compile_payoff', 'payoff_tensor', 'strategic_arrays'} & set(timings.stages)
+        assert loaded._compiled_payoffs is None
+        
+        assert nash == solve_extensive_form(game, 'nash')
+        assert subgame_perfect == solve_extensive_form(game, 'subgame_perfect')
+        assert np.array_equal(loaded.payoff_tensor, game.payoff_tensor)
+        assert [dict(r) for r in loaded.strategies_space] == [dict(r) for r in game.strategies_space]
+        # The payoff functions still work when asked for
+        assert loaded.payoff('case3') == game.payoff('case3')
+        assert store.header('demo')['metadata'] == {'note': 'baseline'}
+    print("Test Passed!")
+
+def test_memory_mapped_results():
+    with tempfile.TemporaryDirectory() as directory:
+        store = GameStore(directory)
+        store.save('demo', demo_game())
+        sweep = StrategicForm(demo_game()).parameter_sweep([
+            {'player': 'p1', 'variable': 'carbon_tax', 'values': np.linspace(-20, 0, 5)}])
+        store.save_result('demo', 'lo', sweep['lo'])
+        loaded = store.load_result('demo', 'lo')
+        assert isinstance(loaded, np.memmap)
+        assert np.array_equal(loaded, sweep['lo'], equal_nan=True)
+        
+        bulk = store.create_result('demo', 'samples', (1000, 4))
+        bulk[:] = np.arange(4)
+        bulk.flush()
+        del bulk
+        assert store.load_result('demo', 'samples')[999].tolist() == [0, 1, 2, 3]
+        assert set(store.header('demo')['results']) == {'lo', 'samples'}
+        
+        try:
+            store.load_result('demo', 'missing')
+            assert False, "missing result should have raised KeyError"
+        except KeyError:
+            pass
+        try:
+            store.save('../escape', demo_game())
+            assert False, "path in game name should have raised ValueError"
+        except ValueError:
+            pass
+        store.delete('demo')
+        try:
+            store.load('demo')
+            assert False, "deleted game should have raised KeyError"
+        except KeyError:
+            pass
+    print("Test Passed!")
+
+def test_game_endpoints():
+    import app as app_module
+    
+    game_store = app_module._game_store
+    with tempfile.TemporaryDirectory() as directory:
+        app_module._game_store = GameStore(directory)
+        try:
+            client = app_module.app.test_client()
+            payload = {'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA), 'p1_name': 'stored regulator'}
+            saved = client.post('/games', json=dict(payload, name='demo-1')).get_json()
+            assert saved['status'] == 'success' and saved['game']['name'] == 'demo-1'
+            assert client.post('/games', json=dict(payload, name='bad name')).status_code == 400
+            assert [game['name'] for game in client.get('/games').get_json()['games']] == ['demo-1']
+            
+            loaded = client.get('/games/demo-1?method=nash').get_json()
+            expected = client.post('/calculate', json=dict(payload, method='nash')).get_json()
+            assert loaded['equilibria'] == expected['equilibria']
+            assert loaded['game']['p1_name'] == 'stored regulator'
+            assert loaded['game']['payoff_data'] == DEMO_PAYOFF_DATA
+            
+            assert client.get('/games/unknown').status_code == 404
+            assert client.delete('/games/demo-1').get_json()['status'] == 'success'
+            assert client.get('/games').get_json()['games'] == []
+        finally:
+            app_module._game_store = game_store
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_save_and_load_round_trip()
+    test_memory_mapped_results()
+    test_game_endpoints()
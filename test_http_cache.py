@@ -0,0 +1,90 @@
+from tripple_b_gt import DEMO_PAYOFF_DATA
+from game_store import GameStore
+import app as app_module
+import copy
+import gzip
+import json
+import tempfile
+
+def spec(**extra):
+    return dict({'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA), 'method': 'nash'}, **extra)
+
+def test_calculate_not_modified():
+    client = app_module.app.test_client()
+    first = client.post('/calculate', json=spec())
+    etag = first.headers['ETag']
+    assert first.status_code == 200 and etag.startswith('"')
+    
+    # Variable order does not matter; the answer comes before any cache lookup
+    reordered = spec()
+    reordered['payoff_data']['p1'] = dict(reversed(list(reordered['payoff_data']['p1'].items())))
+    def fail(key):
+        raise AssertionError("cache consulted")
+    app_module.result_cache.get = fail
+    try:
+        for tag in (etag, 'W/' + etag, etag[:-1] + '-gzip"', '"other", ' + etag):
+            repeat = client.post('/calculate', json=reordered, headers={'If-None-Match': tag})
+            assert repeat.status_code == 304 and repeat.data == b'' and repeat.headers['ETag'] == etag
+    finally:
+        del app_module.result_cache.get
+    
+    changed = spec()
+    changed['payoff_data']['p1']['risk']['case1'] = -49
+    other = client.post('/calculate', json=changed, headers={'If-None-Match': etag})
+    assert other.status_code == 200 and other.headers['ETag'] != etag
+    columnar = client.post('/calculate', json=spec(response_format='columnar'), headers={'If-None-Match': etag})
+    assert columnar.status_code == 200
+    timed = client.post('/calculate', json=spec(timings=True), headers={'If-None-Match': etag})
+    assert timed.status_code == 200 and 'ETag' not in timed.headers
+    assert 'ETag' not in client.post('/calculate', json={'method': 'x'}).headers
+    print("Test Passed!")
+
+def test_compression():
+    client = app_module.app.test_client()
+    plain = client.post('/calculate', json=spec())
+    compressed = client.post('/calculate', json=spec(), headers={'Accept-Encoding': 'gzip, deflate'})
+    assert 'Content-Encoding' not in plain.headers
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in compressed.headers['Vary']
+    assert len(compressed.data) < len(plain.data)
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+    assert compressed.headers['ETag'] == plain.headers['ETag'][:-1] + '-gzip"'
+    
+    revalidated = client.post('/calculate', json=spec(), headers={'Accept-Encoding': 'gzip',
+                                                                  'If-None-Match': compressed.headers['ETag']})
+    assert revalidated.status_code == 304
+    
+    small = client.get('/cache/stats', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in small.headers
+    refused = client.post('/calculate', json=spec(), headers={'Accept-Encoding': 'gzip;q=0'})
+    assert 'Content-Encoding' not in refused.headers
+    print("Test Passed!")
+
+def test_result_routes_not_modified():
+    game_store = app_module._game_store
+    with tempfile.TemporaryDirectory() as directory:
+        app_module._game_store = GameStore(directory)
+        try:
+            client = app_module.app.test_client()
+            requests = [
+                ('/equilibrium_map', spec()),
+                ('/sweep', spec(sweeps=[{'player': 'p1', 'variable': 'carbon_tax', 'values': [-12, 0]}])),
+                ('/robustness', spec(uncertain=[{'player': 'p2', 'variable': 'national_wealth', 'distribution': 'normal',
+                                                 'mean': 40, 'std': 8}], samples=100))
+            ]
+            for url, body in requests:
+                etag = client.post(url, json=body).headers['ETag']
+                assert client.post(url, json=body, headers={'If-None-Match': etag}).status_code == 304
+            
+            assert client.post('/games', json=spec(name='demo')).status_code == 200
+            etag = client.get('/games/demo').headers['ETag']
+            assert client.get('/games/demo', headers={'If-None-Match': etag}).status_code == 304
+            assert client.get('/games/demo?method=nash', headers={'If-None-Match': etag}).status_code == 200
+        finally:
+            app_module._game_store = game_store
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_calculate_not_modified()
+    test_compression()
+    test_result_routes_not_modified()
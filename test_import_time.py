@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+# Generous ceiling for a cold import; sympy alone takes longer than this
+IMPORT_TIME_LIMIT = 1.0
+
+def measure_import(module):
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - start, 'sympy' in sys.modules)\n"
+    )
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    elapsed, sympy_loaded = output.split()
+    return float(elapsed), sympy_loaded == 'True'
+
+def test_import_is_side_effect_free():
+    output = subprocess.run([sys.executable, '-c', 'import tripple_b_gt'], capture_output=True, text=True, check=True).stdout
+    assert output == ""
+    print("Test Passed!")
+
+def test_import_time():
+    elapsed, sympy_loaded = measure_import('tripple_b_gt')
+    print(f"import tripple_b_gt: {elapsed:.3f}s")
+    assert not sympy_loaded, "sympy must be imported lazily"
+    assert elapsed < IMPORT_TIME_LIMIT, f"import took {elapsed:.3f}s"
+    
+    # Web workers import the app, which must not pull in sympy either
+    _, sympy_loaded = measure_import('app')
+    assert not sympy_loaded
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_import_is_side_effect_free()
+    test_import_time()
@@ -0,0 +1,55 @@
+from tripple_b_gt import StrategicForm, demo_game, DEMO_PAYOFF_DATA
+from instrumentation import Histogram, collect_timings, current_timings
+import copy
+
+def test_collects_stages_and_counters():
+    assert current_timings() is None
+    with collect_timings() as timings:
+        game = demo_game()
+        equilibria = StrategicForm(game).find_nash_equilibria()
+        game.solve_subgame_perfect()
+    assert current_timings() is None
+    assert {'compile_payoff', 'payoff_tensor', 'strategies_space', 'strategic_arrays',
+            'nash_equilibria', 'subgame_perfect'} <= set(timings.stages)
+    assert timings.counters == {'expressions_evaluated': 16, 'cells_solved': 16, 'equilibria_found': len(equilibria)}
+
+    # Stopping early only counts the cells actually tested
+    with collect_timings() as timings:
+        first = StrategicForm(game).find_nash_equilibria(limit=1)
+    assert first == equilibria[:1]
+    assert timings.counters['equilibria_found'] == 1 and timings.counters['cells_solved'] < 16
+    print("Test Passed!")
+
+def test_histogram_render():
+    histogram = Histogram('solve_seconds', 'Solve time.', label='stage', buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value, 'nash')
+    lines = histogram.render().split('\n')
+    assert 'solve_seconds_bucket{stage="nash",le="0.1"} 1' in lines
+    assert 'solve_seconds_bucket{stage="nash",le="1.0"} 3' in lines
+    assert 'solve_seconds_bucket{stage="nash",le="+Inf"} 4' in lines
+    assert 'solve_seconds_count{stage="nash"} 4' in lines
+    print("Test Passed!")
+
+def test_timings_in_response_and_metrics():
+    from app import app
+
+    client = app.test_client()
+    payload = {'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA), 'p1_name': 'instrumented'}
+    plain = client.post('/calculate', json=payload).get_json()
+    assert 'timings' not in plain
+    timed = client.post('/calculate', json=dict(payload, timings=True)).get_json()
+    assert timed['equilibria'] == plain['equilibria']
+    assert timed['timings']['counters']['cache_hits'] == 1
+
+    text = client.get('/metrics').get_data(as_text=True)
+    assert '# TYPE game_solver_request_seconds histogram' in text
+    assert 'game_solver_request_seconds_count{endpoint="calculate"}' in text
+    assert 'game_solver_stage_seconds_bucket{stage="solve",le="+Inf"}' in text
+    assert 'game_solver_events_total{counter="cache_hits"}' in text
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_collects_stages_and_counters()
+    test_histogram_render()
+    test_timings_in_response_and_metrics()
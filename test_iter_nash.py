@@ -0,0 +1,77 @@
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm, demo_game, equilibrium_intervals
+import random
+import numpy as np
+
+def random_game(rng):
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('regulator', tuple('ABC'))
+    p2 = Player('firm', tuple('XY'))
+    cases = ['case%d' % n for n in range(1, 13)]
+    payoff_data = {
+        'p1': {'a': {case: rng.randint(-5, 5) for case in cases}},
+        'p2': {'b': {case: rng.randint(-5, 5) for case in cases}}
+    }
+    return StrategicForm(ExtensiveForm(nature, p1, p2, payoff_data))
+
+def profiles(strategic_game, equilibria):
+    p1_strats = strategic_game.pure_strategies['regulator']
+    p2_strats = strategic_game.pure_strategies['firm']
+    return [(p1_strats.index(eq['regulator']), p2_strats.index(eq['firm'])) for eq in equilibria]
+
+def test_list_api_wraps_iterator():
+    strategic_game = StrategicForm(demo_game())
+    listed = strategic_game.find_nash_equilibria()
+    iterated = strategic_game.iter_nash_equilibria()
+    assert not isinstance(iterated, list)
+    assert list(iterated) == listed
+    assert strategic_game.find_nash_equilibria(limit=2) == listed[:2]
+    assert strategic_game.find_nash_equilibria(limit=0) == []
+    print("Test Passed!")
+
+def test_heuristic_order_and_sub_interval():
+    rng = random.Random(5)
+    for _ in range(30):
+        strategic_game = random_game(rng)
+        full = strategic_game.find_nash_equilibria(exact=False)
+        ordered = strategic_game.find_nash_equilibria(exact=False, best_response_first=True)
+        assert sorted(profiles(strategic_game, ordered)) == sorted(profiles(strategic_game, full))
+        
+        lo, hi, is_equilibrium = equilibrium_intervals(strategic_game.payoff_arrays())
+        restricted = strategic_game.find_nash_equilibria(exact=False, ro_interval=(0.3, 0.6))
+        expected = [(i, j) for i, j in np.argwhere(is_equilibrium) if lo[i, j] <= 0.6 and hi[i, j] >= 0.3]
+        assert sorted(profiles(strategic_game, restricted)) == expected
+    print("Test Passed!")
+
+def test_best_response_order_puts_equilibria_first():
+    strategic_game = StrategicForm(demo_game())
+    rows, cols = np.arange(4), np.arange(4)
+    order = strategic_game.best_response_order(rows, cols)
+    assert sorted(order) == [(i, j) for i in range(4) for j in range(4)]
+    lo, hi, is_equilibrium = equilibrium_intervals(strategic_game.payoff_arrays())
+    # Every cell that is a mutual best response at the midpoint is tested
+    # before any cell that is never an equilibrium
+    mid = {(i, j) for i, j in np.argwhere(is_equilibrium) if lo[i, j] <= 0.5 <= hi[i, j]}
+    never = {(i, j) for i, j in np.argwhere(~is_equilibrium)}
+    positions = {cell: k for k, cell in enumerate(order)}
+    assert mid and max(positions[cell] for cell in mid) < min(positions[cell] for cell in never)
+    print("Test Passed!")
+
+def test_sub_interval_is_clipped_to_unit_interval():
+    strategic_game = StrategicForm(demo_game())
+    clipped = strategic_game.find_nash_equilibria(exact=False, ro_interval=(-1, 2))
+    assert clipped == strategic_game.find_nash_equilibria(exact=False)
+    assert (strategic_game.find_nash_equilibria(ro_interval=(0.5, 3))
+            == strategic_game.find_nash_equilibria(ro_interval=(0.5, 1)))
+    for bad in ((0.6, 0.3), (1.5, 2), (-2, -1)):
+        try:
+            strategic_game.find_nash_equilibria(ro_interval=bad)
+            assert False, f"ro_interval={bad} should have raised ValueError"
+        except ValueError as e:
+            assert "does not overlap" in str(e)
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_list_api_wraps_iterator()
+    test_heuristic_order_and_sub_interval()
+    test_best_response_order_puts_equilibria_first()
+    test_sub_interval_is_clipped_to_unit_interval()
@@ -0,0 +1,88 @@
+from tripple_b_gt import DEMO_PAYOFF_DATA
+from batch_solver import parse_game_spec, solve_game_spec
+from job_queue import JobQueue
+import copy
+import json
+
+def demo_spec(method='nash'):
+    return {'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA), 'method': method}
+
+def follow(job):
+    # Read the event log until the job has finished
+    events = []
+    while True:
+        new = job.wait_events(len(events), timeout=30)
+        events.extend(new)
+        if job.status in ('done', 'failed', 'cancelled') and len(events) == len(job.events):
+            return events
+
+def test_job_streams_progress_and_result():
+    game = parse_game_spec(demo_spec())
+    finished = []
+    queue = JobQueue(max_workers=2, on_done=finished.append)
+    try:
+        job = queue.submit(game)
+        events = follow(job)
+    finally:
+        queue.shutdown()
+
+    expected = solve_game_spec(game)
+    names = [event['event'] for event in events]
+    assert names[0] == 'stage' and names[-1] == 'done'
+    assert [e['data'] for e in events if e['event'] == 'equilibrium'] == expected['equilibria']
+    assert [e['id'] for e in events] == list(range(len(events)))
+    assert job.snapshot()['result'] == expected
+    assert finished == [job]
+    print("Test Passed!")
+
+def test_cancel_and_time_limit():
+    game = parse_game_spec(demo_spec())
+    queue = JobQueue(max_workers=1, time_limit=0)
+    try:
+        first = queue.submit(game)
+        second = queue.submit(game)
+        assert queue.cancel(second.id)
+        assert not queue.cancel(second.id)
+        follow(first)
+    finally:
+        queue.shutdown()
+    assert second.status == 'cancelled' and second.process is None
+    assert first.status == 'failed' and first.error == 'Time limit exceeded'
+    print("Test Passed!")
+
+def test_job_endpoints():
+    from app import app
+
+    client = app.test_client()
+    submitted = client.post('/jobs', json=demo_spec('subgame_perfect'))
+    assert submitted.status_code == 202
+    job_id = submitted.get_json()['job_id']
+
+    stream = client.get(f'/jobs/{job_id}/events')
+    assert stream.mimetype == 'text/event-stream'
+    blocks = [block for block in stream.get_data(as_text=True).split('\n\n') if block.startswith('id:')]
+    last = dict(line.split(': ', 1) for line in blocks[-1].split('\n'))
+    assert last['event'] == 'done'
+    assert json.loads(last['data']) == client.post('/calculate', json=demo_spec('subgame_perfect')).get_json()
+
+    status = client.get(f'/jobs/{job_id}').get_json()
+    assert status['job_status'] == 'done' and status['result']['status'] == 'success'
+    # Resuming after the last event returns nothing new
+    resumed = client.get(f'/jobs/{job_id}/events', headers={'Last-Event-ID': last['id']})
+    assert 'id:' not in resumed.get_data(as_text=True)
+    # An id we never sent replays the whole stream instead of failing
+    replayed = client.get(f'/jobs/{job_id}/events', headers={'Last-Event-ID': 'not-a-number'})
+    assert replayed.status_code == 200
+    assert replayed.get_data(as_text=True).count('id:') == len(blocks)
+
+    # The result is cached now, so a repeat submission finishes immediately
+    repeat = client.post('/jobs', json=demo_spec('subgame_perfect')).get_json()
+    assert repeat['job_status'] == 'done'
+    assert client.get('/jobs/unknown').status_code == 404
+    assert client.delete(f'/jobs/{job_id}').get_json()['job_status'] == 'done'
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_job_streams_progress_and_result()
+    test_cancel_and_time_limit()
+    test_job_endpoints()
@@ -0,0 +1,123 @@
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm, LinearIntervalSolver, demo_game
+from fractions import Fraction
+import random
+import sympy
+
+def reference_equilibria(strategic_game):
+    # The original CAS path: one reduce_inequalities call per cell
+    ro = sympy.symbols('ro')
+    matrix = strategic_game.strategic_form_payoff_function()
+    results = {}
+    for i in range(len(matrix)):
+        for j in range(len(matrix[0])):
+            conditions = [ro >= 0, ro <= 1]
+            cell = matrix[i][j]
+            eu_curr = ro * cell[0] + (1 - ro) * cell[1]
+            for k in range(len(matrix)):
+                if k != i:
+                    conditions.append(eu_curr >= ro * matrix[k][j][0] + (1 - ro) * matrix[k][j][1])
+            for k in range(len(matrix[0])):
+                if k != j:
+                    conditions.append(cell[2] >= matrix[i][k][2])
+            solution = sympy.reduce_inequalities(conditions, ro)
+            if solution != False:
+                results[(i, j)] = solution
+    return results
+
+def integral_endpoints(relational):
+    # reduce_inequalities output with integral Float endpoints written as
+    # Integers, as LinearIntervalSolver.to_relational does
+    return relational.xreplace({value: sympy.Integer(int(value)) for value in relational.atoms(sympy.Float)
+                                if float(value).is_integer()})
+
+def random_game(seed):
+    rng = random.Random(seed)
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('p1', ('A', 'B'))
+    p2 = Player('p2', ('X', 'Y'))
+    cases = ['case%d' % n for n in range(1, 9)]
+    payoff_data = {
+        'p1': {'v': {case: rng.randint(-20, 20) for case in cases}},
+        'p2': {'v': {case: rng.randint(-20, 20) for case in cases}}
+    }
+    return StrategicForm(ExtensiveForm(nature, p1, p2, payoff_data))
+
+def test_solver_intervals():
+    solver = LinearIntervalSolver(exact=True)
+    ro = sympy.symbols('ro')
+    
+    # ro >= 1/4 and ro <= 3/4
+    assert solver.solve([(4, -1), (-4, 3)]) == (Fraction(1, 4), Fraction(3, 4))
+    # Degenerate point
+    assert solver.solve([(1, -0.5), (-1, 0.5)]) == (Fraction(1, 2), Fraction(1, 2))
+    assert solver.to_relational((0, 0), ro) == sympy.Eq(ro, 0)
+    # Empty: ro >= 2 is outside [0, 1]
+    assert solver.solve([(1, -2)]) is None
+    # Constant conditions
+    assert solver.solve([(0, 1)]) == (0, 1)
+    assert solver.solve([(0, -1)]) is None
+    
+    # Float mode absorbs round-off in the slope
+    assert LinearIntervalSolver().solve([(1e-12, 0.0)]) == (0, 1)
+    print("Test Passed!")
+
+def test_cells_match_reduce_inequalities():
+    # The solver against reduce_inequalities on the same exact coefficients
+    ro = sympy.symbols('ro')
+    solver = LinearIntervalSolver(exact=True)
+    cells = [
+        [(4, -1), (-4, 3)],                      # 1/4 <= ro <= 3/4
+        [(1, -0.5), (-1, 0.5)],                  # the point ro = 1/2
+        [(-28.8, 13.02), (0.75, 0.0)],           # 0 <= ro <= 0.452...
+        [(2.5, -2.5), (-0.01, 0.01)],            # the point ro = 1
+        [(-45.0, 20.34), (-24.66, 5.0)],
+        [(1, -2)],                               # empty
+    ]
+    # ... and every cell of the demo game
+    arrays = StrategicForm(demo_game()).payoff_arrays()
+    rows, cols = arrays['p1_const'].shape
+    for i in range(rows):
+        for j in range(cols):
+            cells.append([(arrays['p1_ro'][i, j] - arrays['p1_ro'][k, j], arrays['p1_const'][i, j] - arrays['p1_const'][k, j])
+                          for k in range(rows) if k != i]
+                         + [(arrays['p2_ro'][i, j] - arrays['p2_ro'][i, k], arrays['p2_const'][i, j] - arrays['p2_const'][i, k])
+                            for k in range(cols) if k != j])
+    
+    points = 0
+    for bounds in cells:
+        conditions = [ro >= 0, ro <= 1] + [sympy.Rational(repr(float(a))) * ro + sympy.Rational(repr(float(b))) >= 0
+                                           for a, b in bounds]
+        expected = sympy.reduce_inequalities(conditions, ro)
+        interval = solver.solve(bounds)
+        if interval is None:
+            assert expected == sympy.false
+            continue
+        lo, hi = (sympy.Rational(value.numerator, value.denominator) for value in map(Fraction, interval))
+        assert expected.as_set() == sympy.Interval(lo, hi)
+        points += lo == hi
+    assert points >= 2
+    print("Test Passed!")
+
+def test_matches_reduce_inequalities():
+    for seed in range(5):
+        strategic_game = random_game(seed)
+        expected = reference_equilibria(strategic_game)
+        
+        p1_strats = strategic_game.pure_strategies['p1']
+        p2_strats = strategic_game.pure_strategies['p2']
+        
+        for exact in (True, False):
+            found = {}
+            for eq in strategic_game.find_nash_equilibria(exact=exact):
+                found[(p1_strats.index(eq['p1']), p2_strats.index(eq['p2']))] = eq['ro_range']
+            
+            assert set(found) == set(expected), f"seed {seed}, exact={exact}"
+            if exact:
+                for cell in expected:
+                    assert str(found[cell]) == str(integral_endpoints(expected[cell]))
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_solver_intervals()
+    test_cells_match_reduce_inequalities()
+    test_matches_reduce_inequalities()
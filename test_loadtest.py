@@ -0,0 +1,44 @@
+from loadtest import loadtest, compare, run_load, request_mix, encode
+import copy
+import json
+
+def test_inprocess_and_compare():
+    report = loadtest('inprocess', 'demo', concurrency=(1, 3), requests=30)
+    assert [entry['name'] for entry in report['results']] == ['inprocess-demo-c1', 'inprocess-demo-c3']
+    for entry in report['results']:
+        assert entry['requests'] == 30 and entry['errors'] == 0 and entry['throughput'] > 0
+        latency = entry['latency_ms']
+        assert 0 < latency['p50'] <= latency['p95'] <= latency['p99'] <= latency['max']
+        assert sum(e['requests'] for e in entry['endpoints'].values()) == 30
+    assert compare(report, report) == []
+    
+    worse = copy.deepcopy(report)
+    worse['results'][0]['throughput'] /= 3
+    worse['results'][0]['latency_ms']['p95'] = 1000.0
+    worse['results'][0]['error_rate'] = 0.5
+    assert {r['metric'] for r in compare(worse, report)} == {'throughput', 'p95_ms', 'error_rate'}
+    print("Test Passed!")
+
+def test_errors_and_unique_requests():
+    sent = []
+    def send(method, path, body):
+        sent.append(body)
+        return 500 if b'subgame_perfect' in body else 200
+    summary = run_load(send, request_mix('demo'), concurrency=2, requests=50, unique=True)
+    assert 0 < summary['errors'] < 50 and summary['error_rate'] == summary['errors'] / 50
+    # Warm-up plus the run, every body distinct
+    assert len(sent) == 53 and len(set(sent)) == 53
+    assert json.loads(encode(request_mix('demo')[0][3], 'x'))['payoff_data']['p1']['nonce_x'] == {'case1': 0}
+    print("Test Passed!")
+
+def test_local_server():
+    report = loadtest('server', 'mixed', concurrency=(4,), servers=[(2, 2)], requests=20)
+    entry, = report['results']
+    assert entry['name'] == 'server-mixed-w2-t2-c4'
+    assert entry['requests'] == 20 and entry['errors'] == 0
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_inprocess_and_compare()
+    test_errors_and_unique_requests()
+    test_local_server()
@@ -0,0 +1,89 @@
+from tripple_b_gt import StrategicForm, demo_game, equilibrium_intervals
+from benchmark import synthetic_game
+from mixed_equilibria import (support_enumeration, lemke_howson, lemke_howson_all,
+                              find_mixed_equilibria, is_degenerate)
+import numpy as np
+
+def assert_equilibrium(A, B, equilibrium):
+    p1_mix, p2_mix, p1_value, p2_value = equilibrium
+    assert np.isclose(p1_mix.sum(), 1) and np.isclose(p2_mix.sum(), 1)
+    assert np.isclose(p1_mix @ A @ p2_mix, p1_value) and np.isclose(p1_mix @ B @ p2_mix, p2_value)
+    # No pure deviation does better
+    assert np.all(A @ p2_mix <= p1_value + 1e-7)
+    assert np.all(p1_mix @ B <= p2_value + 1e-7)
+
+def test_known_games():
+    pennies = np.array([[1.0, -1.0], [-1.0, 1.0]])
+    for solve in (support_enumeration, lemke_howson_all):
+        (p1_mix, p2_mix, value, _), = solve(pennies, -pennies)
+        assert np.allclose(p1_mix, 0.5) and np.allclose(p2_mix, 0.5) and np.isclose(value, 0)
+
+    A = np.array([[3.0, 0.0], [0.0, 2.0]])
+    B = np.array([[2.0, 0.0], [0.0, 3.0]])
+    mixes = {(tuple(np.round(p, 6)), tuple(np.round(q, 6))) for p, q, _, _ in support_enumeration(A, B)}
+    assert mixes == {((1, 0), (1, 0)), ((0, 1), (0, 1)), ((0.6, 0.4), (0.4, 0.6))}
+    print("Test Passed!")
+
+def test_random_games():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        m, n = rng.integers(2, 6, 2)
+        A = rng.integers(-5, 5, (m, n)).astype(float)
+        B = rng.integers(-5, 5, (m, n)).astype(float)
+        found = support_enumeration(A, B)
+        for equilibrium in found + lemke_howson_all(A, B):
+            assert_equilibrium(A, B, equilibrium)
+        # Batched solve over a stack of games matches the single solve
+        stacked = support_enumeration(np.stack([A, A]), np.stack([B, B]))
+        assert len(stacked) == 2 and len(stacked[1]) == len(found)
+    print("Test Passed!")
+
+def test_degenerate_game():
+    # P2 is indifferent everywhere; every path still terminates
+    A = np.array([[1.0, 1.0], [0.0, 0.0]])
+    B = np.ones((2, 2))
+    for label in range(4):
+        assert_equilibrium(A, B, lemke_howson(A, B, initial_label=label))
+    found = support_enumeration(A, B)
+    assert len(found) == 2
+    assert is_degenerate(A, B, found)
+    pennies = np.array([[1.0, -1.0], [-1.0, 1.0]])
+    assert not is_degenerate(pennies, -pennies, support_enumeration(pennies, -pennies))
+    # A pure strategy with two best responses is enough, whatever was found
+    A = np.array([[2.0, 0.0], [2.0, 1.0]])
+    assert is_degenerate(A, A.T, [])
+    print("Test Passed!")
+
+def test_strategic_form_pure_supports_match_pure_equilibria():
+    strategic_game = StrategicForm(demo_game())
+    ro_grid = np.linspace(0.05, 0.95, 7)
+    lo, hi, is_equilibrium = equilibrium_intervals(strategic_game.payoff_arrays())
+    p1_strats = strategic_game.pure_strategies['regulator']
+    p2_strats = strategic_game.pure_strategies['trippleB']
+    A, B = strategic_game.payoff_matrices(ro_grid)
+    for ro, result, a, b in zip(ro_grid, find_mixed_equilibria(strategic_game, ro_grid), A, B):
+        # Firm strategies that differ only after the other regulator action
+        # tie, so the demo form is degenerate and the list is not the full set
+        assert result['degenerate'] and not result['complete']
+        pure = set()
+        for eq in result['equilibria']:
+            assert_equilibrium(a, b, (eq['p1_mix'], eq['p2_mix'], eq['p1_payoff'], eq['p2_payoff']))
+            if len(eq['p1_support']) == 1 and len(eq['p2_support']) == 1:
+                pure.add((p1_strats.index(eq['p1_support'][0][0]), p2_strats.index(eq['p2_support'][0][0])))
+        expected = {(i, j) for i, j in np.argwhere(is_equilibrium) if lo[i, j] <= ro <= hi[i, j]}
+        assert pure == expected
+
+    single = find_mixed_equilibria(strategic_game, 0.3, method='lemke_howson')
+    assert single['equilibria'] and all(isinstance(eq['p1_payoff'], float) for eq in single['equilibria'])
+    assert not single['complete']
+    
+    # A firm with one action leaves nothing to tie, so the list is complete
+    result = find_mixed_equilibria(StrategicForm(synthetic_game(0, 2, 2, 1, 3, 0)), 0.3)
+    assert not result['degenerate'] and result['complete'] and len(result['equilibria']) == 1
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_known_games()
+    test_random_games()
+    test_degenerate_game()
+    test_strategic_form_pure_supports_match_pure_equilibria()
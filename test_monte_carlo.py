@@ -0,0 +1,120 @@
+from tripple_b_gt import ExtensiveForm, StrategicForm, DEMO_PAYOFF_DATA, demo_game, equilibrium_intervals
+import copy
+import numpy as np
+
+def test_matches_pointwise_solves():
+    game = demo_game()
+    strategic_game = StrategicForm(game)
+    uncertain = [
+        {'player': 'p2', 'variable': 'national_wealth', 'distribution': 'empirical', 'samples': [30, 45.42]},
+        {'player': 'p1', 'variable': 'risk', 'distribution': 'uniform', 'low': -3, 'high': 3,
+         'combine': 'add', 'cases': ['case1', 'case2'], 'per_case': True}
+    ]
+    result = strategic_game.monte_carlo(uncertain, samples=40, seed=1, batch_size=7)
+    assert result['frequency'].shape == (4, 4)
+    
+    # Replay the same draws one sample at a time
+    rng = np.random.default_rng(1)
+    hits = np.zeros((4, 4))
+    lo_values = {}
+    for start in range(0, 40, 7):
+        size = min(7, 40 - start)
+        wealth = rng.choice([30.0, 45.42], (size, 1))
+        risk = rng.uniform(-3, 3, (size, 2))
+        for k in range(size):
+            payoff_data = copy.deepcopy(DEMO_PAYOFF_DATA)
+            for case in payoff_data['p2']['national_wealth']:
+                payoff_data['p2']['national_wealth'][case] = wealth[k, 0]
+            payoff_data['p1']['risk']['case1'] += risk[k, 0]
+            payoff_data['p1']['risk']['case2'] += risk[k, 1]
+            point = StrategicForm(ExtensiveForm(game.nature, game.player1, game.player2, payoff_data))
+            lo, hi, is_equilibrium = equilibrium_intervals(point.payoff_arrays())
+            hits += is_equilibrium
+            for i, j in np.argwhere(is_equilibrium):
+                lo_values.setdefault((i, j), []).append(lo[i, j])
+    
+    assert np.allclose(result['frequency'], hits / 40)
+    for (i, j), values in lo_values.items():
+        assert np.isclose(result['lo_mean'][i, j], np.mean(values))
+        assert np.isclose(result['lo_quantiles'][2, i, j], np.median(values))
+        assert np.isclose(result['lo_min'][i, j], min(values))
+    assert np.isnan(result['lo_mean'][hits == 0]).all()
+    print("Test Passed!")
+
+def test_seeded_and_validated():
+    strategic_game = StrategicForm(demo_game())
+    uncertain = [{'player': 'p2', 'variable': 'reputation', 'distribution': 'triangular',
+                  'low': -6, 'mode': -2, 'high': 2, 'per_case': True}]
+    first = strategic_game.monte_carlo(uncertain, samples=500, seed=3)
+    second = strategic_game.monte_carlo(uncertain, samples=500, seed=3, batch_size=64)
+    assert np.array_equal(first['frequency'], second['frequency'])
+    assert np.allclose(first['hi_mean'], second['hi_mean'], equal_nan=True)
+    
+    for bad in ({'player': 'p2', 'variable': 'missing', 'distribution': 'normal', 'mean': 0, 'std': 1},
+                {'player': 'p2', 'variable': 'reputation', 'distribution': 'cauchy'},
+                {'player': 'p2', 'variable': 'reputation', 'distribution': 'normal', 'mean': 0}):
+        try:
+            strategic_game.monte_carlo([bad], samples=10)
+            assert False, f"{bad} should have raised ValueError"
+        except ValueError:
+            pass
+    print("Test Passed!")
+
+def test_robustness_endpoint():
+    from app import app
+    
+    client = app.test_client()
+    payload = {
+        'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA),
+        'uncertain': [{'player': 'p2', 'variable': 'national_wealth', 'distribution': 'normal', 'mean': 40, 'std': 8}],
+        'samples': 20000,
+        'seed': 7
+    }
+    result = client.post('/robustness', json=payload).get_json()
+    assert result['status'] == 'success' and result['samples'] == 20000
+    frequencies = [profile['frequency'] for profile in result['profiles']]
+    assert frequencies == sorted(frequencies, reverse=True) and 0 < frequencies[-1] <= frequencies[0] <= 1
+    assert set(result['profiles'][0]['lo']['quantiles']) == {'5', '25', '50', '75', '95'}
+    
+    assert client.post('/robustness', json=dict(payload, samples=10**7)).status_code == 400
+    assert client.post('/robustness', json=dict(payload, uncertain=[])).status_code == 400
+    print("Test Passed!")
+
+def test_large_robustness_runs_as_job():
+    import app as app_module
+    from batch_solver import parse_game_spec, game_spec_key
+    
+    client = app_module.app.test_client()
+    payload = {
+        'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA),
+        'uncertain': [{'player': 'p2', 'variable': 'national_wealth', 'distribution': 'normal', 'mean': 40, 'std': 8}],
+        'samples': 1000,
+        'seed': 7
+    }
+    expected = client.post('/robustness', json=payload).get_json()
+    app_module.result_cache.clear()
+    
+    # 1000 samples x 16 cells is over this limit
+    sync_work = app_module.ROBUSTNESS_SYNC_WORK
+    app_module.ROBUSTNESS_SYNC_WORK = 1000 * 16 - 1
+    try:
+        response = client.post('/robustness', json=payload)
+    finally:
+        app_module.ROBUSTNESS_SYNC_WORK = sync_work
+    assert response.status_code == 202 and 'ETag' not in response.headers
+    job = app_module.job_queue.get(response.get_json()['job_id'])
+    events = []
+    while job.status not in ('done', 'failed', 'cancelled') or len(events) < len(job.events):
+        events.extend(job.wait_events(len(events), timeout=30))
+    assert [e['data'] for e in events if e['event'] == 'stage'] == ['build', 'monte_carlo']
+    assert job.status == 'done' and job.result == expected
+    assert client.get(f"/jobs/{job.id}").get_json()['result'] == expected
+    # The Monte Carlo result is not mistaken for the game's /calculate answer
+    assert app_module.result_cache.get(game_spec_key(parse_game_spec(payload))) is None
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_matches_pointwise_solves()
+    test_seeded_and_validated()
+    test_robustness_endpoint()
+    test_large_robustness_runs_as_job()
@@ -0,0 +1,43 @@
+import tripple_b_gt
+from tripple_b_gt import StrategicForm
+from benchmark import synthetic_game
+from instrumentation import collect_timings
+
+def test_parallel_matches_serial():
+    # Drop the size threshold so this small game takes the parallel path
+    min_cells = tripple_b_gt.PARALLEL_MIN_CELLS
+    tripple_b_gt.PARALLEL_MIN_CELLS = 0
+    try:
+        strategic_game = StrategicForm(synthetic_game(3, 2, 3, 2, 3, 3))
+        for exact in (True, False):
+            serial = strategic_game.find_nash_equilibria(exact=exact)
+            assert serial
+            assert strategic_game.find_nash_equilibria(exact=exact, workers=2) == serial
+            assert strategic_game.find_nash_equilibria(exact=exact, workers=2, chunk_rows=1) == serial
+        
+        assert strategic_game.find_nash_equilibria(workers=2, limit=2, chunk_rows=1) == serial[:2]
+        assert (strategic_game.find_nash_equilibria(workers=2, eliminate=True, ro_interval=(0.2, 0.6))
+                == strategic_game.find_nash_equilibria(eliminate=True, ro_interval=(0.2, 0.6)))
+        
+        with collect_timings() as timings:
+            strategic_game.find_nash_equilibria(workers=2)
+        assert timings.counters['cells_solved'] == 9 * 8
+    finally:
+        tripple_b_gt.PARALLEL_MIN_CELLS = min_cells
+    print("Test Passed!")
+
+def test_small_games_stay_serial():
+    def fail(*args, **kwargs):
+        raise AssertionError("parallel search used")
+    parallel_cell_outcomes = StrategicForm.parallel_cell_outcomes
+    StrategicForm.parallel_cell_outcomes = fail
+    try:
+        strategic_game = StrategicForm(synthetic_game(3, 2, 3, 2, 3, 3))
+        assert strategic_game.find_nash_equilibria(workers=4) == strategic_game.find_nash_equilibria()
+    finally:
+        StrategicForm.parallel_cell_outcomes = parallel_cell_outcomes
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_parallel_matches_serial()
+    test_small_games_stay_serial()
@@ -0,0 +1,109 @@
+from tripple_b_gt import ExtensiveForm, StrategicForm, demo_game
+import copy
+import numpy as np
+import sympy
+
+def rebuilt(game, updates):
+    # Same game with payoff_data entries replaced: {(player, var): (cases, value)}
+    payoff_data = copy.deepcopy(game.payoff_data)
+    for (player, var), (cases, value) in updates.items():
+        for case in cases:
+            payoff_data[player][var][case] = value
+    return ExtensiveForm(game.nature, game.player1, game.player2, payoff_data, game.p1_function, game.p2_function)
+
+def test_sweep_matches_pointwise_solve():
+    game = demo_game()
+    strategic_game = StrategicForm(game)
+    tax_cases = ['case5', 'case6', 'case7', 'case8']
+    taxes = np.linspace(-30, 10, 9)
+    reputations = np.array([-6.0, -1.0, 2.0])
+    sweep = strategic_game.parameter_sweep([
+        {'player': 'p1', 'variable': 'carbon_tax', 'values': taxes, 'cases': tax_cases},
+        {'player': 'p2', 'variable': 'reputation', 'values': reputations}
+    ])
+    assert sweep['lo'].shape == (9, 3, 4, 4)
+    assert sweep['count'].shape == (9, 3)
+    
+    ro = sympy.symbols('ro')
+    all_cases = ['case%d' % n for n in range(1, 9)]
+    for g1 in (0, 4, 8):
+        for g2 in range(3):
+            point = StrategicForm(rebuilt(game, {
+                ('p1', 'carbon_tax'): (tax_cases, taxes[g1]),
+                ('p2', 'reputation'): (all_cases, reputations[g2])
+            }))
+            p1_strats = point.pure_strategies['regulator']
+            p2_strats = point.pure_strategies['trippleB']
+            equilibria = point.find_nash_equilibria(exact=False)
+            assert sweep['count'][g1, g2] == len(equilibria)
+            for eq in equilibria:
+                i, j = p1_strats.index(eq['regulator']), p2_strats.index(eq['trippleB'])
+                assert sweep['is_equilibrium'][g1, g2, i, j]
+                # Interval endpoints satisfy the symbolic range
+                assert bool(eq['ro_range'].subs(ro, sweep['lo'][g1, g2, i, j]))
+                assert bool(eq['ro_range'].subs(ro, sweep['hi'][g1, g2, i, j]))
+    print("Test Passed!")
+
+def test_single_variable_sweep_and_coverage():
+    strategic_game = StrategicForm(demo_game())
+    sweep = strategic_game.parameter_sweep([{'player': 'p1', 'variable': 'risk', 'values': [-50, 0, 50]}])
+    assert sweep['count'].shape == (3,)
+    assert np.all((sweep['coverage'] >= 0) & (sweep['coverage'] <= 1))
+    
+    # The demo game always has an equilibrium on the whole [0, 1]
+    base = strategic_game.parameter_sweep([{'player': 'p1', 'variable': 'risk', 'values': [0], 'cases': []}])
+    assert base['coverage'][0] == 1.0
+    print("Test Passed!")
+
+def test_sweep_in_batches_and_validation():
+    strategic_game = StrategicForm(demo_game())
+    sweeps = [
+        {'player': 'p1', 'variable': 'carbon_tax', 'values': np.linspace(-30, 10, 7), 'cases': ['case5', 'case6']},
+        {'player': 'p2', 'variable': 'reputation', 'values': [-6, -1, 2, 5]}
+    ]
+    whole = strategic_game.parameter_sweep(sweeps)
+    for batch_size in (1, 5):
+        batched = strategic_game.parameter_sweep(sweeps, batch_size=batch_size)
+        for key in ('lo', 'hi', 'is_equilibrium', 'count', 'coverage'):
+            assert np.array_equal(batched[key], whole[key], equal_nan=key in ('lo', 'hi'))
+    
+    for bad in ({'player': 'p1', 'variable': 'risk'},
+                {'player': 'p1', 'variable': 'risk', 'values': []},
+                {'player': 'p1', 'variable': 'risk', 'values': ['high']},
+                {'player': 'p1', 'variable': 'risk', 'values': [1], 'cases': 'case1'},
+                {'player': 'p3', 'variable': 'risk', 'values': [1]},
+                {'player': 'p1', 'variable': ['risk'], 'values': [1]}):
+        try:
+            strategic_game.parameter_sweep([bad])
+            assert False, f"{bad} should have raised ValueError"
+        except ValueError:
+            pass
+    print("Test Passed!")
+
+def test_sweep_endpoint():
+    from app import app
+    from tripple_b_gt import DEMO_PAYOFF_DATA
+    client = app.test_client()
+    payload = {
+        'payoff_data': DEMO_PAYOFF_DATA,
+        'sweeps': [{'player': 'p1', 'variable': 'carbon_tax', 'values': [-12, 0], 'cases': ['case5', 'case6', 'case7', 'case8']}]
+    }
+    result = client.post('/sweep', json=payload).get_json()
+    assert result['status'] == 'success'
+    assert len(result['count']) == 2
+    assert all(len(profile['lo']) == 2 for profile in result['profiles'])
+    
+    payload['sweeps'][0]['variable'] = 'missing'
+    assert client.post('/sweep', json=payload).status_code == 400
+    
+    payload['sweeps'][0] = {'player': 'p1', 'variable': 'carbon_tax'}
+    response = client.post('/sweep', json=payload)
+    assert response.status_code == 400
+    assert response.get_json()['message'] == "Sweep of carbon_tax needs a 'values' list"
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_sweep_matches_pointwise_solve()
+    test_single_variable_sweep_and_coverage()
+    test_sweep_in_batches_and_validation()
+    test_sweep_endpoint()
@@ -0,0 +1,90 @@
+from tripple_b_gt import ExtensiveForm, StrategicForm, PayoffColumns, DEMO_PAYOFF_DATA, demo_game
+from batch_solver import parse_game_spec, solve_game_spec, build_game
+from game_session import GameSession
+import base64
+import copy
+import numpy as np
+
+def columns_of(payoff_data, num_cases=8):
+    return {key: {'variables': list(player_data),
+                  'values': [[var_data.get('case%d' % c, 0) for c in range(1, num_cases + 1)] for var_data in player_data.values()]}
+            for key, player_data in payoff_data.items()}
+
+def test_columns_build_the_same_game():
+    demo = demo_game()
+    columns = {key: PayoffColumns(spec['variables'], spec['values']) for key, spec in columns_of(DEMO_PAYOFF_DATA).items()}
+    assert dict(columns['p1']['risk']) == {'case%d' % c: float(v) for c, v in
+                                           zip(range(1, 9), [-50, -5, -5, 0, -4, -4, -4, -4])}
+    game = ExtensiveForm(demo.nature, demo.player1, demo.player2, columns)
+    assert np.array_equal(game.payoff_tensor, demo.payoff_tensor)
+    assert game.payoff('case3') == demo.payoff('case3')
+    assert StrategicForm(game).find_nash_equilibria() == StrategicForm(demo).find_nash_equilibria()
+    print("Test Passed!")
+
+def test_decode_encodings():
+    spec = columns_of(DEMO_PAYOFF_DATA)
+    flat = {key: dict(value, values=sum(value['values'], [])) for key, value in spec.items()}
+    encoded = {key: {'variables': value['variables'], 'encoding': 'base64',
+                     'values': base64.b64encode(np.array(value['values'], dtype='<f8').tobytes()).decode()}
+               for key, value in spec.items()}
+    legacy = solve_game_spec(parse_game_spec({'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA), 'method': 'nash'}))
+    for payoff_columns in (spec, flat, encoded):
+        game = parse_game_spec({'payoff_columns': payoff_columns, 'method': 'nash'})
+        assert solve_game_spec(game) == legacy
+    print("Test Passed!")
+
+def test_decode_errors():
+    spec = columns_of(DEMO_PAYOFF_DATA)
+    bad = [
+        {'payoff_columns': spec, 'payoff_data': {}},
+        {'payoff_columns': {'p1': {'variables': ['a'], 'values': [1, 2, 3]}}},
+        {'payoff_columns': {'p1': {'variables': ['a'], 'values': [True] * 8}}},
+        {'payoff_columns': {'p1': {'variables': ['a'], 'values': ['x'] * 8}}},
+        {'payoff_columns': {'p1': {'variables': ['a', 'a'], 'values': [0] * 16}}},
+        {'payoff_columns': {'p1': {'variables': ['a'], 'values': 'not base64!', 'encoding': 'base64'}}},
+        {'payoff_columns': {'p1': {'variables': ['a'], 'values': [0] * 8, 'encoding': 'msgpack'}}},
+        {'payoff_columns': {'p1': {'values': [0] * 8}}}
+    ]
+    for data in bad:
+        try:
+            parse_game_spec(data)
+            assert False, f"{data} should have raised ValueError"
+        except ValueError:
+            pass
+    print("Test Passed!")
+
+def test_session_edits_columnar_game():
+    game = parse_game_spec({'payoff_columns': columns_of(DEMO_PAYOFF_DATA), 'method': 'nash'})
+    session = GameSession(build_game(game))
+    session.update({'p1': {'risk': {'case1': -10}}})
+    session.update({'p2': {'new_variable': {'case2': 3}}})
+    edited = copy.deepcopy(DEMO_PAYOFF_DATA)
+    edited['p1']['risk']['case1'] = -10
+    edited['p2']['new_variable'] = {'case2': 3}
+    assert session.payoff_data['p1']['risk']['case1'] == -10
+    assert np.allclose(session.payoff_tensor, build_game(parse_game_spec({'payoff_data': edited})).payoff_tensor)
+    print("Test Passed!")
+
+def test_calculate_columnar_round_trip():
+    from app import app
+    
+    client = app.test_client()
+    legacy = client.post('/calculate', json={'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA), 'method': 'nash'}).get_json()
+    result = client.post('/calculate', json={'payoff_columns': columns_of(DEMO_PAYOFF_DATA), 'method': 'nash',
+                                             'response_format': 'columnar'}).get_json()
+    assert result['format'] == 'columnar'
+    columns = result['equilibria']
+    assert columns['p1_observed'] == ['stable', 'unstable']
+    assert columns['ro_range'] == [eq['ro_range'] for eq in legacy['equilibria']]
+    strategies = ['intervene', 'not intervene']
+    assert [dict(zip(columns['p1_observed'], (strategies[a] for a in actions))) for actions in columns['p1_strategy']] \
+        == [eq['p1_strategy'] for eq in legacy['equilibria']]
+    assert client.post('/calculate', json={'payoff_columns': {'p1': {'variables': ['a'], 'values': [1]}}}).status_code == 400
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_columns_build_the_same_game()
+    test_decode_encodings()
+    test_decode_errors()
+    test_session_edits_columnar_game()
+    test_calculate_columnar_round_trip()
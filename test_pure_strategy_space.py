@@ -0,0 +1,43 @@
+from tripple_b_gt import PureStrategySpace
+import itertools
+
+def test_matches_dict_enumeration():
+    observed = ('stable', 'unstable', 'crisis')
+    actions = ('a', 'b', 'c')
+    space = PureStrategySpace(observed, actions)
+    
+    expected = [dict(zip(observed, combo)) for combo in itertools.product(actions, repeat=len(observed))]
+    assert len(space) == 27
+    assert list(space) == expected
+    assert space[5] == expected[5]
+    assert space[-1] == expected[-1]
+    assert space[2:6] == expected[2:6]
+    
+    for code, strategy in enumerate(expected):
+        assert space.index(strategy) == code
+        assert strategy in space
+    assert {'stable': 'a', 'unstable': 'a', 'crisis': 'z'} not in space
+    
+    rows = space.index_array()
+    assert rows.shape == (27, 3)
+    assert rows.dtype.name == 'uint8'
+    assert [actions[d] for d in rows[5]] == list(expected[5].values())
+    print("Test Passed!")
+
+def test_large_space_is_lazy():
+    # 2 ** 16 firm strategies: random access without building them all
+    space = PureStrategySpace(tuple('action%d' % n for n in range(16)), ('relocate', 'stay'))
+    assert len(space) == 65536
+    assert set(space[-1].values()) == {'stay'}
+    assert space.index(space[40000]) == 40000
+    
+    try:
+        space[65536]
+        assert False, "Expected IndexError"
+    except IndexError:
+        pass
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_matches_dict_enumeration()
+    test_large_space_is_lazy()
@@ -0,0 +1,102 @@
+from result_cache import ResultCache, game_hash
+import copy
+import tempfile
+
+def make_game(payoff_data, p1_func='Revenue - Cost', method='nash'):
+    return ('regulator', 'firm', ['stable', 'unstable'], ['intervene', 'not intervene'],
+            ['relocate', 'not relocate'], payoff_data, p1_func, '', method)
+
+def test_game_hash_is_canonical():
+    data = {'p1': {'Revenue': {'case1': 1, 'case2': 2}, 'Cost': {'case1': 0.5}}, 'p2': {}}
+    reordered = {'p2': {}, 'p1': {'Cost': {'case1': 0.5}, 'Revenue': {'case2': 2.0, 'case1': 1.0}}}
+    
+    key = game_hash(*make_game(data))
+    assert key == game_hash(*make_game(reordered))
+    # Function strings are normalized like the engine sanitizes them
+    assert key == game_hash(*make_game(data, p1_func='  revenue   -  cost '))
+    
+    # Anything that changes the result changes the hash
+    assert key != game_hash(*make_game(data, method='subgame_perfect'))
+    assert key != game_hash(*make_game(data), result_format=1)
+    assert game_hash(*make_game(data), result_format=1) != game_hash(*make_game(data), result_format=2)
+    changed = {'p1': {'Revenue': {'case1': 1, 'case2': 3}, 'Cost': {'case1': 0.5}}, 'p2': {}}
+    assert key != game_hash(*make_game(changed))
+    # Whitespace inside a token sequence is significant: an invalid function
+    # must not share a key with a valid one
+    data = {'p1': {'v1': {'case1': 1}, 'v2': {'case1': 2}, 'v1v2': {'case1': 3}}, 'p2': {}}
+    assert game_hash(*make_game(data, p1_func='v1 v2')) != game_hash(*make_game(data, p1_func='v1v2'))
+    assert game_hash(*make_game(data, p1_func='v1* *v2')) != game_hash(*make_game(data, p1_func='v1**v2'))
+    assert game_hash(*make_game(data, p1_func='v1+v2')) == game_hash(*make_game(data, p1_func=' v1 +  v2'))
+    print("Test Passed!")
+
+def test_lru_and_ttl():
+    now = [0.0]
+    cache = ResultCache(max_size=2, ttl=10, clock=lambda: now[0])
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)          # evicts 'b', the least recently used
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    
+    now[0] = 11.0
+    assert cache.get('a') is None
+    
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 2
+    assert stats['evictions'] == 1
+    print("Test Passed!")
+
+def test_disk_tier_survives_restart():
+    with tempfile.TemporaryDirectory() as directory:
+        ResultCache(directory=directory).put('key', {'equilibria': []})
+        
+        restarted = ResultCache(directory=directory)
+        assert restarted.get('key') == {'equilibria': []}
+        assert restarted.stats()['disk_hits'] == 1
+    print("Test Passed!")
+
+def test_format_bump_retires_cached_results():
+    import batch_solver
+    from tripple_b_gt import DEMO_PAYOFF_DATA
+    game = batch_solver.parse_game_spec({'payoff_data': copy.deepcopy(DEMO_PAYOFF_DATA), 'method': 'nash'})
+    with tempfile.TemporaryDirectory() as directory:
+        old_key = batch_solver.game_spec_key(game)
+        ResultCache(directory=directory).put(old_key, {'equilibria': ['old shape']})
+        
+        result_format = batch_solver.RESULT_FORMAT
+        batch_solver.RESULT_FORMAT = result_format + 1
+        try:
+            new_key = batch_solver.game_spec_key(game)
+        finally:
+            batch_solver.RESULT_FORMAT = result_format
+        assert new_key != old_key
+        assert ResultCache(directory=directory).get(new_key) is None
+    print("Test Passed!")
+
+def test_calculate_uses_cache():
+    from app import app, result_cache
+    client = app.test_client()
+    payload = {
+        'payoff_data': {'p1': {'v': {'case1': 4, 'case5': 2}}, 'p2': {'v': {'case3': 1}}},
+        'method': 'nash'
+    }
+    result_cache.clear()
+    before = result_cache.stats()
+    
+    first = client.post('/calculate', json=payload).get_json()
+    second = client.post('/calculate', json=payload).get_json()
+    assert first == second
+    
+    stats = client.get('/cache/stats').get_json()
+    assert stats['misses'] == before['misses'] + 1
+    assert stats['hits'] == before['hits'] + 1
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_game_hash_is_canonical()
+    test_lru_and_ttl()
+    test_disk_tier_survives_restart()
+    test_format_bump_retires_cached_results()
+    test_calculate_uses_cache()
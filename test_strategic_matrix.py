@@ -0,0 +1,57 @@
+from tripple_b_gt import Player, StrategicForm, StrategicMatrix, demo_game
+from instrumentation import collect_timings
+from fractions import Fraction
+import numpy as np
+
+def test_matrix_is_cached_and_read_only():
+    strategic_game = StrategicForm(demo_game())
+    matrix = strategic_game.strategic_matrix()
+    assert strategic_game.strategic_matrix() is matrix
+    assert matrix.shape == (4, 4) and matrix.nbytes == 4 * 16 * 8
+    try:
+        matrix.p1_const[0, 0] = 1.0
+        assert False, "matrix arrays should be read-only"
+    except ValueError:
+        pass
+    try:
+        matrix.extra = 1
+        assert False, "matrix should not take new attributes"
+    except AttributeError:
+        pass
+    
+    exact = strategic_game.strategic_matrix(exact=True)
+    assert exact.exact and strategic_game.strategic_matrix(exact=True) is exact
+    for key in StrategicMatrix.KEYS:
+        values = getattr(matrix, key)
+        assert all(isinstance(v, Fraction) for v in getattr(exact, key).ravel())
+        assert np.array_equal(getattr(exact, key).astype(float), values)
+    
+    # Solving repeatedly reuses the same matrix
+    with collect_timings() as timings:
+        first = strategic_game.find_nash_equilibria()
+        second = strategic_game.find_nash_equilibria(exact=False)
+    assert 'strategic_arrays' not in timings.stages
+    assert [(eq['regulator'], eq['trippleB']) for eq in first] == [(eq['regulator'], eq['trippleB']) for eq in second]
+    
+    A, B = matrix.at(0.25)
+    assert np.allclose(A, matrix.p1_const + 0.25 * matrix.p1_ro)
+    assert np.allclose(B, matrix.p2_const + 0.25 * matrix.p2_ro)
+    print("Test Passed!")
+
+def test_slotted_records():
+    player = Player('regulator', ('intervene', 'not intervene'))
+    assert not hasattr(player, '__dict__')
+    
+    game = demo_game()
+    record = game.strategies_space[0]
+    assert not hasattr(record, '__dict__')
+    assert dict(record) == {'nature': 'stable', 'regulator': 'intervene', 'trippleB': 'relocate',
+                            'case': 'case3', 'payoff': (70.0, 65.42)}
+    assert record == dict(record)
+    assert record['case'] == 'case3' and record.get('missing') is None
+    assert record.names is game.strategies_space[1].names
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_matrix_is_cached_and_read_only()
+    test_slotted_records()
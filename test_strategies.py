@@ -1,10 +1,12 @@
-from tripple_b_gt import extensive_form
+from tripple_b_gt import Player, ExtensiveForm
 
 def test_strategies_space():
-    # Initialize with dummy values
-    game = extensive_form(0.5, 10, 5, "P1", "P2", "Nature")
+    nature = Player('nature', ('stable', 'unstable'))
+    player1 = Player('regulator', ('intervene', 'not intervene'))
+    player2 = Player('firm', ('relocate', 'not relocate'))
+    game = ExtensiveForm(nature, player1, player2, get_payoff_data())
     
-    strategies = game.strategies_space()
+    strategies = game.strategies_space
     
     print(f"Total strategies: {len(strategies)}")
     for i, s in enumerate(strategies):
@@ -18,7 +20,8 @@ def test_strategies_space():
     # P2: ('relocate', 'not relocate')
     
     expected_first = ('stable', 'intervene', 'relocate')
-    assert strategies[0] == expected_first, f"Expected first strategy {expected_first}, got {strategies[0]}"
+    first = (strategies[0]['nature'], strategies[0]['regulator'], strategies[0]['firm'])
+    assert first == expected_first, f"Expected first strategy {expected_first}, got {first}"
     
     print("Verification successful!")
 
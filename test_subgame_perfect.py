@@ -0,0 +1,129 @@
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm
+import random
+import sympy
+
+def random_game(seed):
+    rng = random.Random(seed)
+    nature = Player('nature', ('stable', 'unstable'))
+    p1 = Player('regulator', ('A', 'B', 'C'))
+    p2 = Player('firm', ('X', 'Y'))
+    cases = ['case%d' % n for n in range(1, 13)]
+    payoff_data = {
+        'p1': {'v': {case: rng.randint(-20, 20) for case in cases}},
+        'p2': {'v': {case: rng.randint(-20, 20) for case in cases}}
+    }
+    return ExtensiveForm(nature, p1, p2, payoff_data)
+
+def test_pieces_are_nash_equilibria():
+    ro = sympy.symbols('ro')
+    for seed in range(8):
+        game = random_game(seed)
+        pieces = game.solve_subgame_perfect()
+        
+        # Pieces partition [0, 1]
+        assert pieces[0]['ro_range'][0] == 0
+        assert pieces[-1]['ro_range'][1] == 1
+        for before, after in zip(pieces[:-1], pieces[1:]):
+            assert before['ro_range'][1] == after['ro_range'][0]
+        
+        equilibria = StrategicForm(game).find_nash_equilibria(exact=False)
+        for piece in pieces:
+            if piece['regulator'] is None:
+                continue
+            lo, hi = piece['ro_range']
+            mid = (lo + hi) / 2
+            matches = [eq for eq in equilibria
+                       if eq['regulator'] == piece['regulator'] and eq['firm'] == piece['firm']
+                       and bool(eq['ro_range'].subs(ro, mid))]
+            assert matches, f"seed {seed}: {piece} is not a Nash equilibrium at ro={mid}"
+    print("Test Passed!")
+
+def test_calculate_endpoint_default():
+    from app import app
+    client = app.test_client()
+    payload = {
+        'p1_name': 'regulator',
+        'p2_name': 'firm',
+        'payoff_data': random_game(0).payoff_data
+    }
+    response = client.post('/calculate', json=payload)
+    result = response.get_json()
+    assert result['status'] == 'success'
+    assert result['method'] == 'subgame_perfect'
+    
+    payload['method'] = 'nash'
+    result = client.post('/calculate', json=payload).get_json()
+    assert result['method'] == 'nash'
+    assert isinstance(result['equilibria'], list)
+    print("Test Passed!")
+
+def test_ranges_formatted_like_nash():
+    from batch_solver import solve_extensive_form
+    from tripple_b_gt import demo_game
+    ro = sympy.symbols('ro')
+    # Same form as the Nash route (and reduce_inequalities) for the same range
+    whole = str(sympy.reduce_inequalities([ro >= 0, ro <= 1], ro))
+    assert [eq['ro_range'] for eq in solve_extensive_form(demo_game(), 'subgame_perfect')['equilibria']] == [whole]
+    for seed in range(8):
+        for eq in solve_extensive_form(random_game(seed), 'subgame_perfect')['equilibria']:
+            assert '0.0 <= ro' not in eq['ro_range'] and 'ro <= 1.0' not in eq['ro_range']
+    print("Test Passed!")
+
+def test_large_firm_strategy_space_is_not_enumerated():
+    import tracemalloc
+    from benchmark import synthetic_game
+    from batch_solver import solve_extensive_form
+    tracemalloc.start()
+    try:
+        # 6**9 (about 10 million) firm pure strategies
+        game = synthetic_game(0, 2, 9, 6, 3, 0)
+        result = solve_extensive_form(game, 'subgame_perfect')
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert result['equilibria']
+    assert game._pure_strategy_indices is None
+    assert peak < 64 * 2**20
+    assert len(game.pure_strategies['firm']) == 6**9
+    print("Test Passed!")
+
+def test_too_large_games_are_refused():
+    import tripple_b_gt
+    from benchmark import synthetic_game
+    from app import app, result_cache
+    
+    # 200**2 regulator policies, each checked against 200 deviations: refused
+    # before any policy is enumerated
+    game = synthetic_game(0, 2, 200, 2, 3, 0)
+    try:
+        game.solve_subgame_perfect()
+        assert False, "expected the game to be refused"
+    except ValueError as e:
+        assert str(tripple_b_gt.SUBGAME_PERFECT_MAX_WORK) in str(e)
+    
+    # The firm is indifferent everywhere, so every on-path response pair is
+    # tried; that work only shows up while solving
+    payload = {
+        'p1_strategies': ['r%d' % a for a in range(20)],
+        'payoff_data': {'p1': {'v': {'case1': 1}}, 'p2': {'v': {'case2': 1}}}
+    }
+    client = app.test_client()
+    assert client.post('/calculate', json=payload).status_code == 200
+    max_work = tripple_b_gt.SUBGAME_PERFECT_MAX_WORK
+    # Just enough for one pass without ties
+    tripple_b_gt.SUBGAME_PERFECT_MAX_WORK = 20**2 * 20 * 2
+    try:
+        result_cache.clear()
+        response = client.post('/calculate', json=payload)
+    finally:
+        tripple_b_gt.SUBGAME_PERFECT_MAX_WORK = max_work
+    assert response.status_code == 400
+    assert 'too large for backward induction' in response.get_json()['message']
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_pieces_are_nash_equilibria()
+    test_calculate_endpoint_default()
+    test_ranges_formatted_like_nash()
+    test_large_firm_strategy_space_is_not_enumerated()
+    test_too_large_games_are_refused()
@@ -0,0 +1,62 @@
+from tripple_b_gt import Player, ExtensiveForm, StrategicForm
+
+def get_payoff_data():
+    return {
+        'p1': {
+            'revenue_minus_cost': {'case1':75, 'case2':75, 'case3':75, 'case4':75, 'case5':65.66, 'case6':65.66, 'case7':65.66, 'case8':65.66},
+            'carbon_tax': {'case1':0, 'case2':0, 'case3':0, 'case4':0, 'case5':-12, 'case6':-12, 'case7':-12, 'case8':-12},
+            'risk': {'case1':-50, 'case2':-5, 'case3':-5, 'case4':0, 'case5':-4, 'case6':-4, 'case7':-4, 'case8':-4}
+        },
+        'p2': {
+            'national_wealth': {'case1':45.42, 'case2':45.42, 'case3':45.42, 'case4':45.42, 'case5':33.93, 'case6':33.93, 'case7':33.93, 'case8':33.93},
+            'technology_dependence': {'case1':-1, 'case2':-1, 'case3':-1, 'case4':-1, 'case5':1, 'case6':1, 'case7':1, 'case8':1},
+            'reputation': {'case1':-4, 'case2':-3, 'case3':-2, 'case4':-1, 'case5':-4, 'case6':-3, 'case7':-2, 'case8':-1},
+            'carbon_tax_p2': {'case1':23, 'case2':23, 'case3':23, 'case4':23, 'case5':0, 'case6':0, 'case7':0, 'case8':0}
+        }
+    }
+
+def test_payoff_arrays_match_lookup():
+    nature = Player('nature', ('stable', 'unstable'))
+    player1 = Player('regulator', ('intervene', 'not intervene'))
+    player2 = Player('firm', ('relocate', 'not relocate'))
+    game = ExtensiveForm(nature, player1, player2, get_payoff_data())
+    strategic_game = StrategicForm(game)
+    arrays = strategic_game.payoff_arrays()
+    
+    # Naive construction from the strategies space dicts
+    payoff_lookup = {}
+    for s in game.strategies_space:
+        payoff_lookup[(s['nature'], s['regulator'], s['firm'])] = s['payoff']
+    
+    for i, p1_s in enumerate(game.pure_strategies['regulator']):
+        for j, p2_s in enumerate(game.pure_strategies['firm']):
+            payoff_0 = payoff_lookup[('stable', p1_s['stable'], p2_s[p1_s['stable']])]
+            payoff_1 = payoff_lookup[('unstable', p1_s['unstable'], p2_s[p1_s['unstable']])]
+            
+            assert arrays['p1_const'][i, j] == round(payoff_0[1], 2)
+            assert arrays['p1_ro'][i, j] == round(round(payoff_1[1], 2) - round(payoff_0[1], 2), 2)
+            assert arrays['p2_const'][i, j] == round(payoff_0[0], 2)
+            assert arrays['p2_ro'][i, j] == round(payoff_1[0] - payoff_0[0], 2)
+    
+    # The symbolic matrix is a view of the same arrays
+    matrix = strategic_game.strategic_form_payoff_function()
+    assert matrix[0][0][1] == arrays['p1_const'][0, 0]
+    print("Test Passed!")
+
+def test_larger_action_sets():
+    nature = Player('nature', ('stable', 'unstable'))
+    player1 = Player('regulator', ('a', 'b', 'c'))
+    player2 = Player('firm', ('x', 'y', 'z'))
+    game = ExtensiveForm(nature, player1, player2, {'p1': {}, 'p2': {}})
+    
+    assert game.payoff_tensor.shape == (2, 3, 3, 2)
+    assert game.pure_strategy_indices['regulator'].shape == (9, 2)
+    assert game.pure_strategy_indices['firm'].shape == (27, 3)
+    
+    arrays = StrategicForm(game).payoff_arrays()
+    assert arrays['p1_const'].shape == (9, 27)
+    print("Test Passed!")
+
+if __name__ == "__main__":
+    test_payoff_arrays_match_lookup()
+    test_larger_action_sets()
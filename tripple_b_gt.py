@@ -1,22 +1,349 @@
 import itertools
-import pprint
-import sympy
+import numpy as np
 import re
+import operator
+import os
+import time
+from collections.abc import Mapping
+from fractions import Fraction
+
+from instrumentation import stage, timed, count, current_timings
+
+
+def sanitize_variable_name(name):
+    # Replace spaces with underscores and lower case, e.g. "National Wealth" -> "national_wealth"
+    return name.strip().lower().replace(" ", "_")
+
+
+def sanitize_function_string(function_str):
+    # Sanitize input: remove leading/trailing whitespace and lower case
+    function_str = function_str.strip().lower()
+
+    # Smart Sanitization: Replace spaces between words with underscores
+    # This regex looks for a space that is preceded by a word char and followed by a word char
+    # e.g. "national wealth" -> "national_wealth"
+    # But "wealth + tax" -> "wealth + tax" (because + is not a word char)
+    return re.sub(r'(?<=[a-z0-9])\s+(?=[a-z0-9])', '_', function_str)
+
+
+class CompiledPayoff:
+    # A payoff function parsed and validated once, then lowered to a numpy
+    # callable that evaluates every case in a single vectorized call.
+    # Without a function string the payoff is the sum of all variables.
+    # Evaluation is plain float64 arithmetic, not sympy subs as originally:
+    # the two can differ in the last bit, so a payoff right on a 2-decimal
+    # rounding boundary may round the other way (and shift an ro endpoint
+    # or an exact tie) compared with the symbolic evaluation.
+    def __init__(self, player_key, function_str, player_data):
+        self.player_key = player_key
+        self.function_str = function_str
+        self.expr = None
+        self.arguments = list(player_data.keys())
+        self._func = None
+
+        if not function_str:
+            return
+
+        # sympy is only imported once a payoff function has to be parsed
+        import sympy
+
+        # Map sanitized symbol names to the original variable names
+        # (later variables win on collisions, as with a dict of symbol values)
+        defined_vars = {}
+        for var_name in player_data.keys():
+            defined_vars[sanitize_variable_name(var_name)] = var_name
+
+        expr = sympy.sympify(sanitize_function_string(function_str))
+
+        # VALIDATION: Check for undefined variables
+        undefined_vars = []
+        for sym in expr.free_symbols:
+            sym_name = str(sym)
+            if sym_name not in defined_vars:
+                undefined_vars.append(sym_name)
+
+        if undefined_vars:
+            raise ValueError(f"Undefined variables in payoff function for {player_key}: {', '.join(undefined_vars)}")
+
+        symbols = sorted(expr.free_symbols, key=str)
+        self.expr = expr
+        self.arguments = [defined_vars[str(sym)] for sym in symbols]
+        self._func = sympy.lambdify(symbols, expr, modules='numpy')
+
+    def evaluate(self, columns, shape):
+        # columns: {var_name: ndarray of per-case values}, broadcastable to shape
+        # (an int for a flat list of cases, or e.g. (grid..., num_cases))
+        count('expressions_evaluated', int(np.prod(shape)))
+        if self._func is None:
+            total = np.zeros(shape)
+            for var_name in self.arguments:
+                total = total + columns[var_name]
+            return total
+
+        values = self._func(*[columns[var_name] for var_name in self.arguments])
+        # Constant expressions come back as scalars
+        return np.broadcast_to(np.asarray(values, dtype=float), shape)
+
+
+class LinearIntervalSolver:
+    # Closed-form solver for systems of linear conditions a*ro + b >= 0.
+    # Every bound narrows an interval inside [lower, upper]; the result is a
+    # (lo, hi) tuple (lo == hi for a point) or None when the system is empty.
+    # exact=True runs the arithmetic on Fractions built from the decimal form
+    # of each coefficient, so the result is exactly what reduce_inequalities
+    # gives for the same (rational) coefficients. The strategic payoffs are
+    # rounded to 2 decimals; the original symbolic search held the firm's as
+    # 4-digit sympy Floats instead, so its endpoints could differ in the
+    # 4th digit (0.451996527777778 for the demo game's 0.452) and it missed
+    # equilibria that only hold at an exact tie.
+    # Float mode treats |a| <= tolerance as a constant condition.
+    def __init__(self, exact=False, lower=0, upper=1, tolerance=1e-9):
+        self.exact = exact
+        self.lower = lower
+        self.upper = upper
+        self.tolerance = 0 if exact else tolerance
+
+    def number(self, value):
+        if not self.exact or isinstance(value, Fraction):
+            return value
+        if isinstance(value, int):
+            # Keeps -b / a a Fraction
+            return Fraction(value)
+        return Fraction(repr(float(value)))
+
+    def solve(self, bounds):
+        # bounds: iterable of (a, b) pairs meaning a*ro + b >= 0
+        lo = self.lower
+        hi = self.upper
+        for a, b in bounds:
+            a = self.number(a)
+            b = self.number(b)
+            if -self.tolerance <= a <= self.tolerance:
+                if b < -self.tolerance:
+                    return None
+                continue
+            bound = -b / a
+            if a > 0:
+                # ro >= -b/a
+                if bound > lo:
+                    lo = bound
+            else:
+                # ro <= -b/a (ties keep the condition's bound, as sympy does)
+                if bound <= hi:
+                    hi = bound
+            if lo > hi + self.tolerance:
+                return None
+        if hi < lo:
+            # Within tolerance: collapse to a point
+            hi = lo
+        return (lo, hi)
+
+    @staticmethod
+    def exact_interval(interval):
+        # A float (lo, hi) in the form the exact solver returns: Fractions of
+        # the value rounded to the 15 significant digits to_relational prints
+        # (so round-off such as 0.9999999999999999 reads as 1), ints where
+        # integral
+        if interval is None:
+            return None
+        values = (Fraction(f"{float(value):.15g}") for value in interval)
+        return tuple(int(value) if value.denominator == 1 else value for value in values)
+
+    def to_relational(self, interval, ro):
+        # Materialize an interval in the same form sympy.reduce_inequalities
+        # returns, except that integral endpoints are always Integers (sympy
+        # writes 1.0 for a bound that came from a condition and 1 for the
+        # edge of [0, 1]); every route formats its ranges through here
+        import sympy
+
+        if interval is None:
+            return sympy.false
+
+        def as_sympy(value):
+            if value == int(value):
+                return sympy.Integer(int(value))
+            return sympy.Float(float(value))
+
+        lo, hi = interval
+        if lo == hi:
+            return sympy.Eq(ro, as_sympy(lo))
+        return sympy.And(sympy.Le(as_sympy(lo), ro), sympy.Le(ro, as_sympy(hi)))
 
 
 class Player:
+    __slots__ = ('name', 'strategies', 'strategies_space')
+
     def __init__(self, name, strategies):
         self.name = name
         self.strategies = strategies
         self.strategies_space = []
 
 
+class PureStrategySpace:
+    # All pure strategies mapping each observed label (nature state or the
+    # other player's action) to one of the player's actions, in
+    # itertools.product order. A strategy is stored as its integer code,
+    # the mixed-radix number whose digits are the chosen action indices
+    # (first observed label most significant); dicts are decoded on access.
+    def __init__(self, observed, actions):
+        self.observed = tuple(observed)
+        self.actions = tuple(actions)
+        self._action_indices = CaseBuilder.index_lookup(self.actions)
+
+    def __len__(self):
+        return len(self.actions) ** len(self.observed)
+
+    def __getitem__(self, code):
+        if isinstance(code, slice):
+            return [self.decode(c) for c in range(*code.indices(len(self)))]
+        code = operator.index(code)
+        if code < 0:
+            code += len(self)
+        if not 0 <= code < len(self):
+            raise IndexError('pure strategy index out of range')
+        return self.decode(code)
+
+    def __iter__(self):
+        for code in range(len(self)):
+            yield self.decode(code)
+
+    def __contains__(self, strategy):
+        try:
+            self.index(strategy)
+        except ValueError:
+            return False
+        return True
+
+    def __repr__(self):
+        return f"PureStrategySpace({self.observed!r} -> {self.actions!r}, {len(self)} strategies)"
+
+    def digits(self, code):
+        # Action index chosen for each observed label
+        base = len(self.actions)
+        digits = [0] * len(self.observed)
+        for position in range(len(self.observed) - 1, -1, -1):
+            code, digits[position] = divmod(code, base)
+        return digits
+
+    def decode(self, code):
+        return {label: self.actions[digit] for label, digit in zip(self.observed, self.digits(code))}
+
+    def index(self, strategy):
+        # Code of a strategy dict (inverse of decode)
+        if not isinstance(strategy, dict) or set(strategy) != set(self.observed):
+            raise ValueError(f"{strategy!r} is not a pure strategy of this space")
+        code = 0
+        for label in self.observed:
+            digit = self._action_indices.get(strategy[label])
+            if digit is None:
+                raise ValueError(f"{strategy!r} is not a pure strategy of this space")
+            code = code * len(self.actions) + digit
+        return code
+
+    def index_array(self, codes=None):
+        # Rows of action indices for the given codes (all strategies by default)
+        # as a compact uint8 array when the actions fit, else intp
+        if codes is None:
+            codes = np.arange(len(self))
+        codes = np.asarray(codes, dtype=np.int64)
+        base = len(self.actions)
+        powers = base ** np.arange(len(self.observed) - 1, -1, -1, dtype=np.int64)
+        dtype = np.uint8 if base <= 256 else np.intp
+        return ((codes[:, None] // powers) % base).astype(dtype)
+
+
+class CaseRecord(Mapping):
+    # One entry of ExtensiveForm.strategies_space: read-only mapping of
+    # {nature name: state, player1 name: action, player2 name: action,
+    #  'case': label, 'payoff': (p1_payoff, p2_payoff)}.
+    # The player names tuple is shared by all records of a game.
+    __slots__ = ('names', 'actions', 'case', 'payoff')
+
+    def __init__(self, names, actions, case, payoff):
+        self.names = names
+        self.actions = actions
+        self.case = case
+        self.payoff = payoff
+
+    def __getitem__(self, key):
+        if key == 'case':
+            return self.case
+        if key == 'payoff':
+            return self.payoff
+        for name, action in zip(self.names, self.actions):
+            if name == key:
+                return action
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self.names
+        yield 'case'
+        yield 'payoff'
+
+    def __len__(self):
+        return len(self.names) + 2
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class PayoffColumns(Mapping):
+    # One player's payoff data in columnar form: values[k, c] is variable
+    # names[k] in case c + 1, for every case of the game. Reads like the
+    # {'var_name': {'case1': val, ...}} dict (values as freshly built dicts),
+    # while ExtensiveForm takes the rows as payoff columns directly.
+    __slots__ = ('names', 'values', '_rows')
+
+    def __init__(self, names, values):
+        self.names = tuple(names)
+        values = np.asarray(values, dtype=float)
+        if not self.names:
+            values = np.zeros((0, values.shape[-1] if values.ndim == 2 else 0))
+        elif values.ndim == 1:
+            # Flat, variable-major
+            if values.size % len(self.names):
+                raise ValueError(f"{values.size} payoff values do not split into {len(self.names)} variables")
+            values = values.reshape(len(self.names), -1)
+        elif values.ndim != 2 or values.shape[0] != len(self.names):
+            raise ValueError(f"Expected one row of payoff values per variable ({len(self.names)})")
+        self._rows = {name: k for k, name in enumerate(self.names)}
+        if len(self._rows) != len(self.names):
+            raise ValueError("Duplicate payoff variable names")
+        self.values = values
+        self.values.flags.writeable = False
+
+    @property
+    def num_cases(self):
+        return self.values.shape[1]
+
+    def __getitem__(self, name):
+        row = self.values[self._rows[name]]
+        return {'case%d' % (c + 1): value for c, value in enumerate(row.tolist())}
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"PayoffColumns({list(self.names)!r}, {self.values.tolist()!r})"
+
+
+def payoff_dicts(payoff_data):
+    # payoff_data with any PayoffColumns expanded to plain nested dicts
+    # (for JSON and for in-place edits)
+    return {key: {name: dict(var_data) for name, var_data in player_data.items()}
+            for key, player_data in payoff_data.items()}
+
+
 class ExtensiveForm:
     # payoff_data structure:
     # {
     #   'p1': {'var_name': {'case1': val, ...}, ...},
     #   'p2': {'var_name': {'case1': val, ...}, ...}
     # }
+    # where either player's data may also be a PayoffColumns
     def __init__(self, nature, player1, player2, payoff_data, p1_function=None, p2_function=None):
         self.nature = nature
         self.player1 = player1
@@ -24,235 +351,957 @@ class ExtensiveForm:
         self.payoff_data = payoff_data
         self.p1_function = p1_function
         self.p2_function = p2_function
+        self._compiled_payoffs = None
+        self.cases = CaseBuilder(nature, player1, player2)
+        # (nature, p1_action, p2_action, player) array; player 0 holds the
+        # 'p1' payoff data, player 1 the 'p2' payoff data
+        self.payoff_tensor = self.payoff_tensor_function()
         self.strategies_space = self.strategies_space_function()
         self.pure_strategies = self.generate_pure_strategies()
+        self._pure_strategy_indices = None
+
+    @classmethod
+    def from_arrays(cls, nature, player1, player2, payoff_data, payoff_tensor, p1_function=None,
+                    p2_function=None, pure_strategy_indices=None):
+        # Rebuild a game from a stored payoff tensor (and optionally the stored
+        # strategy index tables) without parsing or evaluating the payoff
+        # functions; they are only compiled if payoff() etc. are called later
+        game = cls.__new__(cls)
+        game.nature = nature
+        game.player1 = player1
+        game.player2 = player2
+        game.payoff_data = payoff_data
+        game.p1_function = p1_function
+        game.p2_function = p2_function
+        game._compiled_payoffs = None
+        game.cases = CaseBuilder(nature, player1, player2)
+        game.payoff_tensor = payoff_tensor
+        game.strategies_space = game.strategies_space_function()
+        game.pure_strategies = game.generate_pure_strategies()
+        game._pure_strategy_indices = pure_strategy_indices
+        return game
+
+    @property
+    def pure_strategy_indices(self):
+        # Index tables of generate_pure_strategy_indices, built on first use:
+        # the firm's has one row per firm strategy (exponential in the number
+        # of regulator actions) and only the strategic form reads it, so
+        # backward induction never pays for it
+        if self._pure_strategy_indices is None:
+            self._pure_strategy_indices = self.generate_pure_strategy_indices()
+        return self._pure_strategy_indices
+
+    def compile_payoff_functions(self):
+        # Parse and validate both payoff functions once per game; the compiled
+        # callables are reused by payoff() and strategies_space_function()
+        if self._compiled_payoffs is None:
+            with stage('compile_payoff'):
+                self._compiled_payoffs = {
+                    'p1': CompiledPayoff('p1', self.p1_function, self.payoff_data.get('p1', {})),
+                    'p2': CompiledPayoff('p2', self.p2_function, self.payoff_data.get('p2', {}))
+                }
+        return self._compiled_payoffs
+
+    def payoff_table(self, cases):
+        # Evaluate both players' payoffs for a sequence of cases in one
+        # vectorized call per player. Returns two float arrays aligned with cases.
+        compiled = self.compile_payoff_functions()
+        p1_payoffs = compiled['p1'].evaluate(self.payoff_columns('p1', cases), len(cases))
+        p2_payoffs = compiled['p2'].evaluate(self.payoff_columns('p2', cases), len(cases))
+        return p1_payoffs, p2_payoffs
+
+    def payoff_columns(self, player_key, cases):
+        # One array per payoff variable, ordered like cases (missing cases count as 0)
+        player_data = self.payoff_data.get(player_key, {})
+        if isinstance(player_data, PayoffColumns):
+            indices = np.array([self.cases.label_indices.get(case, -1) for case in cases], dtype=np.intp)
+            known = (indices >= 0) & (indices < player_data.num_cases)
+            values = np.zeros((len(player_data), len(cases)))
+            values[:, known] = player_data.values[:, indices[known]]
+            return dict(zip(player_data.names, values))
+        columns = {}
+        for var_name, var_data in player_data.items():
+            columns[var_name] = np.array([var_data.get(case, 0) for case in cases], dtype=float)
+        return columns
 
     def payoff(self, case):
-        # Helper to sanitize variable names (replace spaces with underscores, lower case)
-        def sanitize(name):
-            return name.strip().lower().replace(" ", "_")
-
-        # Helper to evaluate payoff for a player
-        def evaluate_payoff(player_key, function_str):
-            if not function_str:
-                # Default: Summation of all variables
-                total = 0
-                if player_key in self.payoff_data:
-                    for var_data in self.payoff_data[player_key].values():
-                        total += var_data.get(case, 0)
-                return total
-            
-            # Sanitize input: remove leading/trailing whitespace and lower case
-            function_str = function_str.strip().lower()
-            
-            # Smart Sanitization: Replace spaces between words with underscores
-            # This regex looks for a space that is preceded by a word char and followed by a word char
-            # e.g. "national wealth" -> "national_wealth"
-            # But "wealth + tax" -> "wealth + tax" (because + is not a word char)
-            function_str = re.sub(r'(?<=[a-z0-9])\s+(?=[a-z0-9])', '_', function_str)
-            
-            try:
-                # 1. Prepare symbol values for this case
-                symbol_values = {}
-                if player_key in self.payoff_data:
-                    for var_name, var_data in self.payoff_data[player_key].items():
-                        sanitized_name = sanitize(var_name)
-                        symbol_values[sanitized_name] = var_data.get(case, 0)
-                
-                # 2. Parse the expression
-                expr = sympy.sympify(function_str)
-                
-                # 3. VALIDATION: Check for undefined variables
-                free_symbols = expr.free_symbols
-                defined_vars = set(symbol_values.keys())
-                
-                undefined_vars = []
-                for sym in free_symbols:
-                    sym_name = str(sym)
-                    if sym_name not in defined_vars:
-                        undefined_vars.append(sym_name)
-                
-                if undefined_vars:
-                    raise ValueError(f"Undefined variables in payoff function for {player_key}: {', '.join(undefined_vars)}")
-                
-                # 4. Substitute values
-                result = expr.subs(symbol_values)
-                
-                return result
-            except Exception as e:
-                # Propagate the error so it can be shown to the user
-                raise e
+        p1_payoffs, p2_payoffs = self.payoff_table([case])
+        return (p1_payoffs[0].item(), p2_payoffs[0].item())
 
-        p1_payoff = evaluate_payoff('p1', self.p1_function)
-        p2_payoff = evaluate_payoff('p2', self.p2_function)
-                
-        return (p1_payoff, p2_payoff)
+    def case_labels(self):
+        # Case label of every (nature, p1, p2) action profile, in itertools.product order
+        return [self.cases.labels[index] for index in self.cases.index_table.ravel()]
+
+    def case_payoff_columns(self, player_key):
+        # One array per payoff variable indexed by case index
+        # (labels outside the game are ignored, missing cases count as 0)
+        player_data = self.payoff_data.get(player_key, {})
+        if isinstance(player_data, PayoffColumns):
+            # Already indexed by case
+            if player_data.names and player_data.num_cases != self.cases.num_cases:
+                raise ValueError(f"Payoff columns for {player_key} have {player_data.num_cases} cases, "
+                                 f"the game has {self.cases.num_cases}")
+            return dict(zip(player_data.names, np.array(player_data.values)))
+        columns = {}
+        for var_name, var_data in player_data.items():
+            column = np.zeros(self.cases.num_cases)
+            for label, value in var_data.items():
+                index = self.cases.label_indices.get(label)
+                if index is not None:
+                    column[index] = value
+            columns[var_name] = column
+        return columns
+
+    @timed('payoff_tensor')
+    def payoff_tensor_function(self):
+        compiled = self.compile_payoff_functions()
+        num_cases = self.cases.num_cases
+        p1_payoffs = compiled['p1'].evaluate(self.case_payoff_columns('p1'), num_cases)
+        p2_payoffs = compiled['p2'].evaluate(self.case_payoff_columns('p2'), num_cases)
+        
+        index_table = self.cases.index_table
+        return np.stack([p1_payoffs[index_table], p2_payoffs[index_table]], axis=-1)
 
+    @timed('strategies_space')
     def strategies_space_function(self):
-        list_of_strategies_dict = []
-        list_of_strategies = list(itertools.product(self.nature.strategies, self.player1.strategies, self.player2.strategies))
-        # Pass full player objects to CaseBuilder
-        cases = CaseBuilder(list_of_strategies, self.nature, self.player1, self.player2)
-        
-
-        for items in list_of_strategies:
-            cases.case_definition(items)
-            dict_of_strategies = {}
-            dict_of_strategies[self.nature.name] = items[0]
-            dict_of_strategies[self.player1.name] = items[1]
-            dict_of_strategies[self.player2.name] = items[2]
-            dict_of_strategies['case'] = cases.case
-            dict_of_strategies['payoff'] = self.payoff(cases.case)
-            list_of_strategies_dict.append(dict_of_strategies)
-        return list_of_strategies_dict
+        names = (self.nature.name, self.player1.name, self.player2.name)
+        case_list = self.case_labels()
+        payoffs = self.payoff_tensor.reshape(-1, 2).tolist()
+        
+        list_of_strategies = []
+        for idx, (n_idx, p1_idx, p2_idx) in enumerate(np.ndindex(*self.payoff_tensor.shape[:3])):
+            actions = (self.nature.strategies[n_idx], self.player1.strategies[p1_idx], self.player2.strategies[p2_idx])
+            list_of_strategies.append(CaseRecord(names, actions, case_list[idx], tuple(payoffs[idx])))
+        return list_of_strategies
 
     def generate_pure_strategies(self):
         # Player 1 strategies (conditional on Nature)
-        # Nature has 2 strategies: stable, unstable
-        # P1 has 2 strategies: intervene, not intervene
         # P1 pure strategy is a map: Nature State -> P1 Action
-        p1_actions = self.player1.strategies
-        nature_states = self.nature.strategies
-        
-        # Generate all mappings from Nature to P1
-        # There are len(p1_actions) ** len(nature_states) = 2^2 = 4 strategies
-        p1_pure_strategies = []
-        for action_combo in itertools.product(p1_actions, repeat=len(nature_states)):
-            strategy = {state: action for state, action in zip(nature_states, action_combo)}
-            p1_pure_strategies.append(strategy)
-            
+        # There are len(p1_actions) ** len(nature_states) strategies
+        #
         # Player 2 strategies (conditional on Player 1)
-        # P1 has 2 actions: intervene, not intervene
-        # P2 has 2 actions: relocate, not relocate
-        # P2 pure strategy is a map: P1 Action -> P2 Action
-        p2_actions = self.player2.strategies
-        p1_possible_actions = self.player1.strategies # The actions P1 can take, which P2 observes
-        
-        # Generate all mappings from P1 Action to P2 Action
-        # There are len(p2_actions) ** len(p1_possible_actions) = 2^2 = 4 strategies
-        p2_pure_strategies = []
-        for action_combo in itertools.product(p2_actions, repeat=len(p1_possible_actions)):
-            strategy = {p1_action: p2_action for p1_action, p2_action in zip(p1_possible_actions, action_combo)}
-            p2_pure_strategies.append(strategy)
-            
+        # P2 pure strategy is a map: P1 Action -> P2 Action (P2 observes P1's action)
+        # There are len(p2_actions) ** len(p1_actions) strategies
+        #
+        # Both are lazy PureStrategySpace objects: nothing is enumerated here
         return {
-            self.player1.name: p1_pure_strategies,
-            self.player2.name: p2_pure_strategies
+            self.player1.name: PureStrategySpace(self.nature.strategies, self.player1.strategies),
+            self.player2.name: PureStrategySpace(self.player1.strategies, self.player2.strategies)
         }
 
+    def generate_pure_strategy_indices(self):
+        # Same enumeration as generate_pure_strategies, as integer index arrays:
+        # P1: (num_p1_strategies, num_nature_states) of P1 action indices
+        # P2: (num_p2_strategies, num_p1_actions) of P2 action indices
+        return {name: space.index_array() for name, space in self.pure_strategies.items()}
+
+    @timed('subgame_perfect')
+    def solve_subgame_perfect(self, tolerance=1e-9):
+        # Backward induction over the game tree, as a piecewise function of ro.
+        # The firm observes the regulator's action but not nature, so each firm
+        # node is an information set: for a regulator policy (state -> action)
+        # the firm best-responds at every on-path set with the ro-weighted
+        # posterior, and off-path it plays a best response to some belief
+        # that keeps the regulator from deviating. The regulator's policy must
+        # be optimal in every state given those responses. Firm pure strategies
+        # are never enumerated. When several equilibria exist on a piece the
+        # one preferred by the regulator is returned. The cost is polynomial
+        # in the action counts but steep (see SUBGAME_PERFECT_MAX_WORK, beyond
+        # which a ValueError is raised).
+        # Returns [{'ro_range': (lo, hi), regulator: policy, firm: responses,
+        #           'payoffs': {name: (const, ro_slope)}}, ...] covering [0, 1]
+        # Assume 2 nature states, as in StrategicForm (state_1 has probability ro)
+        firm_payoffs = self.payoff_tensor[:2, :, :, 0]
+        regulator_payoffs = self.payoff_tensor[:2, :, :, 1]
+        num_p1 = len(self.player1.strategies)
+        num_p2 = len(self.player2.strategies)
+        policies = PureStrategySpace(self.nature.strategies[:2], self.player1.strategies)
+        # Even a single piece checks every policy against every deviation
+        # (see SUBGAME_PERFECT_MAX_WORK); refuse before enumerating them
+        self.check_subgame_perfect_work(len(policies) * num_p1 * num_p2)
+        policy_rows = policies.index_array().astype(np.intp)
+        
+        def firm_lines(policy, a1):
+            # Firm's payoff at information set a1 as (const, slope) arrays over
+            # its actions, weighted by the states in which the policy plays a1
+            const = np.zeros(num_p2)
+            slope = np.zeros(num_p2)
+            states = [s for s in (0, 1) if policy[s] == a1]
+            if 0 in states:
+                const = const + firm_payoffs[0, a1]
+                slope = slope - firm_payoffs[0, a1]
+            if 1 in states:
+                slope = slope + firm_payoffs[1, a1]
+            return const, slope
+        
+        def roots(const, slope, lo, hi):
+            # ro where pairs of lines cross, strictly inside (lo, hi)
+            found = []
+            for a, b in itertools.combinations(range(len(const)), 2):
+                d_slope = slope[a] - slope[b]
+                if abs(d_slope) > tolerance:
+                    point = (const[b] - const[a]) / d_slope
+                    if lo + tolerance < point < hi - tolerance:
+                        found.append(point)
+            return found
+        
+        def argmax_set(values):
+            return np.flatnonzero(values >= values.max() - tolerance)
+        
+        # Off-path candidates: firm actions that are a best response to some belief
+        # (depends only on the information set, not on ro)
+        off_path_candidates = []
+        for a1 in range(num_p1):
+            const = firm_payoffs[0, a1]
+            slope = firm_payoffs[1, a1] - firm_payoffs[0, a1]
+            candidates = set()
+            for belief in [0.0, 1.0] + roots(const, slope, 0.0, 1.0):
+                candidates.update(argmax_set(const + slope * belief).tolist())
+            off_path_candidates.append(sorted(candidates))
+        # Regulator's (state 0, state 1) payoffs for each off-path candidate,
+        # +inf elsewhere, so deterrence is checked for all sets at once
+        is_candidate = np.zeros((num_p1, num_p2), dtype=bool)
+        for a1, candidates in enumerate(off_path_candidates):
+            is_candidate[a1, candidates] = True
+        deterrent_payoffs = np.where(is_candidate[:, :, None], np.moveaxis(regulator_payoffs, 0, -1), np.inf)
+        
+        steps = 0
+        
+        def equilibria_at(ro):
+            # Every (policy, firm response) pair that is an equilibrium at ro
+            nonlocal steps
+            found = []
+            for policy in policy_rows:
+                on_path = sorted(set(policy.tolist()))
+                choices = []
+                for a1 in on_path:
+                    const, slope = firm_lines(policy, a1)
+                    choices.append(argmax_set(const + slope * ro).tolist())
+                # Tied on-path responses are each tried, so count them as they come
+                steps += int(np.prod([len(c) for c in choices])) * num_p1 * num_p2
+                self.check_subgame_perfect_work(steps)
+                
+                off_path = np.ones(num_p1, dtype=bool)
+                off_path[on_path] = False
+                for on_path_response in itertools.product(*choices):
+                    on_path_choice = dict(zip(on_path, on_path_response))
+                    # Equilibrium payoff of the regulator in each state
+                    value = np.array([regulator_payoffs[s, policy[s], on_path_choice[policy[s]]] for s in (0, 1)])
+                    
+                    # Off-path: the first candidate that deters the deviation
+                    deters = np.all(deterrent_payoffs <= value + tolerance, axis=2)
+                    if not deters[off_path].any(axis=1).all():
+                        continue
+                    response = np.argmax(deters, axis=1)
+                    response[on_path] = on_path_response
+                    
+                    # The regulator's policy must be optimal in every state
+                    if all(regulator_payoffs[s, np.arange(num_p1), response].max() <= value[s] + tolerance for s in (0, 1)):
+                        found.append((policy, response.tolist()))
+            return found
+        
+        def expected_line(payoffs, policy, response):
+            value_0 = payoffs[0, policy[0], response[policy[0]]]
+            value_1 = payoffs[1, policy[1], response[policy[1]]]
+            return (float(value_0), float(value_1 - value_0))
+        
+        # Breakpoints: where the firm's on-path best response can change
+        breakpoints = set()
+        for policy in policy_rows:
+            for a1 in set(policy.tolist()):
+                breakpoints.update(roots(*firm_lines(policy, a1), 0.0, 1.0))
+        edges = [0.0] + sorted(breakpoints) + [1.0]
+        # Lower bound on the work, ignoring ties
+        self.check_subgame_perfect_work((len(edges) - 1) * len(policy_rows) * num_p1 * num_p2)
+        
+        pieces = []
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            found = equilibria_at((lo + hi) / 2)
+            if not found:
+                pieces.append({'ro_range': (lo, hi), 'equilibrium': None})
+                continue
+            
+            # Regulator-preferred equilibrium, which may switch inside the segment
+            lines = [expected_line(regulator_payoffs, policy, response) for policy, response in found]
+            const = np.array([line[0] for line in lines])
+            slope = np.array([line[1] for line in lines])
+            # Equilibria with the same payoff line cross nowhere; with ties
+            # there can be thousands of them, so only distinct lines are paired
+            distinct = np.unique(np.stack([const, slope], axis=1), axis=0)
+            steps += len(distinct) ** 2
+            self.check_subgame_perfect_work(steps)
+            sub_edges = [lo] + sorted(roots(distinct[:, 0], distinct[:, 1], lo, hi)) + [hi]
+            for sub_lo, sub_hi in zip(sub_edges[:-1], sub_edges[1:]):
+                best = int(argmax_set(const + slope * (sub_lo + sub_hi) / 2)[0])
+                pieces.append({'ro_range': (sub_lo, sub_hi), 'equilibrium': found[best]})
+        
+        # Merge consecutive pieces with the same equilibrium
+        merged = []
+        for piece in pieces:
+            if merged and self.same_equilibrium(merged[-1]['equilibrium'], piece['equilibrium']):
+                merged[-1]['ro_range'] = (merged[-1]['ro_range'][0], piece['ro_range'][1])
+            else:
+                merged.append(piece)
+        
+        results = []
+        for piece in merged:
+            result = {'ro_range': piece['ro_range']}
+            if piece['equilibrium'] is None:
+                result[self.player1.name] = None
+                result[self.player2.name] = None
+                result['payoffs'] = None
+            else:
+                policy, response = piece['equilibrium']
+                result[self.player1.name] = {state: self.player1.strategies[a1] for state, a1 in zip(policies.observed, policy)}
+                result[self.player2.name] = {self.player1.strategies[a1]: self.player2.strategies[a2] for a1, a2 in enumerate(response)}
+                result['payoffs'] = {
+                    self.player1.name: expected_line(regulator_payoffs, policy, response),
+                    self.player2.name: expected_line(firm_payoffs, policy, response)
+                }
+            results.append(result)
+        return results
+
+    def check_subgame_perfect_work(self, work):
+        if work > SUBGAME_PERFECT_MAX_WORK:
+            raise ValueError(f"Game too large for backward induction ({len(self.player1.strategies)} regulator and "
+                             f"{len(self.player2.strategies)} firm actions, about {work} steps; the limit is "
+                             f"{SUBGAME_PERFECT_MAX_WORK})")
+
+    @staticmethod
+    def same_equilibrium(first, second):
+        if first is None or second is None:
+            return first is second
+        return first[0].tolist() == second[0].tolist() and list(first[1]) == list(second[1])
+
+
 class CaseBuilder:
-    def __init__(self, strategies_list, nature, player1, player2):
-        self.strategies_list = strategies_list
+    # Cases are numbered with a mixed-radix index over (nature, p1, p2):
+    #   index = p2_idx * (N * A1) + (N - 1 - nature_idx) * A1 + p1_idx
+    # with label 'case{index + 1}'. P2 action is the most significant digit,
+    # then nature (last state first), then P1 action, which reproduces the
+    # original hard-coded labels for two strategies each (case1 = unstable,
+    # first P1 action, first P2 action, ...) and extends them to any count.
+    def __init__(self, nature, player1, player2):
         self.nature = nature
         self.player1 = player1
         self.player2 = player2
         self.case = None
+        
+        self.shape = (len(nature.strategies), len(player1.strategies), len(player2.strategies))
+        self.num_cases = self.shape[0] * self.shape[1] * self.shape[2]
+        
+        # Action name -> index (first occurrence wins, like tuple.index)
+        self.action_indices = [self.index_lookup(nature.strategies), self.index_lookup(player1.strategies), self.index_lookup(player2.strategies)]
+        
+        # Precomputed case index for every (nature_idx, p1_idx, p2_idx)
+        n_idx, p1_idx, p2_idx = np.indices(self.shape)
+        self.index_table = self.case_index(n_idx, p1_idx, p2_idx)
+        
+        self.labels = ['case%d' % (index + 1) for index in range(self.num_cases)]
+        self.label_indices = {label: index for index, label in enumerate(self.labels)}
+
+    @staticmethod
+    def index_lookup(strategies):
+        lookup = {}
+        for idx, name in enumerate(strategies):
+            lookup.setdefault(name, idx)
+        return lookup
+
+    def case_index(self, n_idx, p1_idx, p2_idx):
+        num_nature, num_p1, _ = self.shape
+        return p2_idx * (num_nature * num_p1) + (num_nature - 1 - n_idx) * num_p1 + p1_idx
 
     def case_definition(self, plays):
         # plays[0] is nature state
         # plays[1] is regulator action (P1)
         # plays[2] is firm action (P2)
-        
-        # Find indices to determine the case regardless of strategy names
-        # Nature: Index 0 = Stable, Index 1 = Unstable
-        # P1: Index 0 = Action 1 (e.g. Intervene), Index 1 = Action 2 (e.g. Not Intervene)
-        # P2: Index 0 = Action 1 (e.g. Relocate), Index 1 = Action 2 (e.g. Not Relocate)
-        
         try:
-            n_idx = self.nature.strategies.index(plays[0])
-            p1_idx = self.player1.strategies.index(plays[1])
-            p2_idx = self.player2.strategies.index(plays[2])
-        except ValueError:
+            indices = [lookup[play] for lookup, play in zip(self.action_indices, plays)]
+        except KeyError:
             self.case = None
             return
+        
+        self.case = self.labels[self.case_index(*indices)]
+
+def strategic_payoff_arrays(payoff_tensor, p1_indices, p2_indices):
+    # Coefficient arrays (const, ro slope) per player of the strategic form.
+    # payoff_tensor is (..., nature, p1_action, p2_action, player); any leading
+    # dimensions (e.g. a parameter grid) are kept in front of (p1_strats, p2_strats).
+    #
+    # Assume 2 states for now to map to ro and 1-ro
+    # state_0 (index 0) corresponds to probability (1-ro) (e.g., stable)
+    # state_1 (index 1) corresponds to probability ro (e.g., unstable)
+    def state_payoffs(state):
+        a1 = p1_indices[:, state]           # P1 action per P1 strategy
+        a2 = p2_indices[:, a1].T            # P2 response per (P1 strategy, P2 strategy)
+        return payoff_tensor[..., state, a1[:, None], a2, :]
+    
+    payoff_0 = state_payoffs(0)
+    payoff_1 = state_payoffs(1)
+    
+    # Index 0 is P2 (Firm), Index 1 is P1 (Regulator)
+    # Values are rounded to 2 decimals; slopes are re-rounded so they
+    # stay the exact difference of two rounded payoffs
+    p1_payoff_1 = np.round(payoff_1[..., 1], 2)
+    p1_payoff_0 = np.round(payoff_0[..., 1], 2)
+    
+    # Expected = ro * payoff_1 + (1-ro) * payoff_0
+    # = ro * (payoff_1 - payoff_0) + payoff_0
+    return {
+        'p1_const': p1_payoff_0,
+        'p1_ro': np.round(p1_payoff_1 - p1_payoff_0, 2),
+        'p2_const': np.round(payoff_0[..., 0], 2),
+        'p2_ro': np.round(payoff_1[..., 0] - payoff_0[..., 0], 2)
+    }
+
+
+def linear_bounds(slope_diff, const_diff, axis, tolerance=1e-9):
+    # Interval of ro in [0, 1] with slope_diff*ro + const_diff >= 0 for all
+    # entries along axis. Returns (lo, hi, feasible) without that axis.
+    rising = slope_diff > tolerance
+    falling = slope_diff < -tolerance
+    flat = ~(rising | falling)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        root = -const_diff / np.where(flat, 1.0, slope_diff)
+    lo = np.max(np.where(rising, root, 0.0), axis=axis)
+    hi = np.min(np.where(falling, root, 1.0), axis=axis)
+    feasible = np.all(~flat | (const_diff >= -tolerance), axis=axis)
+    return np.maximum(lo, 0.0), np.minimum(hi, 1.0), feasible
+
+
+def row_player_bounds(p1_ro, p1_const, tolerance=1e-9):
+    # 1. P1 Condition (Row Player): EU_P1(i, j) >= EU_P1(k, j) for all k.
+    # Only cells of the same column are compared, so any subset of columns
+    # can be passed in.
+    return linear_bounds(p1_ro[..., :, None, :] - p1_ro[..., None, :, :],
+                         p1_const[..., :, None, :] - p1_const[..., None, :, :],
+                         axis=-2, tolerance=tolerance)
+
+
+def column_player_bounds(p2_ro, p2_const, tolerance=1e-9):
+    # 2. P2 Condition (Column Player): EU_P2(i, j) >= EU_P2(i, k) for all k.
+    # Only cells of the same row are compared, so any subset of rows can be
+    # passed in.
+    return linear_bounds(p2_ro[..., :, :, None] - p2_ro[..., :, None, :],
+                         p2_const[..., :, :, None] - p2_const[..., :, None, :],
+                         axis=-1, tolerance=tolerance)
+
+
+def combine_bounds(p1_bounds, p2_bounds, tolerance=1e-9):
+    # Intersect both players' intervals into (lo, hi, is_equilibrium);
+    # lo and hi are NaN where the cell is never an equilibrium
+    p1_lo, p1_hi, p1_ok = p1_bounds
+    p2_lo, p2_hi, p2_ok = p2_bounds
+    lo = np.maximum(p1_lo, p2_lo)
+    hi = np.minimum(p1_hi, p2_hi)
+    is_equilibrium = p1_ok & p2_ok & (lo <= hi + tolerance)
+    hi = np.maximum(hi, lo)
+    return np.where(is_equilibrium, lo, np.nan), np.where(is_equilibrium, hi, np.nan), is_equilibrium
+
+
+def equilibrium_intervals(arrays, tolerance=1e-9):
+    # Vectorized floating-point version of the per-cell LinearIntervalSolver:
+    # for every cell (and any leading grid dimensions) the ro interval inside
+    # [0, 1] on which the cell is a pure Nash equilibrium.
+    # Returns (lo, hi, is_equilibrium) arrays shaped like arrays['p1_const'];
+    # lo and hi are NaN where the cell is never an equilibrium.
+    return combine_bounds(row_player_bounds(arrays['p1_ro'], arrays['p1_const'], tolerance),
+                          column_player_bounds(arrays['p2_ro'], arrays['p2_const'], tolerance),
+                          tolerance)
+
+
+def interval_union_length(lo, hi, mask):
+    # Length of the union of the intervals [lo, hi] selected by mask over the
+    # last two axes (cells), for every leading grid point
+    flat_shape = lo.shape[:-2] + (-1,)
+    lo = np.where(mask, lo, np.inf).reshape(flat_shape)
+    hi = np.where(mask, hi, -np.inf).reshape(flat_shape)
+    order = np.argsort(lo, axis=-1)
+    lo = np.take_along_axis(lo, order, axis=-1)
+    hi = np.take_along_axis(hi, order, axis=-1)
+    # Sweep in order of lower bounds, counting only what extends past the
+    # furthest upper bound reached so far
+    reach = np.maximum.accumulate(hi, axis=-1)
+    previous = np.concatenate([np.full(reach.shape[:-1] + (1,), -np.inf), reach[..., :-1]], axis=-1)
+    start = np.maximum(lo, previous)
+    gained = np.where(np.isfinite(lo), np.clip(hi - start, 0.0, None), 0.0)
+    return gained.sum(axis=-1)
+
+
+def draw_samples(rng, spec, size):
+    # size draws from the distribution of an uncertain payoff variable:
+    #   {'distribution': 'uniform', 'low', 'high'}
+    #   {'distribution': 'normal', 'mean', 'std'}
+    #   {'distribution': 'triangular', 'low', 'mode', 'high'}
+    #   {'distribution': 'empirical', 'samples': [...]}  (resampled with replacement)
+    distribution = spec.get('distribution')
+    try:
+        if distribution == 'uniform':
+            return rng.uniform(float(spec['low']), float(spec['high']), size)
+        if distribution == 'normal':
+            return rng.normal(float(spec['mean']), float(spec['std']), size)
+        if distribution == 'triangular':
+            return rng.triangular(float(spec['low']), float(spec['mode']), float(spec['high']), size)
+        if distribution == 'empirical':
+            samples = np.asarray(spec['samples'], dtype=float)
+            if samples.ndim != 1 or not len(samples):
+                raise ValueError("Empirical distribution needs a non-empty list of samples")
+            return rng.choice(samples, size)
+    except KeyError as e:
+        raise ValueError(f"Missing parameter {e} for {distribution} distribution") from None
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+class StrategicMatrix:
+    # Compact strategic form: per-player coefficient arrays of shape
+    # (num_p1_strats, num_p2_strats) with EU = const + ro * slope.
+    # float64 arrays, or object arrays of Fractions when exact (built from the
+    # decimal form of each value, like LinearIntervalSolver). The arrays are
+    # read-only so one instance can be shared between solvers.
+    __slots__ = ('p1_const', 'p1_ro', 'p2_const', 'p2_ro', 'exact')
+    
+    KEYS = ('p1_const', 'p1_ro', 'p2_const', 'p2_ro')
+    
+    def __init__(self, p1_const, p1_ro, p2_const, p2_ro, exact=False):
+        self.exact = exact
+        for key, value in zip(self.KEYS, (p1_const, p1_ro, p2_const, p2_ro)):
+            value = np.asarray(value, dtype=object if exact else float).view()
+            value.flags.writeable = False
+            setattr(self, key, value)
+    
+    @classmethod
+    def from_tensor(cls, payoff_tensor, p1_indices, p2_indices):
+        return cls(**strategic_payoff_arrays(payoff_tensor, p1_indices, p2_indices))
+    
+    @property
+    def shape(self):
+        return self.p1_const.shape
+    
+    @property
+    def nbytes(self):
+        # Array storage only (object arrays count their pointers)
+        return sum(getattr(self, key).nbytes for key in self.KEYS)
+    
+    def arrays(self):
+        return {key: getattr(self, key) for key in self.KEYS}
+    
+    def to_exact(self):
+        if self.exact:
+            return self
+        def fractions(values):
+            return np.array([Fraction(repr(v)) for v in values.ravel().tolist()], dtype=object).reshape(values.shape)
+        return StrategicMatrix(*(fractions(getattr(self, key)) for key in self.KEYS), exact=True)
+    
+    def at(self, ro):
+        # Numeric payoff matrices (A for P1, B for P2) at a fixed ro, or stacked
+        # to (len(ro), num_p1_strats, num_p2_strats) for an array of ro values
+        ro = np.asarray(ro, dtype=float)[..., None, None]
+        return (self.p1_const.astype(float) + ro * self.p1_ro.astype(float),
+                self.p2_const.astype(float) + ro * self.p2_ro.astype(float))
+
+
+def check_cell(solver, arrays, rows, cols, i, j):
+    # (interval, None) with the ro interval on which cell (i, j) is a pure Nash
+    # equilibrium (None if nowhere), or (None, message) if solving fails.
+    # Every condition is linear in ro: a*ro + b >= 0
+    # (lower <= ro <= upper is the solver's starting interval)
+    
+    # 1. P1 Condition (Row Player)
+    # EU_P1(i, j) >= EU_P1(k, j) for all k != i
+    p1_const, p1_ro = arrays['p1_const'], arrays['p1_ro']
+    other_rows = rows[rows != i]
+    bounds = list(zip(p1_ro[i, j] - p1_ro[other_rows, j], p1_const[i, j] - p1_const[other_rows, j]))
+    
+    # 2. P2 Condition (Column Player)
+    # EU_P2(i, j) >= EU_P2(i, k) for all k != j
+    p2_const, p2_ro = arrays['p2_const'], arrays['p2_ro']
+    other_cols = cols[cols != j]
+    bounds.extend(zip(p2_ro[i, j] - p2_ro[i, other_cols], p2_const[i, j] - p2_const[i, other_cols]))
+    
+    # Solve for ro
+    try:
+        return solver.solve(bounds), None
+    except Exception as e:
+        return None, str(e)
+
+
+# Backward induction checks every regulator policy (A1 ** 2 for A1 regulator
+# actions) against the firm's responses on every piece of ro between
+# breakpoints, and there are up to one breakpoint per policy and pair of firm
+# actions, so the work grows like pieces * A1 ** 3 * A2, up to A1 ** 5 * A2 ** 3.
+# Games estimated above this many steps are refused with a ValueError; about
+# 5 million steps take a second. Ties in the firm's payoffs add to the work,
+# since every tied on-path response is tried; those steps are counted as the
+# solve goes, so such a game is stopped once it reaches the limit.
+SUBGAME_PERFECT_MAX_WORK = 20000000
+
+# Parallel Nash search: games with fewer cells than this are solved serially,
+# since starting the worker processes would cost more than it saves
+PARALLEL_MIN_CELLS = 20000
+
+# (solver, arrays, rows, cols) of a parallel Nash search worker process
+_cell_worker = None
+
+
+def init_cell_worker(matrix, rows, cols, exact, lower, upper):
+    # Worker process initializer: the float strategic matrix is sent once per
+    # worker (exact Fractions are rebuilt from it, as in StrategicMatrix.to_exact)
+    global _cell_worker
+    solver = LinearIntervalSolver(exact=exact)
+    solver.lower, solver.upper = solver.number(lower), solver.number(upper)
+    if exact:
+        matrix = matrix.to_exact()
+    _cell_worker = (solver, matrix.arrays(), rows, cols)
+
+
+def solve_cell_rows(chunk):
+    # Worker task: (i, j, interval, error) of every equilibrium or failed cell
+    # in the given rows, in row-major order
+    solver, arrays, rows, cols = _cell_worker
+    outcomes = []
+    for i in chunk:
+        for j in cols:
+            interval, error = check_cell(solver, arrays, rows, cols, i, j)
+            if interval is not None or error is not None:
+                outcomes.append((int(i), int(j), interval, error))
+    return outcomes
 
-        # Mapping based on original logic:
-        # Case 1: Unstable (1), Intervene (0), Relocate (0)
-        if n_idx == 1 and p1_idx == 0 and p2_idx == 0:
-            self.case = 'case1'
-        # Case 2: Unstable (1), Not Intervene (1), Relocate (0)
-        elif n_idx == 1 and p1_idx == 1 and p2_idx == 0:
-            self.case = 'case2'
-        # Case 3: Stable (0), Intervene (0), Relocate (0)
-        elif n_idx == 0 and p1_idx == 0 and p2_idx == 0:
-            self.case = 'case3'
-        # Case 4: Stable (0), Not Intervene (1), Relocate (0)
-        elif n_idx == 0 and p1_idx == 1 and p2_idx == 0:
-            self.case = 'case4'
-        # Case 5: Unstable (1), Intervene (0), Not Relocate (1)
-        elif n_idx == 1 and p1_idx == 0 and p2_idx == 1:
-            self.case = 'case5'
-        # Case 6: Unstable (1), Not Intervene (1), Not Relocate (1)
-        elif n_idx == 1 and p1_idx == 1 and p2_idx == 1:
-            self.case = 'case6'
-        # Case 7: Stable (0), Intervene (0), Not Relocate (1)
-        elif n_idx == 0 and p1_idx == 0 and p2_idx == 1:
-            self.case = 'case7'
-        # Case 8: Stable (0), Not Intervene (1), Not Relocate (1)
-        elif n_idx == 0 and p1_idx == 1 and p2_idx == 1:
-            self.case = 'case8'
-        else:
-            self.case = None
 
 class StrategicForm:
-    def __init__(self, extensive_form):
+    def __init__(self, extensive_form, matrix=None):
+        # matrix: an already built StrategicMatrix of this game (e.g. loaded
+        # from a game store), used instead of rebuilding it
         self.extensive_form = extensive_form
         self.strategic_form = []
         self.pure_strategies = extensive_form.pure_strategies
+        self.elimination = None
+        # StrategicMatrix per exactness, built on first use
+        self._matrices = {} if matrix is None else {matrix.exact: matrix}
+
+    def strategic_matrix(self, exact=False):
+        # The strategic form, computed once per game and shared read-only
+        matrix = self._matrices.get(exact)
+        if matrix is None:
+            if exact:
+                matrix = self.strategic_matrix().to_exact()
+            else:
+                with stage('strategic_arrays'):
+                    matrix = StrategicMatrix.from_tensor(
+                        self.extensive_form.payoff_tensor,
+                        self.extensive_form.pure_strategy_indices[self.extensive_form.player1.name],
+                        self.extensive_form.pure_strategy_indices[self.extensive_form.player2.name]
+                    )
+            self._matrices[exact] = matrix
+        return matrix
+
+    def payoff_arrays(self):
+        # Whole strategic form as read-only coefficient arrays of shape
+        # (num_p1_strats, num_p2_strats): EU = const + ro * slope for each player
+        return self.strategic_matrix().arrays()
+
+    def payoff_matrices(self, ro):
+        # Numeric payoff matrices (A for P1, B for P2) of shape
+        # (num_p1_strats, num_p2_strats) at a fixed ro, or stacked to
+        # (len(ro), num_p1_strats, num_p2_strats) for an array of ro values
+        return self.strategic_matrix().at(ro)
+
+    def batched_payoff_arrays(self, columns, shape):
+        # payoff_arrays() for many variants of the payoff data at once.
+        # columns: {'p1': {var_name: array}, 'p2': {...}} of per-case values
+        # broadcastable to shape = (batch..., num_cases). Returns arrays of
+        # shape (batch..., num_p1_strats, num_p2_strats).
+        extensive_form = self.extensive_form
+        compiled = extensive_form.compile_payoff_functions()
+        p1_payoffs = compiled['p1'].evaluate(columns['p1'], shape)
+        p2_payoffs = compiled['p2'].evaluate(columns['p2'], shape)
+        index_table = extensive_form.cases.index_table
+        payoff_tensor = np.stack([p1_payoffs[..., index_table], p2_payoffs[..., index_table]], axis=-1)
+        
+        return strategic_payoff_arrays(
+            payoff_tensor,
+            extensive_form.pure_strategy_indices[extensive_form.player1.name],
+            extensive_form.pure_strategy_indices[extensive_form.player2.name]
+        )
+
+    def parameter_sweep(self, sweeps, tolerance=1e-9, batch_size=None):
+        # Equilibria over a grid of values of one or two payoff variables,
+        # computed as batched array operations over the grid.
+        # sweeps: [{'player': 'p1', 'variable': 'carbon_tax', 'values': [...],
+        #           'cases': ['case5', ...]}, ...]; the value replaces the
+        # variable in the listed cases (default: every case it is defined for).
+        # The grid is solved batch_size grid points at a time (default: sized
+        # like monte_carlo's batches), so only the results grow with the grid.
+        # Returns a dict of arrays with grid axes first, one per sweep:
+        #   'grids': value arrays, 'lo'/'hi': (grid..., p1_strats, p2_strats)
+        #   ro interval per cell (NaN if not an equilibrium), 'is_equilibrium',
+        #   'count': number of equilibria per grid point (heatmap),
+        #   'coverage': share of [0, 1] covered by some equilibrium per grid point
+        if not 1 <= len(sweeps) <= 2:
+            raise ValueError("A sweep takes one or two payoff variables")
+        
+        extensive_form = self.extensive_form
+        case_builder = extensive_form.cases
+        base_columns = {key: extensive_form.case_payoff_columns(key) for key in ('p1', 'p2')}
+        
+        grids = []
+        plans = []
+        for sweep in sweeps:
+            player_columns = base_columns.get(sweep.get('player'))
+            if (player_columns is None or not isinstance(sweep.get('variable'), str)
+                    or sweep['variable'] not in player_columns):
+                raise ValueError(f"Unknown payoff variable for {sweep.get('player')}: {sweep.get('variable')}")
+            try:
+                grid = np.asarray(sweep['values'], dtype=float)
+            except KeyError:
+                raise ValueError(f"Sweep of {sweep['variable']} needs a 'values' list") from None
+            except (TypeError, ValueError):
+                raise ValueError(f"Sweep values of {sweep['variable']} must be numbers") from None
+            if grid.ndim != 1 or not len(grid) or not np.all(np.isfinite(grid)):
+                raise ValueError(f"Sweep values of {sweep['variable']} must be a non-empty list of finite numbers")
+            cases = sweep.get('cases')
+            if cases is None:
+                cases = list(extensive_form.payoff_data[sweep['player']][sweep['variable']])
+            elif not isinstance(cases, (list, tuple)):
+                raise ValueError(f"Sweep cases of {sweep['variable']} must be a list")
+            indices = np.array([case_builder.label_indices[case] for case in cases if case in case_builder.label_indices],
+                               dtype=np.intp)
+            grids.append(grid)
+            plans.append((sweep['player'], sweep['variable'], indices))
+        
+        grid_shape = tuple(len(grid) for grid in grids)
+        num_points = int(np.prod(grid_shape))
+        shape = self.strategic_matrix().shape
+        if batch_size is None:
+            batch_size = max(1, 2**22 // (shape[0] * shape[1] * max(shape)))
+        lo = np.empty((num_points,) + shape)
+        hi = np.empty((num_points,) + shape)
+        is_equilibrium = np.empty((num_points,) + shape, dtype=bool)
+        
+        for start in range(0, num_points, batch_size):
+            points = np.arange(start, min(start + batch_size, num_points))
+            # Grid value of every sweep at each of these (flat) grid points
+            positions = np.unravel_index(points, grid_shape)
+            batch_shape = (len(points), case_builder.num_cases)
+            columns = {key: dict(player_columns) for key, player_columns in base_columns.items()}
+            for (player, variable, indices), grid, position in zip(plans, grids, positions):
+                column = np.array(np.broadcast_to(columns[player][variable], batch_shape))
+                column[:, indices] = grid[position][:, None]
+                columns[player][variable] = column
+            
+            batch = slice(points[0], points[-1] + 1)
+            lo[batch], hi[batch], is_equilibrium[batch] = equilibrium_intervals(
+                self.batched_payoff_arrays(columns, batch_shape), tolerance)
+        
+        lo = lo.reshape(grid_shape + shape)
+        hi = hi.reshape(grid_shape + shape)
+        is_equilibrium = is_equilibrium.reshape(grid_shape + shape)
+        return {
+            'grids': grids,
+            'lo': lo,
+            'hi': hi,
+            'is_equilibrium': is_equilibrium,
+            'count': is_equilibrium.sum(axis=(-2, -1)),
+            'coverage': interval_union_length(lo, hi, is_equilibrium)
+        }
+
+    def equilibrium_map(self, tolerance=1e-9):
+        # Partition of [0, 1] into ro regions with the same set of pure
+        # equilibria, from one sort of all interval breakpoints.
+        # With sorted breakpoints b_0 = 0 < ... < b_K = 1, the regions are the
+        # points b_k (index 2k) and the open gaps (b_k, b_k+1) (index 2k+1);
+        # the closed interval of every equilibrium cell covers a contiguous run
+        # of region indices, so a single event sweep yields every region's set.
+        # Consecutive regions with equal sets are merged. The reported endpoints
+        # are the exact breakpoints (solved in Fractions for one cell that ends
+        # there, as the exact Nash search does) rounded once to float.
+        # Returns [{'ro_range': (lo, hi), 'lo_closed': bool, 'hi_closed': bool,
+        #           'cells': [(i, j), ...]}, ...] ordered by ro.
+        arrays = self.payoff_arrays()
+        lo, hi, is_equilibrium = equilibrium_intervals(arrays, tolerance)
+        cells = np.argwhere(is_equilibrium)
+        starts = lo[is_equilibrium]
+        ends = hi[is_equilibrium]
+        
+        # Breakpoints closer than tolerance count as one
+        values = np.sort(np.concatenate([[0.0, 1.0], starts, ends]))
+        breakpoints = values[np.concatenate([[True], np.diff(values) > tolerance])]
+        
+        def region(points):
+            # Point region of the breakpoint cluster of each value
+            k = np.searchsorted(breakpoints, points + tolerance, side='right') - 1
+            return 2 * np.clip(k, 0, len(breakpoints) - 1)
+        
+        first = region(starts)
+        last = region(ends)
+        num_regions = 2 * len(breakpoints) - 1
+        
+        # Cell entries (in order of their first region) and exits (after their last)
+        enter_order = np.argsort(first, kind='stable')
+        exit_order = np.argsort(last, kind='stable')
+        active = set()
+        regions = []
+        e_in = e_out = 0
+        for r in range(num_regions):
+            while e_in < len(enter_order) and first[enter_order[e_in]] == r:
+                active.add(int(enter_order[e_in]))
+                e_in += 1
+            members = frozenset(active)
+            if regions and regions[-1][2] == members:
+                regions[-1][1] = r
+            else:
+                regions.append([r, r, members])
+            while e_out < len(exit_order) and last[exit_order[e_out]] == r:
+                active.discard(int(exit_order[e_out]))
+                e_out += 1
+        
+        # Exact value of each inner breakpoint, from the first cell starting or
+        # ending there (kept as float if the exact solve disagrees)
+        solver = LinearIntervalSolver(exact=True)
+        number = solver.number
+        p1_const, p1_ro, p2_const, p2_ro = (arrays[key] for key in ('p1_const', 'p1_ro', 'p2_const', 'p2_ro'))
+        exact_breakpoints = [float(value) for value in breakpoints]
+        exact_breakpoints[0], exact_breakpoints[-1] = 0.0, 1.0
+        pending = set(range(1, len(breakpoints) - 1))
+        for m, (i, j) in enumerate(cells):
+            ends = (first[m] // 2, last[m] // 2)
+            if pending.isdisjoint(ends):
+                continue
+            bounds = [(number(p1_ro[i, j]) - number(p1_ro[k, j]), number(p1_const[i, j]) - number(p1_const[k, j]))
+                      for k in range(p1_ro.shape[0]) if k != i]
+            bounds.extend((number(p2_ro[i, j]) - number(p2_ro[i, k]), number(p2_const[i, j]) - number(p2_const[i, k]))
+                          for k in range(p2_ro.shape[1]) if k != j)
+            interval = solver.solve(bounds)
+            if interval is None:
+                continue
+            for k, value in zip(ends, interval):
+                if k in pending:
+                    exact_breakpoints[k] = float(value)
+                    pending.discard(k)
+            if not pending:
+                break
+        
+        return [{
+            'ro_range': (exact_breakpoints[r0 // 2], exact_breakpoints[(r1 + 1) // 2]),
+            'lo_closed': r0 % 2 == 0,
+            'hi_closed': r1 % 2 == 0,
+            'cells': sorted(tuple(int(v) for v in cells[m]) for m in members)
+        } for r0, r1, members in regions]
+
+    def monte_carlo(self, uncertain, samples=10000, seed=0, batch_size=None, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95),
+                    tolerance=1e-9):
+        # Robustness of the pure equilibria to uncertain payoff variables.
+        # uncertain: [{'player': 'p1', 'variable': 'risk', 'distribution': 'normal',
+        #              'mean': ..., 'std': ..., 'cases': [...], 'combine': 'replace',
+        #              'per_case': False}, ...]
+        # (see draw_samples for the distributions). Each draw replaces the
+        # variable in the listed cases (default: every case it is defined for),
+        # or is added to the point values with 'combine': 'add'; per_case=True
+        # draws every case independently instead of one value for all of them.
+        # All samples are drawn from one seeded generator and solved as batched
+        # array operations, batch_size samples at a time (default: sized so the
+        # pairwise NE conditions stay around 2**22 elements); only the ro
+        # endpoints of equilibrium cells are kept between batches.
+        # Returns arrays of shape (num_p1_strats, num_p2_strats):
+        #   'frequency': share of samples in which the cell is an equilibrium,
+        #   'lo_mean'/'hi_mean', 'lo_min'/'hi_min', 'lo_max'/'hi_max' and
+        #   'lo_quantiles'/'hi_quantiles' (len(quantiles), ...) of the ro
+        #   interval endpoints over those samples (NaN if never an equilibrium),
+        # plus 'samples', 'quantiles' and 'any_equilibrium' (share of samples
+        # with at least one pure equilibrium).
+        extensive_form = self.extensive_form
+        case_builder = extensive_form.cases
+        rng = np.random.default_rng(seed)
+        base_columns = {key: extensive_form.case_payoff_columns(key) for key in ('p1', 'p2')}
+        
+        plans = []
+        for spec in uncertain:
+            player_columns = base_columns.get(spec.get('player'))
+            if player_columns is None or spec.get('variable') not in player_columns:
+                raise ValueError(f"Unknown payoff variable for {spec.get('player')}: {spec.get('variable')}")
+            combine = spec.get('combine', 'replace')
+            if combine not in ('replace', 'add'):
+                raise ValueError(f"Unknown combine: {combine}")
+            cases = spec.get('cases')
+            if cases is None:
+                cases = list(extensive_form.payoff_data[spec['player']][spec['variable']])
+            indices = np.array([case_builder.label_indices[case] for case in cases if case in case_builder.label_indices],
+                               dtype=np.intp)
+            # Fail on bad parameters before any work is done
+            draw_samples(np.random.default_rng(0), spec, 1)
+            plans.append((spec, indices, combine))
+        
+        shape = self.strategic_matrix().shape
+        num_cells = shape[0] * shape[1]
+        if batch_size is None:
+            batch_size = max(1, 2**22 // (num_cells * max(shape)))
+        hits = np.zeros(num_cells, dtype=np.int64)
+        any_equilibrium = 0
+        cell_parts, lo_parts, hi_parts = [], [], []
+        
+        for start in range(0, samples, batch_size):
+            size = min(batch_size, samples - start)
+            columns = {key: dict(player_columns) for key, player_columns in base_columns.items()}
+            for spec, indices, combine in plans:
+                draws = draw_samples(rng, spec, (size, len(indices)) if spec.get('per_case') else (size, 1))
+                column = np.array(np.broadcast_to(columns[spec['player']][spec['variable']], (size, case_builder.num_cases)))
+                if combine == 'add':
+                    column[:, indices] += draws
+                else:
+                    column[:, indices] = draws
+                columns[spec['player']][spec['variable']] = column
+            
+            arrays = self.batched_payoff_arrays(columns, (size, case_builder.num_cases))
+            lo, hi, is_equilibrium = equilibrium_intervals(arrays, tolerance)
+            is_equilibrium = is_equilibrium.reshape(size, num_cells)
+            hits += is_equilibrium.sum(axis=0)
+            any_equilibrium += int(is_equilibrium.any(axis=1).sum())
+            sample_idx, cell_idx = np.nonzero(is_equilibrium)
+            cell_parts.append(cell_idx)
+            lo_parts.append(lo.reshape(size, num_cells)[sample_idx, cell_idx])
+            hi_parts.append(hi.reshape(size, num_cells)[sample_idx, cell_idx])
+        
+        cells = np.concatenate(cell_parts) if cell_parts else np.zeros(0, dtype=np.intp)
+        endpoints = {'lo': np.concatenate(lo_parts) if lo_parts else np.zeros(0),
+                     'hi': np.concatenate(hi_parts) if hi_parts else np.zeros(0)}
+        order = np.argsort(cells, kind='stable')
+        boundaries = np.cumsum(hits)[:-1]
+        
+        result = {
+            'samples': samples,
+            'quantiles': list(quantiles),
+            'frequency': (hits / max(samples, 1)).reshape(shape),
+            'any_equilibrium': any_equilibrium / max(samples, 1)
+        }
+        for name, values in endpoints.items():
+            stats = np.full((3 + len(quantiles), num_cells), np.nan)
+            for cell, group in enumerate(np.split(values[order], boundaries)):
+                if len(group):
+                    stats[0, cell] = group.mean()
+                    stats[1, cell] = group.min()
+                    stats[2, cell] = group.max()
+                    stats[3:, cell] = np.quantile(group, quantiles)
+            result[name + '_mean'] = stats[0].reshape(shape)
+            result[name + '_min'] = stats[1].reshape(shape)
+            result[name + '_max'] = stats[2].reshape(shape)
+            result[name + '_quantiles'] = stats[3:].reshape((len(quantiles),) + shape)
+        return result
 
+    @timed('strategic_form_display')
     def strategic_form_payoff_function(self):
-        ro = sympy.symbols('ro')
-        p1_strats = self.pure_strategies[self.extensive_form.player1.name]
-        p2_strats = self.pure_strategies[self.extensive_form.player2.name]
-        
-        # Retrieve nature states dynamically
-        nature_states = self.extensive_form.nature.strategies
-        # Assume 2 states for now to map to ro and 1-ro
-        # state_0 (index 0) corresponds to probability (1-ro) (e.g., stable)
-        # state_1 (index 1) corresponds to probability ro (e.g., unstable)
-        state_0 = nature_states[0]
-        state_1 = nature_states[1]
-        
-        # Create a lookup for payoffs: (nature, p1, p2) -> payoff
-        payoff_lookup = {}
-        for s in self.extensive_form.strategies_space:
-            key = (s[self.extensive_form.nature.name], s[self.extensive_form.player1.name], s[self.extensive_form.player2.name])
-            payoff_lookup[key] = s['payoff']
+        # Symbolic view of payoff_arrays() for display:
+        # cells are (P1(state_1), P1(state_0), P2(Expected))
+        import sympy
 
+        ro = sympy.symbols('ro')
+        arrays = self.payoff_arrays()
+        
         matrix = []
-        for i, p1_s in enumerate(p1_strats):
+        for p1_const_row, p1_ro_row, p2_const_row, p2_ro_row in zip(
+                arrays['p1_const'].tolist(), arrays['p1_ro'].tolist(),
+                arrays['p2_const'].tolist(), arrays['p2_ro'].tolist()):
             row = []
-            for j, p2_s in enumerate(p2_strats):
-                # Nature State 0 (prob 1-ro)
-                n_0 = state_0
-                a1_0 = p1_s[n_0]
-                a2_0 = p2_s[a1_0]
-                
-                payoff_0 = payoff_lookup.get((n_0, a1_0, a2_0))
-                
-                # Nature State 1 (prob ro)
-                n_1 = state_1
-                a1_1 = p1_s[n_1]
-                a2_1 = p2_s[a1_1]
-                
-                payoff_1 = payoff_lookup.get((n_1, a1_1, a2_1))
-                
-                # Payoffs: (P1(state_1), P1(state_0), P2(Expected))
-                # Index 0 is P2 (Firm), Index 1 is P1 (Regulator)
-                
-                p1_payoff_1 = round(payoff_1[1], 2)
-                p1_payoff_0 = round(payoff_0[1], 2)
-                
-                # Round coefficients for p2_expected_payoff
-                # Expected = ro * payoff_1 + (1-ro) * payoff_0
-                # = ro * payoff_1 + payoff_0 - ro * payoff_0
-                # = ro * (payoff_1 - payoff_0) + payoff_0
-                
-                val_ro_term = payoff_1[0] # Payoff for state 1 (prob ro)
-                val_const_term = payoff_0[0] # Payoff for state 0 (prob 1-ro)
-                
-                val_ro_coeff = round(val_ro_term - val_const_term, 2)
-                val_const = round(val_const_term, 2)
+            for p1_payoff_0, p1_ro, val_const, val_ro_coeff in zip(p1_const_row, p1_ro_row, p2_const_row, p2_ro_row):
+                p1_payoff_1 = round(p1_payoff_0 + p1_ro, 2)
                 
                 if val_ro_coeff == 0:
                     p2_expected_payoff = sympy.Float(val_const, 4)
@@ -265,10 +1314,144 @@ class StrategicForm:
             matrix.append(row)
         return matrix
 
-    def find_nash_equilibria(self):
+    @timed('elimination')
+    def eliminate_dominated_strategies(self, weak=False):
+        # Iterated elimination of pure strategies dominated for every ro in [0, 1].
+        # Expected payoffs are linear in ro, so domination over the whole
+        # interval is domination at both endpoints ro = 0 and ro = 1. For weak
+        # domination that means >= at both endpoints against every opponent
+        # strategy, and > against some opponent strategy at each endpoint, so
+        # that at every ro in [0, 1] some opponent strategy makes it strict.
+        # Strict elimination keeps every Nash equilibrium; weak elimination
+        # (weak=True) may also remove some, depending on the elimination order.
+        # Returns {'rows': remaining P1 strategy indices,
+        #          'cols': remaining P2 strategy indices,
+        #          'eliminated': [{'player', 'index', 'strategy', 'round'}, ...]}
+        arrays = self.payoff_arrays()
+        # Payoffs at ro = 0 and ro = 1 (values are rounded to 2 decimals)
+        p1_values = (arrays['p1_const'], np.round(arrays['p1_const'] + arrays['p1_ro'], 2))
+        # Column player's payoffs transposed so both players compare rows
+        p2_values = (arrays['p2_const'].T, np.round(arrays['p2_const'] + arrays['p2_ro'], 2).T)
+        
+        p1_name = self.extensive_form.player1.name
+        p2_name = self.extensive_form.player2.name
+        
+        rows = np.arange(p1_values[0].shape[0])
+        cols = np.arange(p2_values[0].shape[0])
+        eliminated = []
+        
+        def dominated(values, own, opponent):
+            # Strategies in own dominated by another strategy in own,
+            # against every remaining opponent strategy
+            value_0 = values[0][np.ix_(own, opponent)]
+            value_1 = values[1][np.ix_(own, opponent)]
+            result = []
+            for k in range(len(own)):
+                diff_0 = value_0 - value_0[k]
+                diff_1 = value_1 - value_1[k]
+                if weak:
+                    dominates = (np.all(diff_0 >= 0, axis=1) & np.all(diff_1 >= 0, axis=1)
+                                 & np.any(diff_0 > 0, axis=1) & np.any(diff_1 > 0, axis=1))
+                else:
+                    dominates = np.all(diff_0 > 0, axis=1) & np.all(diff_1 > 0, axis=1)
+                if np.any(dominates):
+                    result.append(own[k])
+            return result
+        
+        elimination_round = 0
+        while True:
+            elimination_round += 1
+            dominated_rows = dominated(p1_values, rows, cols)
+            dominated_cols = dominated(p2_values, cols, rows)
+            if not dominated_rows and not dominated_cols:
+                break
+            
+            for k in dominated_rows:
+                eliminated.append({'player': p1_name, 'index': int(k), 'strategy': self.pure_strategies[p1_name][k], 'round': elimination_round})
+            for k in dominated_cols:
+                eliminated.append({'player': p2_name, 'index': int(k), 'strategy': self.pure_strategies[p2_name][k], 'round': elimination_round})
+            
+            rows = np.setdiff1d(rows, dominated_rows)
+            cols = np.setdiff1d(cols, dominated_cols)
+        
+        return {'rows': rows, 'cols': cols, 'eliminated': eliminated}
+
+    def find_nash_equilibria(self, exact=True, eliminate=False, weak=False, limit=None, ro_interval=None,
+                             best_response_first=False, workers=1, chunk_rows=None):
+        # List form of iter_nash_equilibria, see there for the options
+        return list(self.iter_nash_equilibria(exact=exact, eliminate=eliminate, weak=weak, limit=limit,
+                                              ro_interval=ro_interval, best_response_first=best_response_first,
+                                              workers=workers, chunk_rows=chunk_rows))
+
+    def best_response_order(self, rows, cols, ro_interval=(0, 1)):
+        # Cells of rows x cols ordered so likely equilibria come first: by how
+        # often the cell is a mutual / one-sided pure best response at the
+        # ends and midpoint of ro_interval. Ties keep row-major order.
+        arrays = self.payoff_arrays()
+        lo, hi = (float(v) for v in ro_interval)
+        samples = np.array([lo, (lo + hi) / 2, hi])[:, None, None]
+        sub = np.ix_(rows, cols)
+        p1 = arrays['p1_const'][sub] + samples * arrays['p1_ro'][sub]
+        p2 = arrays['p2_const'][sub] + samples * arrays['p2_ro'][sub]
+        p1_best = p1 >= p1.max(axis=1, keepdims=True) - 1e-9
+        p2_best = p2 >= p2.max(axis=2, keepdims=True) - 1e-9
+        score = (2 * (p1_best & p2_best) + (p1_best | p2_best)).sum(axis=0)
+        order = np.argsort(-score, axis=None, kind='stable')
+        return [(rows[k // len(cols)], cols[k % len(cols)]) for k in order]
+
+    def parallel_cell_outcomes(self, rows, cols, exact, lower, upper, workers=None, chunk_rows=None):
+        # Yields (cells checked, [(i, j, interval, error), ...]) per chunk of
+        # rows, checked on a process pool (workers=None: all cores) and merged
+        # in row-major order as the chunks finish. Closing the generator
+        # cancels the chunks not yet started.
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = workers or os.cpu_count() or 1
+        if chunk_rows is None:
+            # A few chunks per worker so uneven chunks even out
+            chunk_rows = max(1, -(-len(rows) // (4 * workers)))
+        chunks = [rows[k:k + chunk_rows] for k in range(0, len(rows), chunk_rows)]
+        initargs = (self.strategic_matrix(), rows, cols, exact, lower, upper)
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=init_cell_worker,
+                                 initargs=initargs) as executor:
+            futures = [executor.submit(solve_cell_rows, chunk) for chunk in chunks]
+            try:
+                for chunk, future in zip(chunks, futures):
+                    yield len(chunk) * len(cols), future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def iter_nash_equilibria(self, exact=True, eliminate=False, weak=False, limit=None, ro_interval=None,
+                             best_response_first=False, workers=1, chunk_rows=None):
+        # Yields pure Nash equilibria cell by cell.
+        # exact=True reproduces the symbolic ro ranges; exact=False solves the
+        # bounds in floating point, which is cheaper for large matrices.
+        # eliminate=True prunes dominated strategies first (see
+        # eliminate_dominated_strategies); the report is kept in self.elimination.
+        # limit stops after that many equilibria; ro_interval=(lo, hi) restricts
+        # ro to a sub-interval of [0, 1] (ranges are clipped to it; the interval
+        # itself is clipped to [0, 1] and ValueError is raised if it is empty);
+        # best_response_first tests cells in best_response_order instead of
+        # row-major order.
+        # workers != 1 checks chunks of chunk_rows rows on that many processes
+        # (None: all cores), see parallel_cell_outcomes; the equilibria come in
+        # the same order as serially. Games under PARALLEL_MIN_CELLS cells and
+        # best_response_first searches stay serial.
+        import sympy
+
+        # Time spent in here, excluding the consumer's time between yields
+        timings = current_timings()
+        resumed = time.perf_counter() if timings is not None else None
+
         ro = sympy.symbols('ro')
-        matrix = self.strategic_form_payoff_function()
-        equilibria = []
+        lower, upper = ro_interval if ro_interval is not None else (0, 1)
+        lower, upper = max(lower, 0), min(upper, 1)
+        if lower > upper:
+            raise ValueError(f"ro_interval {tuple(ro_interval)} does not overlap [0, 1]")
+        solver = LinearIntervalSolver(exact=exact)
+        solver.lower, solver.upper = solver.number(lower), solver.number(upper)
+        arrays = self.strategic_matrix(exact=exact).arrays()
         
         p1_name = self.extensive_form.player1.name
         p2_name = self.extensive_form.player2.name
@@ -276,75 +1459,62 @@ class StrategicForm:
         p1_strats = self.pure_strategies[p1_name]
         p2_strats = self.pure_strategies[p2_name]
         
-        # Matrix dimensions
-        num_rows = len(matrix)
-        num_cols = len(matrix[0])
+        # Strategies taking part in the search
+        if eliminate:
+            self.elimination = self.eliminate_dominated_strategies(weak=weak)
+            rows, cols = self.elimination['rows'], self.elimination['cols']
+        else:
+            self.elimination = None
+            rows, cols = np.arange(arrays['p1_const'].shape[0]), np.arange(arrays['p1_const'].shape[1])
         
-        for i in range(num_rows):
-            for j in range(num_cols):
-                # Check if cell (i, j) can be a Nash Equilibrium
-                
-                conditions = []
-                # Constraint: 0 <= ro <= 1
-                conditions.append(ro >= 0)
-                conditions.append(ro <= 1)
-                
-                # 1. P1 Condition (Row Player)
-                # EU_P1(i, j) >= EU_P1(k, j) for all k != i
-                # EU_P1 = ro * p1_state1 + (1-ro) * p1_state0
-                # Note: In matrix cell, we stored (p1_payoff_1, p1_payoff_0, p2_expected_payoff)
-                # So index 0 is state 1 (ro weight), index 1 is state 0 ((1-ro) weight)
-                
-                current_cell = matrix[i][j]
-                p1_state1_curr = current_cell[0]
-                p1_state0_curr = current_cell[1]
-                eu_p1_curr = ro * p1_state1_curr + (1-ro) * p1_state0_curr
-                
-                for k in range(num_rows):
-                    if k == i: continue
-                    other_cell = matrix[k][j]
-                    p1_state1_other = other_cell[0]
-                    p1_state0_other = other_cell[1]
-                    eu_p1_other = ro * p1_state1_other + (1-ro) * p1_state0_other
-                    
-                    conditions.append(eu_p1_curr >= eu_p1_other)
-                
-                # 2. P2 Condition (Column Player)
-                # EU_P2(i, j) >= EU_P2(i, k) for all k != j
-                # EU_P2 is already symbolic in matrix[i][j][2]
-                
-                eu_p2_curr = current_cell[2]
-                
-                for k in range(num_cols):
-                    if k == j: continue
-                    other_cell = matrix[i][k]
-                    eu_p2_other = other_cell[2]
-                    
-                    conditions.append(eu_p2_curr >= eu_p2_other)
-                
-                # Solve for ro
-                try:
-                    # reduce_inequalities works well for systems of inequalities
-                    solution = sympy.reduce_inequalities(conditions, ro)
-                    
-                    # Check if solution is not EmptySet (False)
-                    if solution != False:
-                        equilibria.append({
-                            p1_name: p1_strats[i],
-                            p2_name: p2_strats[j],
-                            'ro_range': solution
-                        })
-                except Exception as e:
-                    print(f"Error solving for cell ({i},{j}): {e}")
-                    
-        return equilibria
-
+        if workers != 1 and not best_response_first and len(rows) * len(cols) >= PARALLEL_MIN_CELLS:
+            outcomes = self.parallel_cell_outcomes(rows, cols, exact, lower, upper, workers, chunk_rows)
+        else:
+            if best_response_first:
+                cells = self.best_response_order(rows, cols, (lower, upper))
+            else:
+                cells = ((i, j) for i in rows for j in cols)
+            outcomes = ((1, ((i, j) + check_cell(solver, arrays, rows, cols, i, j),)) for i, j in cells)
+        
+        found = 0
+        solved = 0
+        try:
+            for checked, chunk in outcomes:
+                if limit is not None and found >= limit:
+                    return
+                solved += checked
+                for i, j, interval, error in chunk:
+                    if error is not None:
+                        print(f"Error solving for cell ({i},{j}): {error}")
+                        continue
+                    if interval is None:
+                        continue
+                    found += 1
+                    equilibrium = {
+                        p1_name: p1_strats[i],
+                        p2_name: p2_strats[j],
+                        'ro_range': solver.to_relational(interval, ro)
+                    }
+                    if timings is not None:
+                        timings.add_time('nash_equilibria', time.perf_counter() - resumed)
+                        resumed = None
+                    yield equilibrium
+                    if timings is not None:
+                        resumed = time.perf_counter()
+                    if limit is not None and found >= limit:
+                        return
+        finally:
+            outcomes.close()
+            if timings is not None:
+                if resumed is not None:
+                    timings.add_time('nash_equilibria', time.perf_counter() - resumed)
+                timings.count('cells_solved', solved)
+                timings.count('equilibria_found', found)
 
-nature = Player('nature', ('stable', 'unstable'))
-player1 = Player('regulator', ('intervene', 'not intervene'))
-player2 = Player('trippleB', ('relocate', 'not relocate'))
 
-payoff_data = {
+# Demo game: a regulator deciding whether to intervene and a firm (trippleB)
+# deciding whether to relocate, with nature drawing a stable or unstable state
+DEMO_PAYOFF_DATA = {
     'p1': {
         'revenue_minus_cost': {'case1':75, 'case2':75, 'case3':75, 'case4':75, 'case5':65.66, 'case6':65.66, 'case7':65.66, 'case8':65.66},
         'carbon_tax': {'case1':0, 'case2':0, 'case3':0, 'case4':0, 'case5':-12, 'case6':-12, 'case7':-12, 'case8':-12},
@@ -358,12 +1528,36 @@ payoff_data = {
     }
 }
 
-extensive_form = ExtensiveForm(nature, player1, player2, payoff_data)
-pprint.pprint(extensive_form.strategies_space)
-pure_strategies = extensive_form.generate_pure_strategies()
-pprint.pprint(pure_strategies)
 
-strategic_form = StrategicForm(extensive_form)
-pprint.pprint(strategic_form.strategic_form_payoff_function())
-pprint.pprint(strategic_form.find_nash_equilibria())
+def demo_game():
+    nature = Player('nature', ('stable', 'unstable'))
+    player1 = Player('regulator', ('intervene', 'not intervene'))
+    player2 = Player('trippleB', ('relocate', 'not relocate'))
+    return ExtensiveForm(nature, player1, player2, DEMO_PAYOFF_DATA)
+
+
+def main(argv=None):
+    import argparse
+    import pprint
+
+    parser = argparse.ArgumentParser(description="Solve the trippleB demo game.")
+    parser.add_argument('--method', choices=['nash', 'subgame_perfect'], default='nash',
+                        help="full strategic-form Nash enumeration or backward induction")
+    parser.add_argument('--quiet', action='store_true', help="only print the solution")
+    args = parser.parse_args(argv)
+
+    extensive_form = demo_game()
+    if args.method == 'subgame_perfect':
+        pprint.pprint(extensive_form.solve_subgame_perfect())
+        return
+
+    strategic_form = StrategicForm(extensive_form)
+    if not args.quiet:
+        pprint.pprint([dict(record) for record in extensive_form.strategies_space])
+        pprint.pprint({name: list(space) for name, space in extensive_form.pure_strategies.items()})
+        pprint.pprint(strategic_form.strategic_form_payoff_function())
+    pprint.pprint(strategic_form.find_nash_equilibria())
+
 
+if __name__ == '__main__':
+    main()